@@ -0,0 +1,19 @@
+# ==================================================
+# benchmarks/__init__.py — Benchmarks Package
+# ==================================================
+#
+# Package marker for standalone performance benchmarks.
+#
+# Layer: Tooling
+#
+# Responsibilities:
+# - Measure hot paths (timers, parsing, datasets) in isolation
+# - Run without a Telegram token or network access
+#
+# Usage:
+#   python -m benchmarks.<module>
+#
+# Boundaries:
+# - Benchmarks only import modules; the bot never imports benchmarks.
+#
+# ==================================================
@@ -0,0 +1,96 @@
+# ==================================================
+# benchmarks/bench_dates.py — Date Parsing vs strptime
+# ==================================================
+#
+# Per-call cost of core/dates.py parsers against the `datetime.strptime` code they replace.
+#
+# Before:
+# - `strptime` per value; /timerdate tried up to four formats, each miss raising ValueError.
+#
+# After:
+# - fixed-format parsing in core/dates.py (slicing / one compiled regex, no exceptions).
+#
+# The last row parses every "date" in data/holidays the way `load_static_holidays` does.
+#
+# Usage:
+#   python -m benchmarks.bench_dates
+#
+# ==================================================
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from core.dates import next_occurrence, parse_date, parse_mmdd, parse_mmdd_range
+
+ROUNDS = 50_000
+HOLIDAYS = Path("data/holidays")
+
+_TIMERDATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y")
+
+
+def _strptime_any(text: str) -> date:
+    """What /timerdate used to do: try formats until one does not raise."""
+    for fmt in _TIMERDATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(text)
+
+
+def _strptime_mmdd(text: str) -> datetime:
+    # A leap year keeps "02-29" valid (bare "%m-%d" is deprecated for that reason).
+    return datetime.strptime(f"2000-{text}", "%Y-%m-%d")
+
+
+def _strptime_range(text: str):
+    start, end = text.split(":")
+    return _strptime_mmdd(start), _strptime_mmdd(end)
+
+
+def _time(fn, arg, rounds: int = ROUNDS) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(arg)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def _row(label: str, before: float, after: float) -> None:
+    print(f"{label:28} {before:9.2f} {after:9.2f} {before / after:7.1f}x")
+
+
+def main() -> None:
+    print(f"{'format':28} {'strptime':>9} {'dates':>9} {'speedup':>8}   (µs per call)")
+    _row("YYYY-MM-DD", _time(lambda s: datetime.strptime(s, "%Y-%m-%d"), "2025-12-31"), _time(parse_date, "2025-12-31"))
+    _row("DD.MM.YYYY (2nd format)", _time(_strptime_any, "31.12.2025"), _time(parse_date, "31.12.2025"))
+    _row("MM-DD", _time(_strptime_mmdd, "12-31"), _time(parse_mmdd, "12-31"))
+    _row("MM-DD:MM-DD", _time(_strptime_range, "12-19:01-20"), _time(parse_mmdd_range, "12-19:01-20"))
+
+    values = [
+        entry["date"]
+        for file in sorted(HOLIDAYS.glob("*.json"))
+        for entry in json.loads(file.read_text(encoding="utf-8"))
+        if entry.get("date")
+    ]
+    today = date.today()
+
+    def before(mmdds):
+        for mmdd in mmdds:
+            parsed = datetime.strptime(f"{today.year}-{mmdd}", "%Y-%m-%d").date()
+            if parsed < today:
+                parsed = parsed.replace(year=today.year + 1)
+
+    def after(mmdds):
+        for mmdd in mmdds:
+            next_occurrence(*parse_mmdd(mmdd), today)
+
+    rounds = max(1, ROUNDS // max(1, len(values)))
+    _row(f"holiday files ({len(values)} dates)", _time(before, values, rounds), _time(after, values, rounds))
+
+
+if __name__ == "__main__":
+    main()
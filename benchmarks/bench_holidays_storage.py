@@ -0,0 +1,91 @@
+# ==================================================
+# benchmarks/bench_holidays_storage.py — Holiday Storage: Dicts vs Columns vs Snapshot
+# ==================================================
+#
+# Load time and retained Python heap of the static holiday index at 1x and 10x the
+# size of data/holidays (the 10x set repeats every entry with a numbered name).
+#
+# Rows:
+#   dicts      one Holiday dict per entry (the previous representation)
+#   columns    HolidayTable built from the JSON files (cold start / after an edit)
+#   snapshot   HolidayTable memory-mapped from its snapshot (every other start)
+#
+# Heap is measured with tracemalloc; mapped snapshot pages are file-backed and do
+# not show up there (they are shared with the page cache and read on demand).
+#
+# Usage:
+#   python -m benchmarks.bench_holidays_storage
+#
+# ==================================================
+
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from services.holidays_service import HOLIDAYS_PATH, load_holiday_index, read_static_holidays
+
+SCALES = (1, 10)
+QUERY_ROUNDS = 2_000
+
+
+def _write_dataset(root: Path, scale: int) -> Path:
+    folder = root / f"x{scale}"
+    folder.mkdir()
+    for file in sorted(HOLIDAYS_PATH.glob("*.json")):
+        entries = json.loads(file.read_text(encoding="utf-8"))
+        scaled = [dict(e, name=f"{e['name']} #{k}" if k else e["name"]) for k in range(scale) for e in entries]
+        (folder / file.name).write_text(json.dumps(scaled, ensure_ascii=False), encoding="utf-8")
+    return folder
+
+
+def _measure(fn):
+    """(result, seconds, retained heap bytes)."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+
+def _row(label: str, rows: int, seconds: float, retained: int) -> None:
+    print(f"{label:18} {rows:7} {seconds * 1000:9.2f} {retained / 1024:11.1f}")
+
+
+def main() -> None:
+    today = date.today()
+    print(f"{'storage':18} {'rows':>7} {'load ms':>9} {'heap KiB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for scale in SCALES:
+            folder = _write_dataset(root, scale)
+            snapshot = root / f"x{scale}.idx"
+
+            entries, seconds, retained = _measure(lambda: read_static_holidays(folder))
+            _row(f"dicts x{scale}", len(entries), seconds, retained)
+            del entries
+
+            index, seconds, retained = _measure(lambda: load_holiday_index(folder, snapshot))
+            _row(f"columns x{scale}", len(index), seconds, retained)
+            del index
+
+            index, seconds, retained = _measure(lambda: load_holiday_index(folder, snapshot))
+            _row(f"snapshot x{scale}", len(index), seconds, retained)
+
+            started = time.perf_counter()
+            for _ in range(QUERY_ROUNDS):
+                index.on(today)
+                for _, (day, _) in zip(range(10), index.iter_from(today)):
+                    pass
+            per_query = (time.perf_counter() - started) / QUERY_ROUNDS * 1e6
+            print(f"{'':18} today + next 10: {per_query:.1f} µs, snapshot {snapshot.stat().st_size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
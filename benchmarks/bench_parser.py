@@ -0,0 +1,123 @@
+# ==================================================
+# benchmarks/bench_parser.py — Command Parser Cost + Fuzzing
+# ==================================================
+#
+# Per-command parse cost of services/parser.py, plus a mutation fuzzer over the seed
+# corpus in benchmarks/data/parser_corpus.txt.
+#
+# Fuzzing:
+# - Every corpus line and FUZZ_CASES random mutations of them (character edits,
+#   token shuffles/duplicates, flag and unicode insertions) are parsed.
+# - The only acceptable failure is ValueError (what the commands turn into a usage
+#   hint); any other exception is reported with the input that caused it.
+# - Successful parses are checked for basic invariants (positive bounded duration,
+#   aware UTC target, no flags left in the message).
+#
+# Usage:
+#   python -m benchmarks.bench_parser
+#
+# ==================================================
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta, timezone
+from pathlib import Path
+
+from services.parser import MAX_DURATION_SECONDS, parse_timer_args, parse_timerdate
+
+CORPUS = Path(__file__).parent / "data" / "parser_corpus.txt"
+ROUNDS = 20_000
+FUZZ_CASES = 50_000
+
+_TZ = timezone(timedelta(hours=4))
+_NOISE = ["--pin", "--board", "10m", "+3", "UTC", "23:59", "2025-12-31", "31.12.2025", "31.12.9999", "🎆", "ß", "٣", "\n", "  "]
+
+
+def _corpus() -> list[str]:
+    lines = CORPUS.read_text(encoding="utf-8").splitlines()
+    return [line for line in lines if line.strip() and not line.startswith("#")]
+
+
+def _parse(text: str):
+    if text.startswith("/timerdate"):
+        return parse_timerdate(text, assume_tz=_TZ)
+    return parse_timer_args(text)
+
+
+def _check(text: str, parsed) -> None:
+    assert "--pin" not in parsed.message.split(), text
+    assert "--board" not in parsed.message.split(), text
+    if hasattr(parsed, "seconds"):
+        assert 0 < parsed.seconds <= MAX_DURATION_SECONDS, text
+    else:
+        assert parsed.target.tzinfo is timezone.utc, text
+
+
+def _mutate(rng: random.Random, text: str) -> str:
+    op = rng.randrange(5)
+    if op == 0 and text:
+        i = rng.randrange(len(text))
+        return text[:i] + text[i + 1:]
+    if op == 1:
+        i = rng.randrange(len(text) + 1)
+        return text[:i] + chr(rng.randrange(32, 0x2000)) + text[i:]
+    tokens = text.split(" ")
+    if op == 2:
+        head, rest = tokens[:1], tokens[1:]
+        rng.shuffle(rest)
+        return " ".join(head + rest)
+    if op == 3 and len(tokens) > 1:
+        i = rng.randrange(1, len(tokens))
+        tokens.insert(i, tokens[i])
+        return " ".join(tokens)
+    tokens.insert(rng.randrange(1, len(tokens) + 1), rng.choice(_NOISE))
+    return " ".join(tokens)
+
+
+def fuzz(corpus: list[str]) -> int:
+    """Parse the corpus and its mutations; return the number of unexpected failures."""
+    rng = random.Random(19)
+    cases = list(corpus)
+    for _ in range(FUZZ_CASES):
+        text = rng.choice(cases)
+        for _ in range(rng.randrange(1, 4)):
+            text = _mutate(rng, text)
+        cases.append(text)
+
+    failures = 0
+    for text in cases:
+        try:
+            _check(text, _parse(text))
+        except ValueError:
+            continue
+        except Exception as e:
+            failures += 1
+            if failures <= 10:
+                print(f"  {type(e).__name__}: {e!r} for {text!r}")
+    print(f"fuzz:     {len(cases)} inputs, {failures} unexpected failures")
+    return failures
+
+
+def bench(corpus: list[str]) -> None:
+    print(f"{'command':52} {'µs/parse':>9}")
+    for text in corpus:
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            try:
+                _parse(text)
+            except ValueError:
+                pass
+        elapsed = time.perf_counter() - started
+        print(f"{text[:52]:52} {elapsed / ROUNDS * 1e6:9.2f}")
+
+
+def main() -> None:
+    corpus = _corpus()
+    bench(corpus)
+    fuzz(corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# ==================================================
+# benchmarks/bench_timer_memory.py — TimerEntry Memory Footprint
+# ==================================================
+#
+# Reports bytes per timer for the slotted TimerEntry (core/models.py) against
+# the previous dataclass layout, at 10k and 100k live timers.
+#
+# What is counted (tracemalloc):
+# - the entry object itself plus everything it owns
+#   (target datetime / int, uid, cached job name, last rendered text or its hash)
+# - a typical label ("Boss pull") shared by all entries is excluded
+#
+# Usage:
+#   python -m benchmarks.bench_timer_memory
+#
+# ==================================================
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from core.models import TimerEntry
+
+LABEL = "Boss pull"
+
+
+@dataclass
+class LegacyTimerEntry:
+    """Replica of the pre-slots TimerEntry dataclass (for comparison only)."""
+
+    chat_id: int
+    message_id: int | None
+    target_time: datetime
+    message: str | None = None
+    pin_message_id: int | None = None
+    last_text: str | None = None
+    _uid: str = ""
+
+    def __post_init__(self) -> None:
+        if not self._uid:
+            self._uid = uuid.uuid4().hex[:8]
+
+
+def _rendered(i: int) -> str:
+    return f"⏰ Time left: {i % 24}h {i % 60:02d}m {i % 60:02d}s\n{LABEL}"
+
+
+def _legacy(n: int) -> list:
+    base = datetime.now(timezone.utc)
+    return [
+        LegacyTimerEntry(
+            chat_id=-1001234567890,
+            message_id=100_000 + i,
+            target_time=base + timedelta(seconds=i),
+            message=LABEL,
+            last_text=_rendered(i),
+        )
+        for i in range(n)
+    ]
+
+
+def _slotted(n: int) -> list:
+    base = int(time.time())
+    out = []
+    for i in range(n):
+        e = TimerEntry(-1001234567890, 100_000 + i, message=LABEL, target_ts=base + i)
+        e.last_hash = hash(_rendered(i))
+        out.append(e)
+    return out
+
+
+def _bytes_per_item(factory, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = factory(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / n
+
+
+def main() -> None:
+    for n in (10_000, 100_000):
+        legacy = _bytes_per_item(_legacy, n)
+        slotted = _bytes_per_item(_slotted, n)
+        print(
+            f"{n:>7} timers: legacy {legacy:7.1f} B/timer, "
+            f"slotted {slotted:7.1f} B/timer ({legacy / slotted:.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# ==================================================
+# benchmarks/bench_timer_rehydrate.py — Timer Rehydration Startup Cost
+# ==================================================
+#
+# Measures how long startup takes to restore persisted timers from SQLite
+# (core/timers_db.py): bulk load + store indexing + engine scheduling.
+#
+# Target: < 1 s for 10k stored timers.
+#
+# Usage:
+#   python -m benchmarks.bench_timer_rehydrate [count]
+#
+# ==================================================
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from core.models import TimerEntry
+from core.timer_engine import TickEngine
+from core.timers_db import TimerDB, rehydrate_timers
+from core.timers_store import TimerStore
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    now = datetime.now(timezone.utc)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "timers.sqlite3")
+
+        db = TimerDB(path)
+        db.save_many(
+            TimerEntry(
+                chat_id=-1000 - i % 300,
+                message_id=i,
+                # ~5% already expired, the rest spread over the next days
+                target_time=now + timedelta(seconds=(i * 37) % 500_000 - 20_000),
+                message=f"timer #{i}",
+            )
+            for i in range(count)
+        )
+        db.close()
+
+        started = time.perf_counter()
+        db = TimerDB(path)
+        store, engine = TimerStore(), TickEngine()
+        active, expired = rehydrate_timers(db, store, engine)
+        elapsed = time.perf_counter() - started
+        db.close()
+
+    print(f"restored {active + expired} timers ({expired} expired) in {elapsed * 1e3:.1f} ms")
+    print("OK" if elapsed < 1.0 else "SLOW: startup budget is 1 s")
+
+
+if __name__ == "__main__":
+    main()
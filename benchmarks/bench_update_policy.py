@@ -0,0 +1,77 @@
+# ==================================================
+# benchmarks/bench_update_policy.py — Countdown Edit Budget
+# ==================================================
+#
+# Planned countdown edit rates with and without the budget-driven update policy.
+#
+# Before:
+# - every timer uses the fixed step function (core/formatter.choose_update_interval).
+#
+# After:
+# - intervals come from core/update_policy.UpdatePolicy (global + per-chat budgets).
+#
+# Reports the global edit rate, the busiest group's edit rate (edits/min)
+# and the cost of one recompute.
+#
+# Usage:
+#   python -m benchmarks.bench_update_policy
+#
+# ==================================================
+
+from __future__ import annotations
+
+import random
+import time
+from collections import defaultdict
+
+from core.formatter import choose_update_interval
+from core.models import TimerEntry
+from core.update_policy import GLOBAL_BUDGET, GROUP_BUDGET, UpdatePolicy
+
+TIMERS = 10_000
+CHATS = 300
+
+
+def _entries(n: int, now: float) -> list[TimerEntry]:
+    rng = random.Random(7)
+    return [
+        TimerEntry(
+            chat_id=-100 - rng.randrange(CHATS),
+            message_id=i,
+            target_ts=int(now + rng.choice((30, 300, 1800, 7200, 86400)) * rng.random() + 5),
+        )
+        for i in range(n)
+    ]
+
+
+def _rates(entries: list[TimerEntry], interval_of) -> tuple[float, float]:
+    """(global edits/s, busiest chat edits/min)."""
+    per_chat: dict[int, float] = defaultdict(float)
+    for e in entries:
+        per_chat[e.chat_id] += 1.0 / interval_of(e)
+    return sum(per_chat.values()), max(per_chat.values()) * 60
+
+
+def main() -> None:
+    now = time.time()
+    entries = _entries(TIMERS, now)
+
+    def remaining(e: TimerEntry) -> int:
+        return int(e.target_ts - now)
+
+    total, busiest = _rates(entries, lambda e: choose_update_interval(remaining(e)))
+    print(f"step function:  {total:8.1f} edits/s, busiest group {busiest:7.1f} edits/min")
+
+    policy = UpdatePolicy()
+    started = time.perf_counter()
+    policy.recompute(entries, now)
+    elapsed = time.perf_counter() - started
+
+    total, busiest = _rates(entries, lambda e: policy.interval(e, remaining(e)))
+    print(f"update policy:  {total:8.1f} edits/s, busiest group {busiest:7.1f} edits/min")
+    print(f"budgets:        {GLOBAL_BUDGET:8.1f} edits/s, per group     {GROUP_BUDGET * 60:7.1f} edits/min")
+    print(f"recompute:      {elapsed * 1e3:8.1f} ms for {TIMERS} timers")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,10 @@
 # Layer: Root
 #
 # Responsibilities:
-# - Load configuration and datasets (quotes, Ban'Lu quotes)
+# - Load configuration and datasets (quotes, holidays, ...; hot-reloaded, see core/datasets.py)
+# - Restore persisted timers before the countdown driver starts
 # - Register command and callback handlers with proper chat-type filters
-# - Schedule daily jobs via JobQueue
+# - Schedule daily jobs and the countdown driver via JobQueue
 # - Provide a single global error handler
 #
 # Boundaries:
@@ -18,6 +19,7 @@
 #
 # ==================================================
 import logging
+import time
 import traceback
 
 from telegram import Update
@@ -25,24 +27,34 @@ from telegram.ext import (
     ApplicationBuilder,
     CommandHandler,
     CallbackQueryHandler,
+    MessageHandler,
+    ChatMemberHandler,
     ContextTypes,
     filters,
 )
 
-from core.settings import TELEGRAM_BOT_TOKEN, QUOTES_FILE, BANLU_QUOTES_FILE
-
-from services.quotes_service import load_quotes
-from services.banlu_service import load_banlu_quotes
+from core.settings import TELEGRAM_BOT_TOKEN, TIMERS_DB_PATH
 
 from commands.chat_id import chat_id_command
 from commands.start import start_command
 from commands.help_cmd import help_command
 from commands.quotes import quote_command
+from commands.reload import reload_command
 
 from commands.simple_timer import timer_command
 from commands.date_timer import timerdate_command
 
-from commands.cancel import cancel_command, cancel_callback, cancel_timer_callback
+from commands.cancel import cancel_command, cancel_callback, cancel_board_callback, cancel_timer_callback
+
+from core.admin import track_chat_member
+from core.countdown import setup_countdown_engine
+from core.datasets import get_datasets, setup_dataset_watch
+from core.metrics import setup_metrics_log
+from core.outbound import OutboundScheduler
+from core.pins import get_pin_cache, track_pinned_message
+from core.timer_engine import get_engine
+from core.timers_db import TimerDB, rehydrate_timers
+from core.timers_store import get_store
 
 from commands.holidays_cmd import holidays_command
 from commands.murloc_ai import murloc_ai_command
@@ -73,21 +85,48 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
         )
 
 
+def restore_timers() -> TimerDB:
+    """Attach the SQLite timer backend and re-schedule persisted timers."""
+    db = TimerDB(TIMERS_DB_PATH)
+    store = get_store()
+    store.attach_backend(db)
+
+    started = time.perf_counter()
+    active, expired = rehydrate_timers(db, store, get_engine())
+    for chat_id in store.chat_ids():
+        get_pin_cache().seed(store.chat_timers(chat_id))
+    logger.info(
+        "Restored %d timers (%d expired) from %s in %.1f ms",
+        active + expired,
+        expired,
+        TIMERS_DB_PATH,
+        (time.perf_counter() - started) * 1000,
+    )
+    return db
+
+
 def main() -> None:
     """main."""
     if not TELEGRAM_BOT_TOKEN:
         raise RuntimeError("TELEGRAM_BOT_TOKEN is not set")
 
-    quotes = load_quotes(QUOTES_FILE)
-    banlu_quotes = load_banlu_quotes(BANLU_QUOTES_FILE)
+    # Datasets register themselves on import (services/commands); load them all now
+    # rather than on first use. Later edits are picked up by the watch job.
+    started = time.perf_counter()
+    datasets = get_datasets()
+    datasets.load_all()
+    logger.info(
+        "Loaded datasets %s in %.1f ms",
+        ", ".join(datasets.names()),
+        (time.perf_counter() - started) * 1000,
+    )
 
-    app = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).build()
+    # Every Bot API call goes through the outbound scheduler (global + per-chat limits).
+    app = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).rate_limiter(OutboundScheduler()).build()
 
     # shared state
     app.bot_data.setdefault("banlu_last_sent", None)
     app.bot_data.setdefault("holidays_last_sent", None)
-    app.bot_data["quotes"] = quotes
-    app.bot_data["banlu_quotes"] = banlu_quotes
 
     private_and_groups = filters.ChatType.PRIVATE | filters.ChatType.GROUPS
     channels = filters.ChatType.CHANNEL
@@ -97,6 +136,7 @@ def main() -> None:
     app.add_handler(CommandHandler("start", start_command, filters=private_and_groups))
     app.add_handler(CommandHandler("help", help_command, filters=private_and_groups))
     app.add_handler(CommandHandler("quote", quote_command, filters=private_and_groups))
+    app.add_handler(CommandHandler("reload", reload_command, filters=private_and_groups))
 
     app.add_handler(CommandHandler("timer", timer_command, filters=private_and_groups))
     app.add_handler(CommandHandler("timerdate", timerdate_command, filters=private_and_groups))
@@ -105,12 +145,26 @@ def main() -> None:
     app.add_handler(CommandHandler("cancel", cancel_command, filters=private_and_groups))
     # Buttons under each timer message
     app.add_handler(CallbackQueryHandler(cancel_timer_callback, pattern=r"^cancel_timer:"))
-    # Buttons from /cancel menu
-    app.add_handler(CallbackQueryHandler(cancel_callback, pattern=r"^(cancel_one:|cancel_all:)"))
+    # Buttons on a chat's timer dashboard (/timer --board)
+    app.add_handler(CallbackQueryHandler(cancel_board_callback, pattern=r"^board_cancel:"))
+    # Buttons from /cancel menu (legacy cancel_one:/cancel_all: data is answered as expired)
+    app.add_handler(CallbackQueryHandler(cancel_callback, pattern=r"^(cm:|cancel_one:|cancel_all:)"))
+
+    # Keeps the pin cache (core/pins.py) aware of pins made by anyone
+    app.add_handler(MessageHandler(filters.StatusUpdate.PINNED_MESSAGE, track_pinned_message))
+
+    # Keeps the admin cache (core/admin.py) in sync with promotions/demotions
+    app.add_handler(ChatMemberHandler(track_chat_member, ChatMemberHandler.ANY_CHAT_MEMBER))
 
     app.add_handler(CommandHandler("holidays", holidays_command, filters=private_and_groups))
     app.add_handler(CommandHandler("murloc_ai", murloc_ai_command, filters=private_and_groups))
 
+    # countdown driver (one periodic job for all timers) + persisted timers
+    restore_timers()
+    setup_countdown_engine(app)
+    setup_metrics_log(app)
+    setup_dataset_watch(app)
+
     # daily jobs
     setup_banlu_daily(app)
     setup_holidays_daily(app)
@@ -119,7 +173,8 @@ def main() -> None:
     app.add_error_handler(error_handler)
 
     logger.info("Bot started.")
-    app.run_polling()
+    # ALL_TYPES: chat_member updates are not delivered unless requested explicitly.
+    app.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
 if __name__ == "__main__":
@@ -16,61 +16,74 @@
 # - Keep commands thin and deterministic; move reusable logic to services/core.
 #
 # ==================================================
+import functools
 import logging
-from datetime import datetime, timezone
+import time
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 
-from core.admin import is_admin
-from core.formatter import format_remaining_time
-from core.timers import remove_timer_job
-from core.timers_store import list_timers, remove_timer
+from core import metrics
+from core.admin import cached_is_admin, is_admin
+from core.callback_tokens import issue_token, resolve_token
+from core.board import mark_dirty
+from core.cancel_menu import get_cancel_menu
+from core.outbound import Priority
+from core.pins import unpin_message
+from core.timers import CANCELLED_TEXT, begin_cancel, cancel_all_timers, end_cancel
+from core.timers_store import find_timer, get_timer
 
 logger = logging.getLogger(__name__)
 
+# Callback data prefix of /cancel menu buttons: "cm:<token>".
+MENU_PREFIX = "cm:"
+
 
 async def _unpin_if_pinned(context: ContextTypes.DEFAULT_TYPE, chat_id: int, message_id: int | None) -> None:
-    """Unpin a specific message if it is currently pinned."""
+    """Unpin a specific message if it is currently pinned.
+
+    The pinned state comes from the pin cache (core/pins.py): one unpin call, no `get_chat` reads.
+    """
     if not message_id:
         return
-    try:
-        chat = await context.bot.get_chat(chat_id)
-        pinned = getattr(chat, "pinned_message", None)
-        if pinned and pinned.message_id == message_id:
-            await context.bot.unpin_chat_message(chat_id=chat_id, message_id=message_id)
-
-            # Safety guard: some clients can keep showing a pinned message even after an unpin call.
-            chat2 = await context.bot.get_chat(chat_id)
-            pinned2 = getattr(chat2, "pinned_message", None)
-            if pinned2 and pinned2.message_id == message_id:
-                await context.bot.unpin_chat_message(chat_id=chat_id)
-    except Exception as e:
-        logger.warning("Unpin failed for chat=%s msg=%s: %s", chat_id, message_id, e)
+    await unpin_message(context.bot, chat_id, message_id)
 
 
-def _short(text: str, limit: int = 26) -> str:
-    """Command handler:  short."""
-    text = (text or "").replace("\n", " ").strip()
-    if not text:
-        return ""
-    return text if len(text) <= limit else text[: limit - 1] + "…"
+def _menu_markup(chat_id: int, page: int = 0) -> InlineKeyboardMarkup | None:
+    """Keyboard of one /cancel menu page (None if the chat has no timers).
 
+    Rows come from the page cache (core/cancel_menu.py); only the opaque button tokens
+    (core/callback_tokens.py) are issued per render.
+    """
+    rendered = get_cancel_menu().page(chat_id, page)
+    if rendered is None:
+        return None
+
+    keyboard = [
+        [InlineKeyboardButton(label, callback_data=f"{MENU_PREFIX}{issue_token('cancel_one', chat_id, uid)}")]
+        for label, uid in rendered.rows
+    ]
+
+    if rendered.pages > 1:
+        nav = []
+        if rendered.page > 0:
+            token = issue_token("page", chat_id, rendered.page - 1)
+            nav.append(InlineKeyboardButton("◀️ Prev", callback_data=f"{MENU_PREFIX}{token}"))
+        token = issue_token("page", chat_id, rendered.page)
+        nav.append(
+            InlineKeyboardButton(f"{rendered.page + 1}/{rendered.pages}", callback_data=f"{MENU_PREFIX}{token}")
+        )
+        if rendered.page + 1 < rendered.pages:
+            token = issue_token("page", chat_id, rendered.page + 1)
+            nav.append(InlineKeyboardButton("Next ▶️", callback_data=f"{MENU_PREFIX}{token}"))
+        keyboard.append(nav)
 
-def _timer_label(entry) -> str:
-    """Build a short, readable timer label for an inline keyboard button."""
-    now = datetime.now(timezone.utc)
-    remaining = int((entry.target_time - now).total_seconds())
-    if remaining < 0:
-        remaining = 0
-
-    msg = _short(entry.message)
-    if not msg:
-        msg = "no text"
-
-    # Keep button text short (Telegram is strict about inline keyboard limits).
-    # Add a small suffix for uniqueness/debugging.
-    return f"❌ {format_remaining_time(remaining)} — {msg} (#{entry.message_id})"
+    # IMPORTANT: we do not expose /cancelall as a separate command; the "cancel all" action lives inside /cancel.
+    token = issue_token("cancel_all", chat_id)
+    keyboard.append(
+        [InlineKeyboardButton("🧹 Cancel ALL timers", callback_data=f"{MENU_PREFIX}{token}")]
+    )
+    return InlineKeyboardMarkup(keyboard)
 
 
 async def cancel_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -81,155 +94,232 @@ async def cancel_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     chat_id = update.effective_chat.id
-    timers = list_timers(chat_id)
 
-    if not timers:
+    # Nearest completion time first, PAGE_SIZE timers per page.
+    markup = _menu_markup(chat_id)
+    if markup is None:
         await update.message.reply_text("No active timers found.")
         return
 
-    # Sort timers by nearest completion time.
-    timers.sort(key=lambda t: t.target_time)
+    await update.message.reply_text(
+        "Choose what to cancel:",
+        reply_markup=markup,
+    )
+
+
+async def _ack(query, started: float, text: str | None = None, **kwargs) -> None:
+    """Answer a callback query and record how long the user waited for it."""
+    try:
+        await query.answer(text, **kwargs)
+    finally:
+        metrics.observe("callback.ack_latency", time.perf_counter() - started)
+
+
+async def _finish_cancel(context: ContextTypes.DEFAULT_TYPE, entry) -> None:
+    """Background side effects of cancelling one timer: unpin + final edit."""
+    # If this timer message was pinned, unpin it.
+    await _unpin_if_pinned(context, entry.chat_id, entry.pin_message_id or entry.message_id)
 
-    keyboard = []
-    for t in timers:
-        keyboard.append(
-            [InlineKeyboardButton(_timer_label(t), callback_data=f"cancel_one:{chat_id}:{t.message_id}")]
+    # Update the timer message text (if it still exists).
+    try:
+        await context.bot.edit_message_text(
+            chat_id=entry.chat_id,
+            message_id=entry.message_id,
+            text=CANCELLED_TEXT,
+            rate_limit_args={"priority": Priority.FINAL},
         )
+    except Exception as e:
+        logger.warning("Edit cancelled timer message failed: %s", e)
+    finally:
+        end_cancel(entry)
 
-    # IMPORTANT: we do not expose /cancelall as a separate command; the "cancel all" action lives inside /cancel.
-    keyboard.append(
-        [InlineKeyboardButton("🧹 Cancel ALL timers", callback_data=f"cancel_all:{chat_id}")]
-    )
 
-    await update.message.reply_text(
-        "Choose what to cancel:",
-        reply_markup=InlineKeyboardMarkup(keyboard),
-    )
+async def _show_page(query, chat_id: int, page: int) -> None:
+    """Background part of menu navigation: swap the keyboard to another page."""
+    markup = _menu_markup(chat_id, page)
+    try:
+        if markup is None:
+            await query.edit_message_text("No active timers found.")
+        else:
+            await query.edit_message_reply_markup(reply_markup=markup)
+    except Exception:
+        # "message is not modified" (same page) or the menu is gone.
+        pass
+
 
+async def _finish_cancel_all(query, context: ContextTypes.DEFAULT_TYPE, chat_id: int) -> None:
+    """Background part of "cancel all": batch cancellation + menu update."""
+    report = await cancel_all_timers(context.bot, chat_id)
 
+    text = "✅ All timers have been cancelled."
+    if report.failed:
+        text += f"\n({report.edited}/{report.total} timer messages updated)"
+    try:
+        await query.edit_message_text(text)
+    except Exception:
+        # If we cannot edit the menu message, fail silently.
+        pass
+
+
+# ==================================================
+# Callback handlers (ack first)
+# ==================================================
+#
+# Each handler only does in-memory work before answering the query:
+# - validation, admin check (cached, see core/admin.py), store lookup and removal;
+# - then `query.answer()` immediately, so the button stops spinning;
+# - on an admin cache miss the query is answered first and the admin list is
+#   fetched (and the action run) in the background;
+# - unpin / edits run afterwards as a PTB-tracked task (`application.create_task`),
+#   whose errors reach the global error handler.
+#
+# Cancellation is single-flight (core/models.TimerState): the first request claims the
+# timer with `begin_cancel` and owns the side effects; double taps, the other button
+# and a finishing countdown tick all see a non-ACTIVE timer and return immediately.
+#
 async def cancel_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle callback queries (inline button actions) for timer cancellation."""
+    started = time.perf_counter()
     query = update.callback_query
     if not query or not query.data:
         return
 
-    # Admin-only (important: anyone in the group can tap buttons)
-    if not await is_admin(update, context):
-        await query.answer("⛔ Admins only", show_alert=True)
+    # Stale/forged tokens (and menus from older versions) are rejected with one dict lookup.
+    action = None
+    if query.data.startswith(MENU_PREFIX):
+        action = resolve_token(query.data[len(MENU_PREFIX):])
+    chat = update.effective_chat
+    if action is None or chat is None or action[1] != chat.id:
+        await _ack(query, started, "This menu has expired. Send /cancel again.", show_alert=True)
         return
 
-    try:
-        action, chat_id_str, *rest = query.data.split(":")
-        chat_id = int(chat_id_str)
-    except Exception:
-        await query.answer("Invalid data", show_alert=True)
+    # Admin-only (important: anyone in the group can tap buttons)
+    admin = cached_is_admin(update)
+    if admin is None:
+        # Admin cache miss: stop the spinner first, fetch the admin list afterwards.
+        await _ack(query, started)
+        context.application.create_task(_checked_menu_action(update, context, action), update=update)
+        return
+    if not admin:
+        await _ack(query, started, "⛔ Admins only", show_alert=True)
         return
 
-    job_queue = context.job_queue
+    await _menu_action(update, context, action, functools.partial(_ack, query, started))
 
-    if action == "cancel_one":
-        if not rest:
-            await query.answer("Invalid data", show_alert=True)
-            return
-        msg_id = int(rest[0])
 
-        # Locate the timer entry (needed to decide whether we should unpin).
-        entry = next((t for t in list_timers(chat_id) if t.message_id == msg_id), None)
-        if not entry:
-            await query.answer("Timer was not found anymore.")
-            return
+async def _answered(*args, **kwargs) -> None:
+    """`answer` stand-in once the query has already been acknowledged."""
 
-        # If this timer message was pinned, unpin it.
-        await _unpin_if_pinned(context, chat_id, entry.pin_message_id or msg_id)
 
-        remove_timer_job(job_queue, chat_id, msg_id)
-        remove_timer(chat_id, msg_id)
+async def _checked_menu_action(update: Update, context: ContextTypes.DEFAULT_TYPE, action: tuple) -> None:
+    """Background part of a menu press on an admin cache miss (query already answered)."""
+    if await is_admin(update, context):
+        await _menu_action(update, context, action, _answered)
 
-        # Update the timer message text (if it still exists).
-        try:
-            await context.bot.edit_message_text(
-                chat_id=chat_id,
-                message_id=msg_id,
-                text="⛔ Timer cancelled.",
-            )
-        except Exception as e:
-            logger.warning("Edit cancelled timer message failed: %s", e)
 
-        await query.answer("OK")
-        return
+async def _menu_action(update: Update, context: ContextTypes.DEFAULT_TYPE, action: tuple, answer) -> None:
+    """Run a resolved menu action; `answer` acknowledges the query (text, **kwargs)."""
+    query = update.callback_query
+    kind, chat_id, *rest = action
 
-    if action == "cancel_all":
-        entries = list_timers(chat_id)
+    if kind == "cancel_one":
+        entry = get_timer(rest[0])
+        if not entry or not begin_cancel(entry):
+            await answer("Timer was not found anymore.")
+            return
 
-        # First, unpin (if the pinned message is this timer).
-        for entry in entries:
-            if entry.pin_message_id:
-                await _unpin_if_pinned(context, chat_id, entry.pin_message_id)
+        await answer("OK")
+        if entry.board:
+            # Dashboard timers share one message: the next tick re-renders it.
+            end_cancel(entry)
+            mark_dirty(chat_id)
+        else:
+            context.application.create_task(_finish_cancel(context, entry), update=update)
+        return
 
-        # Then remove jobs and delete the timer entry.
-        for entry in entries:
-            remove_timer_job(job_queue, chat_id, entry.message_id)
-            remove_timer(chat_id, entry.message_id)
+    if kind == "page":
+        await answer()
+        context.application.create_task(_show_page(query, chat_id, rest[0]), update=update)
+        return
 
-        await query.answer("OK")
-        try:
-            await query.edit_message_text("✅ All timers have been cancelled.")
-        except Exception:
-            # If we cannot edit the menu message, fail silently.
-            pass
+    if kind == "cancel_all":
+        # Removal is atomic; unpins and message edits then run concurrently (core/timers.py).
+        await answer("OK")
+        context.application.create_task(_finish_cancel_all(query, context, chat_id), update=update)
         return
 
-    await query.answer("Unknown action", show_alert=True)
+    await answer("Unknown action", show_alert=True)
 
 
 async def cancel_timer_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Cancel button under each timer message.
 
-    Callback data format: cancel_timer:<message_id>
+    Callback data format: cancel_timer:<uid>
+    (messages sent by older versions carry cancel_timer:<message_id>, looked up only
+    when no timer has that uid; the countdown engine replaces their keyboard on its next edit)
 
     This button is intentionally *not* admin-only: people expect the
     inline "Cancel" under the timer to just work.
     """
+    started = time.perf_counter()
     query = update.callback_query
     if not query or not query.data:
         return
 
-    try:
-        _, msg_id_str = query.data.split(":", 1)
-        msg_id = int(msg_id_str)
-    except Exception:
-        await query.answer("Invalid data", show_alert=True)
+    token = query.data.partition(":")[2]
+    if not token:
+        await _ack(query, started, "Invalid data", show_alert=True)
         return
 
     # Where the button was pressed
     chat_id = update.effective_chat.id if update.effective_chat else None
     if not chat_id:
-        await query.answer("Failed to resolve chat", show_alert=True)
+        await _ack(query, started, "Failed to resolve chat", show_alert=True)
         return
 
-    entry = next((t for t in list_timers(chat_id) if t.message_id == msg_id), None)
-    if not entry:
-        # The timer was already removed / expired
+    # A uid can be all digits too, so the uid lookup always goes first.
+    entry = get_timer(token)
+    if entry is None and token.isdigit():
+        entry = find_timer(chat_id, int(token))
+    if entry is not None and entry.chat_id != chat_id:
+        entry = None
+
+    if not entry or not begin_cancel(entry):
+        # The timer was already removed / expired / being cancelled
+        await _ack(query, started, "Timer was not found")
         try:
             await query.edit_message_reply_markup(reply_markup=None)
         except Exception:
             pass
-        await query.answer("Timer was not found")
         return
 
-    # If it's pinned, unpin it first
-    await _unpin_if_pinned(context, chat_id, entry.pin_message_id or msg_id)
+    await _ack(query, started, "OK")
+    context.application.create_task(_finish_cancel(context, entry), update=update)
 
-    remove_timer_job(context.job_queue, chat_id, msg_id)
-    remove_timer(chat_id, msg_id)
 
-    try:
-        await context.bot.edit_message_text(
-            chat_id=chat_id,
-            message_id=msg_id,
-            text="⛔ Timer cancelled.",
-        )
-    except Exception as e:
-        logger.warning("Edit cancelled timer message failed: %s", e)
+async def cancel_board_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Cancel button on a chat's timer dashboard.
+
+    Callback data format: board_cancel:<uid>
+
+    Like the button under a timer message, this is not admin-only.
+    The dashboard itself is re-rendered by the countdown engine on its next tick.
+    """
+    started = time.perf_counter()
+    query = update.callback_query
+    if not query or not query.data:
+        return
+
+    uid = query.data.partition(":")[2]
+    chat_id = update.effective_chat.id if update.effective_chat else None
+
+    entry = get_timer(uid)
+    if entry is None or entry.chat_id != chat_id or not begin_cancel(entry):
+        await _ack(query, started, "Timer was not found")
+        return
+
+    # The dashboard re-render is the only side effect.
+    end_cancel(entry)
+    mark_dirty(chat_id)
 
-    await query.answer("OK")
\ No newline at end of file
+    await _ack(query, started, "⛔ Timer cancelled.")
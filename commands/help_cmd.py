@@ -64,7 +64,8 @@ async def help_command(
         "/timerdate 31.12.2025 23:59 +3 Happy New Year 🎆 --pin\n\n"
 
         "📌 <b>Option</b>\n"
-        "--pin — pin the timer message in chat\n\n"
+        "--pin — pin the timer message in chat\n"
+        "--board — /timer only: show it on one pinned dashboard with the chat's other board timers\n\n"
 
         "🎉 <b>Holidays</b>\n"
         "/holidays — today’s holidays\n\n"
@@ -85,6 +86,7 @@ async def help_command(
             "\n🛡 <b>Administrator</b>\n"
             "/cancel — cancel timers (there is also a button to cancel all)\n"
             "/chat_id — show chat ID\n"
+            "/reload — reload data files (holidays, quotes, ...); /reload all forces a full reload (bot owners)\n"
         )
 
     # --------------------------------------------------
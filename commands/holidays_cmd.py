@@ -19,8 +19,7 @@
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from services.holidays_service import load_all_holidays
-from services.holidays_flags import COUNTRY_FLAGS, CATEGORY_EMOJIS
+from services.holidays_service import holiday_sources, iter_upcoming_holidays
 
 # ==================================================
 # Single holiday formatter (command-level)
@@ -40,14 +39,15 @@ def format_holiday(holiday: dict) -> str:
     # Country / flag resolution
     # --------------------------------------------------
     """Command handler: format holiday."""
-    country = holiday["countries"][0] if holiday["countries"] else ""
-    flag = COUNTRY_FLAGS.get(country, "🌍")
+    # Flags/emojis were resolved when the holidays loaded (services/emoji_lookup.py).
+    flags = holiday["country_flags"]
+    flag = (flags[0] if flags else "") or "🌍"
 
     # --------------------------------------------------
     # Category / emoji resolution
     # --------------------------------------------------
     category = holiday["categories"][0] if holiday["categories"] else ""
-    emoji = CATEGORY_EMOJIS.get(category, "")
+    emoji = holiday["category_emojis"][0] if category else ""
 
     # --------------------------------------------------
     # Date formatting
@@ -75,26 +75,22 @@ def format_holiday(holiday: dict) -> str:
 # Displays a list of upcoming holidays.
 #
 # Behavior:
-# - Holidays are loaded from all sources (static + dynamic)
+# - Holidays come from all sources (static index + dynamic), in date order
 # - Only one holiday per source is shown
 #   (to avoid overwhelming the user)
+# - The walk stops as soon as every source has been shown
 #
 async def holidays_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
 ):
     """Handle the /holidays command."""
-    holidays = load_all_holidays()
-
-    if not holidays:
-        await update.message.reply_text("❌ No holidays found")
-        return
-
+    sources = holiday_sources()
     message = ["📅 *Upcoming Holidays*\n"]
 
     shown_sources = set()
 
-    for holiday in holidays:
+    for holiday in iter_upcoming_holidays():
         # --------------------------------------------------
         # Source deduplication
         # --------------------------------------------------
@@ -111,6 +107,12 @@ async def holidays_command(
         message.append(format_holiday(holiday))
         message.append("")
         shown_sources.add(holiday["source"])
+        if shown_sources >= sources:
+            break
+
+    if not shown_sources:
+        await update.message.reply_text("❌ No holidays found")
+        return
 
     await update.message.reply_text(
         "\n".join(message),
@@ -20,6 +20,7 @@ import random
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from core.datasets import register_dataset
 from core.helpers import load_lines
 
 # ==================================================
@@ -37,6 +38,22 @@ MURLOC_STARTS_FILE = "data/murloc_starts.txt"
 MURLOC_MIDDLES_FILE = "data/murloc_middles.txt"
 MURLOC_ENDINGS_FILE = "data/murloc_endings.txt"
 
+
+def _load_murloc_data() -> dict:
+    """All three fragment files as one snapshot."""
+    return {
+        "starts": load_lines(MURLOC_STARTS_FILE),
+        "middles": load_lines(MURLOC_MIDDLES_FILE),
+        "ends": load_lines(MURLOC_ENDINGS_FILE),
+    }
+
+
+MURLOC_DATA = register_dataset(
+    "murloc",
+    lambda: [MURLOC_STARTS_FILE, MURLOC_MIDDLES_FILE, MURLOC_ENDINGS_FILE],
+    _load_murloc_data,
+)
+
 # ==================================================
 # Phrase generator
 # ==================================================
@@ -81,21 +98,14 @@ async def murloc_ai_command(
 ):
 
     # --------------------------------------------------
-    # Lazy-load phrase data
+    # Phrase data
     # --------------------------------------------------
     #
-    # Data is cached in bot_data to avoid
-    # repeated file I/O on each command call.
+    # Loaded at startup and hot-reloaded as one snapshot
+    # (core/datasets.py): no file I/O per command call.
     #
     """Handle the /murloc_ai command."""
-    if "murloc_data" not in context.bot_data:
-        context.bot_data["murloc_data"] = {
-            "starts": load_lines(MURLOC_STARTS_FILE),
-            "middles": load_lines(MURLOC_MIDDLES_FILE),
-            "ends": load_lines(MURLOC_ENDINGS_FILE),
-        }
-
-    data = context.bot_data["murloc_data"]
+    data = MURLOC_DATA.get()
 
     phrase = generate_murloc_phrase(
         data["starts"],
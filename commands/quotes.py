@@ -19,7 +19,7 @@
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from services.quotes_service import get_random_quote
+from services.quotes_service import get_quotes, get_random_quote
 
 # ==================================================
 # /quote command
@@ -31,10 +31,9 @@ async def quote_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
 ):
-    # Quotes are expected to be preloaded
-    # and stored in bot_data at application startup
+    # Quotes are preloaded at startup and hot-reloaded (core/datasets.py)
     """Handle the /quote command."""
-    quotes = context.bot_data.get("quotes", [])
+    quotes = get_quotes()
 
     quote = get_random_quote(quotes)
 
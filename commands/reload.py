@@ -0,0 +1,54 @@
+# ==================================================
+# commands/reload.py — Dataset Reload Command
+# ==================================================
+#
+# User-facing /reload handler; rebuilds datasets whose files changed (or all of them).
+#
+# Layer: Commands
+#
+# Responsibilities:
+# - Validate/parse user input (minimal)
+# - Delegate work to services/core
+# - Send user-facing responses via Telegram API
+#
+# Boundaries:
+# - Commands do not implement business logic; they orchestrate user interaction.
+# - Keep commands thin and deterministic; move reusable logic to services/core.
+#
+# ==================================================
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from core.datasets import get_datasets
+from core.settings import BOT_OWNER_IDS
+
+# ==================================================
+# /reload command
+# ==================================================
+#
+# /reload       — reload datasets whose files changed
+# /reload all   — reload every dataset
+#
+# Same path as the background watch job (core/datasets.py):
+# rebuilt off the event loop, swapped in atomically.
+#
+# Process-wide, so restricted to BOT_OWNER_IDS (core/settings.py),
+# not to chat admins.
+#
+async def reload_command(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+):
+    """Handle the /reload command."""
+    user = update.effective_user
+    if user is None or user.id not in BOT_OWNER_IDS:
+        await update.message.reply_text("⛔ This command is available to the bot owners only.")
+        return
+
+    force = bool(context.args) and context.args[0].lower() == "all"
+    reloaded = await get_datasets().reload(force=force)
+
+    if reloaded:
+        await update.message.reply_text("🔄 Reloaded: " + ", ".join(reloaded))
+    else:
+        await update.message.reply_text("✅ All datasets are up to date.")
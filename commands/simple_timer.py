@@ -17,17 +17,86 @@
 #
 # ==================================================
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update
 from telegram.ext import ContextTypes
 
 from services.parser import parse_timer_args
-from core.timers import create_timer
+from core.board import board_timers, close_board, get_board, mark_dirty, open_board, render_board, render_hash, reserve_board
+from core.countdown import cancel_keyboard, render_countdown
+from core.pins import pin_message
+from core.timers import begin_cancel, build_timer, create_timer, end_cancel, pin_timer, start_timer
+from core.timers_store import update_timer
 
 logger = logging.getLogger(__name__)
 
 
+async def _board_timer(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    target_time: datetime,
+    message: str | None,
+) -> None:
+    """Add a timer to the chat's dashboard (sending and pinning the dashboard if needed)."""
+    chat_id = update.effective_chat.id
+    state = get_board(chat_id)
+
+    if state is not None:
+        # Existing (or still being sent) dashboard: the next tick re-renders it with
+        # the new line; a dashboard being sent adopts this timer in `open_board`.
+        create_timer(
+            context=context,
+            chat_id=chat_id,
+            target_time=target_time,
+            message=message,
+            message_id=state.message_id,
+            pin_message_id=state.message_id if state.pinned else None,
+            board=True,
+        )
+        mark_dirty(chat_id)
+        return
+
+    # Reserved before the first await: concurrent --board commands join this dashboard.
+    # This timer is only registered once the dashboard is sent.
+    reserve_board(chat_id)
+    entry = build_timer(chat_id, target_time, message, board=True)
+    text, kb = render_board([entry], time.time())
+    try:
+        sent = await update.effective_message.reply_text(text, reply_markup=kb)
+    except Exception:
+        # No dashboard to show them on: drop the timers that joined meanwhile.
+        for orphan in [e for e in board_timers(chat_id) if e.message_id is None]:
+            if begin_cancel(orphan):
+                end_cancel(orphan)
+        close_board(chat_id)
+        raise
+
+    # Registered before the pin round trip, so its Cancel button works right away.
+    start_timer(entry, message_id=sent.message_id)
+
+    pinned = False
+    try:
+        await pin_message(context.bot, chat_id, sent.message_id, disable_notification=True)
+        pinned = True
+    except Exception as e:
+        logger.warning("Board pin failed: %s", e)
+
+    waiting = open_board(chat_id, sent.message_id, pinned)
+    for waiting_entry in waiting:
+        update_timer(waiting_entry)
+    if pinned:
+        entry.pin_message_id = sent.message_id
+        update_timer(entry)
+
+    if not waiting:
+        get_board(chat_id).last_hash = render_hash(text, kb)
+    else:
+        # Other timers joined while the dashboard was being sent.
+        mark_dirty(chat_id)
+
+
 async def timer_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     /timer 10m [message]
@@ -35,24 +104,14 @@ async def timer_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
       /timer 5m
       /timer 1h 30m stretch
       /timer 45s tea
+      /timer 30m pull --board   (shared per-chat dashboard message)
     """
     if not update.effective_chat or not update.effective_message:
         return
 
     raw = update.effective_message.text or ""
 
-    # --------------------------------------------------
-    # Flags
-    # --------------------------------------------------
-    # Support: /timer 10m tea --pin
-    # We keep the existing parser intact and strip only known flags.
-    tokens = raw.split()
-    pin = False
-    if "--pin" in tokens:
-        pin = True
-        tokens = [t for t in tokens if t != "--pin"]
-        raw = " ".join(tokens)
-
+    # Flags (--pin, --board) are picked up by the parser wherever they appear.
     try:
         parsed = parse_timer_args(raw)
     except Exception:
@@ -65,42 +124,27 @@ async def timer_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     now = datetime.now(timezone.utc)
     target_time = now + timedelta(seconds=parsed.seconds)
 
-    text = f"⏰ Time left: {parsed.seconds} sec"
-    if parsed.message:
-        text += f"\n{parsed.message}"
+    if parsed.board:
+        # Dashboards are always pinned; --pin is implied.
+        await _board_timer(update, context, target_time, parsed.message)
+        return
+
+    # One round trip: the first message is already rendered and carries the Cancel
+    # button (its callback data uses the timer uid, not the not-yet-known message_id).
+    entry = build_timer(update.effective_chat.id, target_time, parsed.message)
+    text = render_countdown(entry, parsed.seconds)
+    sent = await update.effective_message.reply_text(text, reply_markup=cancel_keyboard(entry))
 
-    sent = await update.effective_message.reply_text(text)
+    # Registered before the pin round trip, so the Cancel button works right away.
+    start_timer(
+        entry,
+        message_id=sent.message_id,  # This is the message that will be edited by the countdown engine.
+        rendered_text=text,
+    )
 
     # Pin if requested (best-effort)
-    pin_message_id: int | None = None
-    if pin:
+    if parsed.pin:
         try:
-            await context.bot.pin_chat_message(chat_id=sent.chat_id, message_id=sent.message_id)
-            pin_message_id = sent.message_id
+            await pin_timer(context.bot, entry)
         except Exception as e:
             logger.warning("Pin failed: %s", e)
-
-    # attach cancel button
-    try:
-        kb = InlineKeyboardMarkup(
-            [[InlineKeyboardButton("Cancel", callback_data=f"cancel_timer:{sent.message_id}")]]
-        )
-        await context.bot.edit_message_reply_markup(
-            chat_id=sent.chat_id,
-            message_id=sent.message_id,
-            reply_markup=kb,
-        )
-    except Exception as e:
-        logger.warning("Failed to set cancel button: %s", e)
-
-    # IMPORTANT:
-    # NOTE: core.create_timer in this repo does not accept message_id,
-    # so we reuse pin_message_id for backward compatibility.
-    create_timer(
-        context=context,
-        chat_id=sent.chat_id,
-        target_time=target_time,
-        message=parsed.message,
-        message_id=sent.message_id,  # This is the message that will be edited by the countdown engine.
-        pin_message_id=pin_message_id,
-    )
\ No newline at end of file
@@ -2,7 +2,7 @@
 # core/admin.py — Admin Checks
 # ==================================================
 #
-# Utilities to detect whether a user is an admin in the current chat.
+# Utilities to detect whether a user is an admin in the current chat (cached per chat/user).
 #
 # Layer: Core
 #
@@ -16,9 +16,159 @@
 # - Core should not import commands (top layer) to avoid circular dependencies.
 #
 # ==================================================
-from telegram import Update
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from telegram import ChatMember, Update
 from telegram.ext import ContextTypes
 
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+# How long a cached admin status is trusted (seconds).
+ADMIN_TTL = 600.0
+
+# (chat_id, user_id) entries kept before the least recently used ones are evicted.
+MAX_ENTRIES = 10_000
+
+# Chat admin rosters kept before the least recently used ones are evicted.
+MAX_ROSTERS = 2_000
+
+_ADMIN_STATUSES = (ChatMember.ADMINISTRATOR, ChatMember.OWNER)
+
+
+# ==================================================
+# Admin status cache
+# ==================================================
+#
+# Why this exists:
+# - Every /cancel, /help, /chat_id and every /cancel menu button press used to call
+#   `get_chat_member` before the bot could even answer.
+#
+# Design:
+# - Rosters: chat_id -> (admin user ids, expires_at), fetched once per chat with
+#   `get_chat_administrators`. While a roster is fresh it answers for every user of
+#   the chat (in the set = admin), so LRU pressure from other chats cannot turn a
+#   real admin into a non-admin.
+# - Per-user entries: (chat_id, user_id) -> (is_admin, expires_at), LRU-bounded
+#   (OrderedDict); only used for chats without a fresh roster (e.g. when
+#   `get_chat_administrators` failed and `get_chat_member` was used instead).
+#   They are also indexed per chat, so a fetched roster drops its chat's entries
+#   without scanning the whole cache.
+# - ChatMemberUpdated updates (promotions, demotions, leaves) are applied to the
+#   roster (or the per-user entry) immediately, so the TTL only bounds staleness
+#   for missed updates.
+#
+class AdminCache:
+    """TTL cache of chat admin rosters, plus LRU per-(chat_id, user_id) fallbacks."""
+
+    def __init__(self, ttl: float = ADMIN_TTL, max_entries: int = MAX_ENTRIES, max_rosters: int = MAX_ROSTERS) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_rosters = max_rosters
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[bool, float]]" = OrderedDict()
+        # chat_id -> user ids with a per-user entry (so a roster drops them without a scan)
+        self._chat_users: Dict[int, Set[int]] = {}
+        # chat_id -> (admin user ids, expiry) from get_chat_administrators
+        self._rosters: "OrderedDict[int, Tuple[Set[int], float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _roster(self, chat_id: int, now: float) -> Optional[Set[int]]:
+        """A chat's fresh admin roster, or None."""
+        roster = self._rosters.get(chat_id)
+        if roster is None:
+            return None
+        if roster[1] <= now:
+            del self._rosters[chat_id]
+            return None
+        self._rosters.move_to_end(chat_id)
+        return roster[0]
+
+    def _drop_entry(self, key: Tuple[int, int]) -> None:
+        del self._entries[key]
+        users = self._chat_users[key[0]]
+        users.discard(key[1])
+        if not users:
+            del self._chat_users[key[0]]
+
+    def get(self, chat_id: int, user_id: int, now: Optional[float] = None) -> Optional[bool]:
+        """Cached status, or None if unknown/expired."""
+        now = time.monotonic() if now is None else now
+
+        # A fresh admin list covers every user of the chat.
+        roster = self._roster(chat_id, now)
+        if roster is not None:
+            return user_id in roster
+
+        key = (chat_id, user_id)
+        cached = self._entries.get(key)
+        if cached is not None:
+            if cached[1] > now:
+                self._entries.move_to_end(key)
+                return cached[0]
+            self._drop_entry(key)
+        return None
+
+    def set(self, chat_id: int, user_id: int, is_admin: bool, now: Optional[float] = None) -> None:
+        """Store a status (in the chat's roster if it has a fresh one)."""
+        now = time.monotonic() if now is None else now
+        roster = self._roster(chat_id, now)
+        if roster is not None:
+            if is_admin:
+                roster.add(user_id)
+            else:
+                roster.discard(user_id)
+            return
+
+        key = (chat_id, user_id)
+        self._entries[key] = (is_admin, now + self.ttl)
+        self._entries.move_to_end(key)
+        self._chat_users.setdefault(chat_id, set()).add(user_id)
+        while len(self._entries) > self.max_entries:
+            self._drop_entry(next(iter(self._entries)))
+
+    def warm(self, chat_id: int, admin_ids, now: Optional[float] = None) -> None:
+        """Store a chat's complete admin list."""
+        now = time.monotonic() if now is None else now
+        self._rosters[chat_id] = (set(admin_ids), now + self.ttl)
+        self._rosters.move_to_end(chat_id)
+        while len(self._rosters) > self.max_rosters:
+            self._rosters.popitem(last=False)
+        # The roster supersedes this chat's per-user entries.
+        for user_id in self._chat_users.pop(chat_id, ()):
+            del self._entries[(chat_id, user_id)]
+
+
+_CACHE = AdminCache()
+
+
+def get_admin_cache() -> AdminCache:
+    """Return the process-wide admin cache."""
+    return _CACHE
+
+
+async def _fetch_admin(context: ContextTypes.DEFAULT_TYPE, chat_id: int, user_id: int) -> bool:
+    """Miss path: warm the chat's admin list, falling back to a single member lookup."""
+    try:
+        admins = await context.bot.get_chat_administrators(chat_id)
+        _CACHE.warm(chat_id, (m.user.id for m in admins))
+        return _CACHE.get(chat_id, user_id) is True
+    except Exception as e:
+        logger.warning("get_chat_administrators failed for chat %s: %s", chat_id, e)
+
+    member = await context.bot.get_chat_member(chat_id, user_id)
+    result = member.status in _ADMIN_STATUSES
+    _CACHE.set(chat_id, user_id, result)
+    return result
+
+
 # ==================================================
 # Admin check
 # ==================================================
@@ -30,12 +180,8 @@ from telegram.ext import ContextTypes
 # - Group / Supergroup → user must be admin or creator
 # - Channel posts → no user context → always False
 #
-async def is_admin(
-    update: Update,
-    context: ContextTypes.DEFAULT_TYPE,
-) -> bool:
-
-    """Core utility: is admin."""
+def cached_is_admin(update: Update) -> Optional[bool]:
+    """Admin status without any Bot API call; None on an admin cache miss."""
     chat = update.effective_chat
     user = update.effective_user
 
@@ -63,8 +209,40 @@ async def is_admin(
     # Groups / Supergroups
     # --------------------------------------------------
     #
-    # Check the user's membership status.
+    # Served from the admin cache (see `is_admin` for the miss path).
     #
-    member = await context.bot.get_chat_member(chat.id, user.id)
+    cached = _CACHE.get(chat.id, user.id)
+    metrics.incr("admin.cache_miss" if cached is None else "admin.cache_hit")
+    return cached
+
+
+async def is_admin(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> bool:
+
+    """Core utility: is admin."""
+    cached = cached_is_admin(update)
+    if cached is not None:
+        return cached
+
+    # A miss costs one Bot API call for the whole chat.
+    return await _fetch_admin(context, update.effective_chat.id, update.effective_user.id)
+
+
+# ==================================================
+# Invalidation
+# ==================================================
+#
+# Registered in bot.py as a ChatMemberHandler (needs `allowed_updates` to include
+# chat_member, and the bot must be an admin to receive other members' updates).
+#
+async def track_chat_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Apply ChatMemberUpdated updates to the admin cache."""
+    change = update.chat_member or update.my_chat_member
+    if change is None:
+        return
 
-    return member.status in ("administrator", "creator")
\ No newline at end of file
+    member = change.new_chat_member
+    _CACHE.set(change.chat.id, member.user.id, member.status in _ADMIN_STATUSES)
+    metrics.incr("admin.cache_update")
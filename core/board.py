@@ -0,0 +1,190 @@
+# ==================================================
+# core/board.py — Per-Chat Timer Dashboard
+# ==================================================
+#
+# Opt-in dashboard mode (`/timer --board ...`): all board timers of a chat are shown in
+# one pinned message instead of one message per timer.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Guild chats often run several timers at once (pull, break, reset countdown).
+#   With one message per timer every countdown edit counts against the same
+#   ~20 msg/min group limit.
+# - A dashboard needs at most one edit per tick for the whole chat.
+#
+# Design:
+# - Board timers are regular TimerEntry objects with `board=True`; their `message_id`
+#   is the dashboard message (persisted like any other timer, so boards survive restarts).
+# - Board timers are still queued in the tick engine individually (each at its own
+#   next display change); the driver groups due board timers by chat and re-renders
+#   the dashboard once (see core/countdown.py).
+# - Cancelling a board timer only marks the chat dirty; the next tick re-renders.
+# - The first `/timer --board` of a chat reserves the dashboard (`reserve_board`, a
+#   placeholder without message_id) before sending it, so a second command arriving
+#   meanwhile joins that dashboard instead of sending and pinning another one;
+#   `open_board` then attaches every waiting board timer to the sent message.
+#
+# Telegram limits:
+# - Message text: 4096 characters; timers that do not fit are summarized as "… and N more".
+# - Inline keyboard: one cancel button per timer, capped at BOARD_MAX_BUTTONS
+#   (Telegram allows 100); the rest can still be cancelled from /cancel.
+#
+# Boundaries:
+# - Rendering and bookkeeping only; Telegram calls live in core/countdown.py and commands.
+#
+# ==================================================
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from core.formatter import format_countdown
+from core.models import TimerEntry
+from core.timers_store import sorted_timers
+
+# Telegram limits.
+MESSAGE_MAX_CHARS = 4096
+BOARD_MAX_BUTTONS = 20
+
+# Longest timer label shown on a dashboard line / button.
+LABEL_MAX_CHARS = 120
+BUTTON_LABEL_MAX_CHARS = 24
+
+BOARD_TITLE = "📋 Timers"
+BOARD_EMPTY = "📋 No active timers."
+
+
+class BoardState:
+    """Dashboard message of one chat."""
+
+    __slots__ = ("message_id", "pinned", "last_hash", "busy")
+
+    def __init__(self, message_id: Optional[int], pinned: bool) -> None:
+        # None while the dashboard is being sent (reserved by `reserve_board`).
+        self.message_id = message_id
+        self.pinned = pinned
+        # hash() of the last rendered text + buttons (0 = unknown, e.g. after a restart).
+        self.last_hash = 0
+        # True while a refresh for this chat is in flight.
+        self.busy = False
+
+
+# ==================================================
+# Registry (process-local)
+# ==================================================
+_BOARDS: Dict[int, BoardState] = {}
+_DIRTY: Set[int] = set()
+
+
+def board_timers(chat_id: int) -> List[TimerEntry]:
+    """A chat's board timers by nearest completion time."""
+    return [e for e in sorted_timers(chat_id) if e.board]
+
+
+def get_board(chat_id: int) -> Optional[BoardState]:
+    """Dashboard of a chat, if any.
+
+    After a restart the registry is empty; the state is rebuilt from the persisted board timers.
+    """
+    state = _BOARDS.get(chat_id)
+    if state is not None:
+        return state
+
+    for entry in board_timers(chat_id):
+        if entry.message_id is not None:
+            state = _BOARDS[chat_id] = BoardState(entry.message_id, entry.pin_message_id is not None)
+            return state
+    return None
+
+
+def reserve_board(chat_id: int) -> BoardState:
+    """Claim a chat's dashboard before sending it (placeholder without message_id)."""
+    state = _BOARDS[chat_id] = BoardState(None, False)
+    return state
+
+
+def open_board(chat_id: int, message_id: int, pinned: bool) -> List[TimerEntry]:
+    """Register a freshly sent dashboard message.
+
+    Returns:
+        The chat's board timers that were waiting for it (their message ids are set here;
+        the caller persists them).
+    """
+    state = _BOARDS.get(chat_id)
+    if state is None:
+        state = _BOARDS[chat_id] = BoardState(message_id, pinned)
+    state.message_id, state.pinned = message_id, pinned
+
+    waiting = [e for e in board_timers(chat_id) if e.message_id is None]
+    for entry in waiting:
+        entry.message_id = message_id
+        entry.pin_message_id = message_id if pinned else None
+    return waiting
+
+
+def close_board(chat_id: int) -> None:
+    """Forget a chat's dashboard (after its last timer is gone)."""
+    _BOARDS.pop(chat_id, None)
+
+
+def mark_dirty(chat_id: int) -> None:
+    """Ask the countdown driver to re-render a chat's dashboard on its next tick."""
+    _DIRTY.add(chat_id)
+
+
+def pop_dirty() -> Set[int]:
+    """Take the set of chats whose dashboard must be re-rendered."""
+    global _DIRTY
+    dirty, _DIRTY = _DIRTY, set()
+    return dirty
+
+
+# ==================================================
+# Rendering
+# ==================================================
+def _clip(text: str, limit: int) -> str:
+    text = (text or "").replace("\n", " ").strip()
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def render_board(entries: Iterable[TimerEntry], now: float) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
+    """Dashboard text and keyboard for `entries` (already sorted)."""
+    entries = list(entries)
+    if not entries:
+        return BOARD_EMPTY, None
+
+    lines = [BOARD_TITLE]
+    size = len(BOARD_TITLE)
+    for pos, entry in enumerate(entries):
+        line = f"⏰ {format_countdown(int(entry.target_ts - now))}"
+        label = _clip(entry.message, LABEL_MAX_CHARS)
+        if label:
+            line += f" — {label}"
+
+        # Always keep room for the "… and N more" footer.
+        if size + 1 + len(line) + 32 > MESSAGE_MAX_CHARS:
+            lines.append(f"… and {len(entries) - pos} more")
+            break
+        lines.append(line)
+        size += 1 + len(line)
+
+    buttons = [
+        [
+            InlineKeyboardButton(
+                f"❌ {_clip(entry.message, BUTTON_LABEL_MAX_CHARS) or format_countdown(int(entry.target_ts - now))}",
+                callback_data=f"board_cancel:{entry._uid}",
+            )
+        ]
+        for entry in entries[:BOARD_MAX_BUTTONS]
+    ]
+    return "\n".join(lines), InlineKeyboardMarkup(buttons)
+
+
+def render_hash(text: str, keyboard: Optional[InlineKeyboardMarkup]) -> int:
+    """Fingerprint of a rendered dashboard (text + button set)."""
+    if keyboard is None:
+        return hash(text)
+    return hash((text, tuple(row[0].callback_data for row in keyboard.inline_keyboard)))
@@ -0,0 +1,78 @@
+# ==================================================
+# core/callback_tokens.py — Opaque Callback Tokens
+# ==================================================
+#
+# Short random tokens for inline buttons, mapped server-side to the action they trigger.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Menu buttons used to embed raw ids (`cancel_one:<chat_id>:<message_id>`), which the
+#   handler had to parse and then trust on every press.
+# - With a token, the button carries ~10 bytes and the action (kind, chat, timer uid)
+#   never leaves the server; a forged or stale token simply does not resolve.
+#
+# Design:
+# - token -> action tuple in an OrderedDict, LRU-bounded at MAX_TOKENS.
+# - Resolution is one dict lookup: stale tokens (evicted, or issued before a restart)
+#   are rejected without touching the timer store or the Bot API.
+#
+# Boundaries:
+# - For short-lived menus only. Buttons that must survive restarts (the Cancel button
+#   under a timer message, dashboard buttons) carry the persisted timer uid instead.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import secrets
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Tokens kept before the least recently used ones are evicted.
+MAX_TOKENS = 5_000
+
+# Random bytes per token (8 url-safe characters).
+TOKEN_BYTES = 6
+
+
+class TokenMap:
+    """Bounded LRU map of callback token -> action."""
+
+    def __init__(self, max_size: int = MAX_TOKENS) -> None:
+        self.max_size = max_size
+        self._actions: "OrderedDict[str, Tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def issue(self, *action) -> str:
+        """Register an action and return its token."""
+        token = secrets.token_urlsafe(TOKEN_BYTES)
+        while token in self._actions:
+            token = secrets.token_urlsafe(TOKEN_BYTES)
+
+        self._actions[token] = action
+        if len(self._actions) > self.max_size:
+            self._actions.popitem(last=False)
+        return token
+
+    def resolve(self, token: str) -> Optional[Tuple]:
+        """Action registered for `token` (None if unknown or evicted)."""
+        action = self._actions.get(token)
+        if action is not None:
+            self._actions.move_to_end(token)
+        return action
+
+
+_TOKENS = TokenMap()
+
+
+def issue_token(*action) -> str:
+    """Register an action in the process-wide token map."""
+    return _TOKENS.issue(*action)
+
+
+def resolve_token(token: str) -> Optional[Tuple]:
+    """Resolve a token from the process-wide token map."""
+    return _TOKENS.resolve(token)
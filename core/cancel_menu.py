@@ -0,0 +1,114 @@
+# ==================================================
+# core/cancel_menu.py — Paginated /cancel Menu Pages
+# ==================================================
+#
+# Rendered pages of the /cancel menu (button labels + timer uids), cached per chat.
+#
+# Layer: Core
+#
+# Why this exists:
+# - The menu used to carry one button per timer with no limit; with dozens of timers
+#   it runs into Telegram's inline keyboard limits and is rebuilt on every /cancel.
+#
+# Design:
+# - Pages are slices of the store's per-chat target-time index (nearest timer first).
+# - Labels show the absolute end time (MSK), so a rendered page stays valid until the
+#   chat's timer set changes; pages are cached against the store's per-chat version
+#   (core/timers_store.py) and re-rendered lazily after any add/update/remove.
+# - The cache is LRU-bounded at MAX_CHATS chats.
+#
+# Boundaries:
+# - Returns plain (label, uid) rows; keyboards and callback tokens are built in commands/cancel.py.
+#
+# ==================================================
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from core import metrics
+from core.models import TimerEntry
+from core.settings import MSK_TZ
+from core.timers_store import get_store
+
+# Timer buttons per menu page.
+PAGE_SIZE = 8
+
+# Chats whose rendered pages are kept.
+MAX_CHATS = 1_000
+
+# Longest timer text shown on a button.
+LABEL_TEXT_CHARS = 26
+
+
+class MenuPage:
+    """One rendered page of a chat's /cancel menu."""
+
+    __slots__ = ("rows", "page", "pages")
+
+    def __init__(self, rows: List[Tuple[str, str]], page: int, pages: int) -> None:
+        # (button label, timer uid), nearest timer first
+        self.rows = rows
+        self.page = page
+        self.pages = pages
+
+
+def _short(text: str, limit: int = LABEL_TEXT_CHARS) -> str:
+    text = (text or "").replace("\n", " ").strip()
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def timer_label(entry: TimerEntry) -> str:
+    """Button label of a timer: end time (MSK), text and message id."""
+    ends = datetime.fromtimestamp(entry.target_ts, MSK_TZ).strftime("%d.%m %H:%M")
+    # Keep button text short (Telegram is strict about inline keyboard limits).
+    # The message id suffix tells apart timers with the same text.
+    return f"❌ {ends} — {_short(entry.message) or 'no text'} (#{entry.message_id})"
+
+
+class CancelMenuCache:
+    """chat_id -> (timer set version, {page number: MenuPage})."""
+
+    def __init__(self, max_chats: int = MAX_CHATS) -> None:
+        self.max_chats = max_chats
+        self._chats: "OrderedDict[int, Tuple[int, Dict[int, MenuPage]]]" = OrderedDict()
+
+    def page(self, chat_id: int, page: int) -> Optional[MenuPage]:
+        """Page `page` (clamped to the valid range) of a chat's menu; None if it has no timers."""
+        store = get_store()
+        total = store.timer_count(chat_id)
+        if not total:
+            self._chats.pop(chat_id, None)
+            return None
+
+        pages = -(-total // PAGE_SIZE)
+        page = min(max(page, 0), pages - 1)
+
+        version = store.version(chat_id)
+        cached = self._chats.get(chat_id)
+        if cached is None or cached[0] != version:
+            cached = self._chats[chat_id] = (version, {})
+            if len(self._chats) > self.max_chats:
+                self._chats.popitem(last=False)
+        self._chats.move_to_end(chat_id)
+
+        rendered = cached[1].get(page)
+        if rendered is not None:
+            metrics.incr("cancel_menu.cache_hit")
+            return rendered
+
+        metrics.incr("cancel_menu.cache_miss")
+        start = page * PAGE_SIZE
+        rows = [(timer_label(e), e._uid) for e in store.page_timers(chat_id, start, start + PAGE_SIZE)]
+        rendered = cached[1][page] = MenuPage(rows, page, pages)
+        return rendered
+
+
+_MENUS = CancelMenuCache()
+
+
+def get_cancel_menu() -> CancelMenuCache:
+    """Return the process-wide /cancel menu cache."""
+    return _MENUS
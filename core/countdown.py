@@ -2,7 +2,7 @@
 # core/countdown.py — Countdown Tick Engine
 # ==================================================
 #
-# JobQueue tick callbacks that update timer messages until completion or cancellation.
+# Periodic JobQueue driver that updates all due timer messages in one batch until completion or cancellation.
 #
 # Layer: Core
 #
@@ -15,106 +15,350 @@
 # - Core must remain independent from user interaction details.
 # - Core should not import commands (top layer) to avoid circular dependencies.
 #
+# Update intervals:
+# - The text only shows what changes between updates: minutes ("~2h 15m") until the
+#   last minute, then seconds (core/formatter.format_countdown).
+# - The minimum spacing comes from the budget-driven policy in core/update_policy.py;
+#   the next update is then placed at the first moment the text actually changes,
+#   so no wakeup renders identical text.
+#
+# Flood waits:
+# - While a chat sits in the outbound penalty box (core/outbound.py), its timers are not
+#   edited at all: they are rescheduled to the end of the penalty window, so every timer
+#   of that chat resumes together with one fresh render instead of retrying edit by edit.
+#
+# Dashboards (`--board`):
+# - Due board timers are grouped by chat and rendered into the chat's dashboard message
+#   with a single edit (core/board.py); finished board timers get a short "Time is up" post.
+#
 # ==================================================
 import logging
-from datetime import datetime, timezone
+import time
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes
+from telegram.error import RetryAfter
+from telegram.ext import Application, ContextTypes
 
-from core.formatter import format_remaining, choose_interval
-from core.timers_store import remove_timer
+from core import metrics
+from core.board import board_timers, close_board, get_board, mark_dirty, pop_dirty, render_board, render_hash
+from core.models import TimerState
+from core.formatter import choose_interval, format_countdown, next_countdown_update
+from core.update_policy import get_update_policy
+from core.outbound import Priority, RequestDropped, get_penalty_box
+from core.pins import unpin_message
+from core.timer_engine import TICK_SECONDS, get_engine
+from core.timers_store import discard_timer, update_timer
 
 logger = logging.getLogger(__name__)
 
 
-def _cancel_kb(message_id: int) -> InlineKeyboardMarkup:
-    """Core utility:  cancel kb."""
+def cancel_keyboard(entry) -> InlineKeyboardMarkup:
+    """Cancel button under a timer message.
+
+    Callback data carries the timer uid, so the keyboard can be sent together with
+    the first message (before its message_id is known).
+    """
     return InlineKeyboardMarkup(
-        [[InlineKeyboardButton("❌ Cancel", callback_data=f"cancel_timer:{message_id}")]]
+        [[InlineKeyboardButton("❌ Cancel", callback_data=f"cancel_timer:{entry._uid}")]]
     )
 
 
-async def countdown_tick(context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Core utility: countdown tick."""
-    entry = context.job.data
+def render_countdown(entry, remaining: int) -> str:
+    """Countdown text of a timer message."""
+    text = f"⏰ Time left: {format_countdown(remaining)}"
+    if entry.message:
+        text += f"\n{entry.message}"
+    return text
+
+
+def _claim_finish(entry) -> bool:
+    """Claim a timer for finalization (ACTIVE -> FINISHING, single flight).
+
+    The entry leaves the store (and its persistence backend) right away, so a cancel
+    arriving while the final edit is in flight finds nothing to cancel.
+    """
+    if entry.state is not TimerState.ACTIVE:
+        return False
+    entry.state = TimerState.FINISHING
+    discard_timer(entry)
+    return True
+
 
+def _deferred_until(entry) -> float | None:
+    """End of the chat's flood-wait window (capped at the timer's end), or None."""
+    until = get_penalty_box().blocked_until(entry.chat_id)
+    if until is None:
+        return None
+    metrics.incr("countdown.deferred")
+    return min(until, entry.target_ts)
+
+
+async def _process_entry(bot, entry) -> float | None:
+    """Update one timer message.
+
+    Returns:
+        Epoch timestamp of the next update, or None when the timer is done.
+    """
     # Backwards compatibility: older payloads used `text` instead of `message`.
     entry_text = getattr(entry, "message", None)
     if entry_text is None:
         entry_text = getattr(entry, "text", "")
 
-    # If the timer was marked as cancelled elsewhere, stop the job.
-    if getattr(entry, "cancelled", False):
-        return
+    # Cancelled (or finishing) elsewhere: stop updating it.
+    if entry.state is not TimerState.ACTIVE:
+        return None
 
-    now = datetime.now(timezone.utc)
-    remaining = int((entry.target_time - now).total_seconds())
+    now = time.time()
+    remaining = int(entry.target_ts - now)
 
     # ---- FINISH ----
     if remaining <= 0:
+        if not _claim_finish(entry):
+            return None
+
         # If this timer message was pinned, unpin it on completion
         pin_id = getattr(entry, "pin_message_id", None)
         if pin_id:
-            try:
-                await context.bot.unpin_chat_message(chat_id=entry.chat_id, message_id=pin_id)
-            except Exception as e:
-                logger.warning("Unpin on finish failed: %s", e)
+            await unpin_message(bot, entry.chat_id, pin_id)
 
         try:
             text = "⏰ Time is up!"
             if entry_text:
                 text += f"\n{entry_text}"
-            await context.bot.edit_message_text(
+            await bot.edit_message_text(
                 chat_id=entry.chat_id,
                 message_id=entry.message_id,
                 text=text,
+                rate_limit_args={"priority": Priority.FINAL},
             )
         except Exception as e:
             logger.warning("Finalize failed: %s", e)
 
-        # Remove from the in-memory store.
-        try:
-            remove_timer(entry.chat_id, entry.message_id)
-        except Exception:
-            pass
+        entry.state = TimerState.FINISHED
+        return None
 
-        return
+    # ---- FLOOD WAIT ----
+    deferred = _deferred_until(entry)
+    if deferred is not None:
+        return deferred
 
     # ---- BUILD TEXT ----
-    new_text = f"⏰ Time left: {format_remaining(remaining)}"
-    if entry_text:
-        new_text += f"\n{entry_text}"
+    new_text = render_countdown(entry, remaining)
+
+    # Next update: when the text changes again, but not sooner than the policy allows.
+    next_due = next_countdown_update(entry.target_ts, now, get_update_policy().interval(entry, remaining))
 
     # Avoid re-sending the exact same text (Telegram returns 'message is not modified').
-    if getattr(entry, "last_text", None) == new_text:
-        delay = choose_interval(remaining)
-        context.job_queue.run_once(countdown_tick, delay, data=entry, name=entry.job_name)
-        return
+    text_hash = hash(new_text)
+    if entry.last_hash == text_hash:
+        return next_due
 
     try:
-        await context.bot.edit_message_text(
+        await bot.edit_message_text(
             chat_id=entry.chat_id,
             message_id=entry.message_id,
             text=new_text,
-            reply_markup=_cancel_kb(entry.message_id),
+            reply_markup=cancel_keyboard(entry),
+            rate_limit_args={
+                "priority": Priority.COUNTDOWN,
+                # Re-checked at admission: a cancel/finish while queued drops this edit,
+                # so it can never overwrite the final text.
+                "admit_if": lambda: entry.state is TimerState.ACTIVE,
+            },
         )
-        entry.last_text = new_text
+        entry.last_hash = text_hash
+    except RequestDropped:
+        # Chat is saturated (or the timer stopped while queued): skip this edit.
+        pass
+    except RetryAfter:
+        # The scheduler has put the chat in the penalty box: wait out the window.
+        deferred = _deferred_until(entry)
+        if deferred is not None:
+            return deferred
     except Exception as e:
         msg = str(e).lower()
         logger.warning("Edit failed: %s", e)
-        if "message to edit not found" in msg:
+        if "message to edit not found" in msg and _claim_finish(entry):
             # The message was deleted / unexpected ID: stop the timer to avoid an infinite loop.
-            try:
-                remove_timer(entry.chat_id, entry.message_id)
-            except Exception:
-                pass
+            entry.state = TimerState.FINISHED
+            return None
+
+    return next_due
+
+
+async def _run_entry(bot, engine, entry) -> None:
+    """Process one due timer and hand it back to the engine (or release it)."""
+    try:
+        next_due = await _process_entry(bot, entry)
+    except Exception:
+        logger.exception("Countdown update crashed for %s", entry.job_name)
+        next_due = time.time() + choose_interval(0)
+
+    if next_due is None:
+        engine.discard(entry)
+    else:
+        engine.reschedule(entry, next_due)
+
+
+# ==================================================
+# Dashboards
+# ==================================================
+async def _finish_board_entry(bot, entry) -> None:
+    """Announce a finished board timer (its line simply disappears from the dashboard)."""
+    text = "⏰ Time is up!"
+    if entry.message:
+        text += f"\n{entry.message}"
+    try:
+        await bot.send_message(
+            chat_id=entry.chat_id,
+            text=text,
+            rate_limit_args={"priority": Priority.FINAL},
+        )
+    except Exception as e:
+        logger.warning("Board finish message failed: %s", e)
+    entry.state = TimerState.FINISHED
+
+
+async def _refresh_board(bot, chat_id: int) -> None:
+    """Re-render a chat's dashboard with one edit (skipped if nothing changed)."""
+    state = get_board(chat_id)
+    if state is None or state.message_id is None:
+        # Not sent yet (the command is still replying) or already closed.
+        return
+
+    entries = board_timers(chat_id)
+    text, keyboard = render_board(entries, time.time())
+    fingerprint = render_hash(text, keyboard)
+    if fingerprint == state.last_hash:
+        return
+
+    priority = Priority.COUNTDOWN if entries else Priority.FINAL
+    try:
+        await bot.edit_message_text(
+            chat_id=chat_id,
+            message_id=state.message_id,
+            text=text,
+            reply_markup=keyboard,
+            rate_limit_args={"priority": priority},
+        )
+        state.last_hash = fingerprint
+    except RequestDropped:
+        # Saturated: the next due board timer re-renders.
+        return
+    except Exception as e:
+        logger.warning("Board edit failed for chat %s: %s", chat_id, e)
+        if "message to edit not found" in str(e).lower() and entries:
+            # The dashboard was deleted: post a new one and move every board timer to it.
+            sent = await bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                reply_markup=keyboard,
+                rate_limit_args={"priority": Priority.FINAL},
+            )
+            state.message_id, state.pinned, state.last_hash = sent.message_id, False, fingerprint
+            for entry in entries:
+                entry.message_id, entry.pin_message_id = sent.message_id, None
+                update_timer(entry)
+        elif entries:
             return
 
-    delay = choose_interval(remaining)
-    context.job_queue.run_once(
+    if not entries:
+        # Last timer gone: the dashboard stays as "No active timers", unpinned.
+        if state.pinned:
+            await unpin_message(bot, chat_id, state.message_id)
+        close_board(chat_id)
+
+
+async def _run_board(bot, engine, chat_id: int, due: list) -> None:
+    """Process a chat's due board timers, then refresh its dashboard once."""
+    state = get_board(chat_id)
+    if state is not None and state.busy:
+        # Previous refresh still in flight: retry these on the next tick.
+        retry = time.time() + TICK_SECONDS
+        for entry in due:
+            engine.reschedule(entry, retry)
+        mark_dirty(chat_id)
+        return
+
+    if state is not None:
+        state.busy = True
+    try:
+        now = time.time()
+        for entry in due:
+            if entry.state is not TimerState.ACTIVE:
+                engine.discard(entry)
+                continue
+            if entry.target_ts <= now:
+                engine.discard(entry)
+                if _claim_finish(entry):
+                    await _finish_board_entry(bot, entry)
+                continue
+
+            next_due = _deferred_until(entry)
+            if next_due is None:
+                interval = get_update_policy().interval(entry, int(entry.target_ts - now))
+                next_due = next_countdown_update(entry.target_ts, now, interval)
+            engine.reschedule(entry, next_due)
+
+        if get_penalty_box().blocked_until(chat_id) is None:
+            await _refresh_board(bot, chat_id)
+        else:
+            mark_dirty(chat_id)
+    except Exception:
+        logger.exception("Board update crashed for chat %s", chat_id)
+    finally:
+        if state is not None:
+            state.busy = False
+
+
+async def countdown_tick(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue driver: start an update for every due timer.
+
+    Updates run as separate tasks and are not awaited here: a final edit queued behind
+    a group's rate limit must not hold up the next tick for every other chat.
+    Popped timers are out of the heap until their task reschedules them, so a slow
+    update is never started twice.
+    """
+    engine = get_engine()
+    now = time.time()
+    get_update_policy().maybe_recompute(engine.entries(), now)
+
+    boards: dict = {}
+    for entry in engine.pop_due(now):
+        if entry.board:
+            boards.setdefault(entry.chat_id, []).append(entry)
+            continue
+        context.application.create_task(
+            _run_entry(context.bot, engine, entry),
+            name=f"countdown:{entry._uid}",
+        )
+
+    # Dashboards: one task (and at most one edit) per chat.
+    for chat_id in pop_dirty():
+        boards.setdefault(chat_id, [])
+    for chat_id, due in boards.items():
+        context.application.create_task(
+            _run_board(context.bot, engine, chat_id, due),
+            name=f"countdown_board:{chat_id}",
+        )
+
+
+# ==================================================
+# Driver registration
+# ==================================================
+#
+# A single repeating job replaces the old "one run_once job per tick per timer" scheme.
+#
+# coalesce/max_instances:
+# - The driver itself only pops due timers and spawns tasks, so a run is short;
+#   if one is delayed anyway, APScheduler skips overlapping runs instead of stacking them up.
+#
+def setup_countdown_engine(application: Application) -> None:
+    """Register the periodic countdown driver in the application's JobQueue."""
+    application.job_queue.run_repeating(
         countdown_tick,
-        delay,
-        data=entry,
-        name=entry.job_name,  # IMPORTANT: keep the job name stable
-    )
\ No newline at end of file
+        interval=TICK_SECONDS,
+        first=TICK_SECONDS,
+        name="countdown_engine",
+        job_kwargs={"coalesce": True, "max_instances": 1},
+    )
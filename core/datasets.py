@@ -0,0 +1,193 @@
+# ==================================================
+# core/datasets.py — Hot-Reloadable Dataset Registry
+# ==================================================
+#
+# One place that owns every file-backed dataset (quotes, holidays, birthdays, ...):
+# loads them at startup, watches their files, and swaps in rebuilt snapshots.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Datasets used to be loaded at different times (once in bot.main, lazily into
+#   bot_data, or on every call), so edits needed a restart or were picked up silently
+#   and at request time.
+#
+# Design:
+# - Each dataset is registered by the service that owns it: a name, a function listing
+#   its files (so new files in a folder count as a change) and a loader that builds an
+#   immutable snapshot (list, dict, index, ...).
+# - Handlers call `dataset.get()`: one attribute read, no I/O. A snapshot is never
+#   mutated; a reload builds a new one and swaps the reference, so a handler sees either
+#   the old or the new snapshot, never a mix.
+# - The watch job (`setup_dataset_watch`) compares file stamps (mtime + size) every
+#   WATCH_INTERVAL seconds and rebuilds only the datasets that changed, in a worker
+#   thread (`asyncio.to_thread`), so the event loop never blocks on parsing.
+# - /reload (commands/reload.py) goes through the same path.
+# - A failing loader keeps the previous snapshot (logged).
+#
+# Boundaries:
+# - Generic: knows nothing about the datasets themselves. Services register them.
+# - Polling, not inotify: a handful of files checked every 30 s costs nothing and works
+#   the same on every platform and on mounted volumes.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from telegram.ext import Application, ContextTypes
+
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How often the watch job checks file stamps (seconds).
+WATCH_INTERVAL = 30
+
+# (path, mtime_ns, size) per file; missing files are stamped (path, 0, -1).
+Stamp = Tuple[Tuple[str, int, int], ...]
+
+
+def file_stamp(paths: Iterable[str]) -> Stamp:
+    """Cheap change fingerprint of a set of files."""
+    stamp = []
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append((path, 0, -1))
+            continue
+        stamp.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+class Dataset(Generic[T]):
+    """One file-backed dataset and its current snapshot."""
+
+    def __init__(self, name: str, files: Callable[[], Iterable[str]], loader: Callable[[], T]) -> None:
+        self.name = name
+        self.files = files
+        self.loader = loader
+        self._value: Optional[T] = None
+        self._stamp: Optional[Stamp] = None
+        self._loaded = False
+        self.loaded_at = 0.0
+
+    def get(self) -> T:
+        """Current snapshot (loaded synchronously on first use if startup did not)."""
+        if not self._loaded:
+            self.load()
+        return self._value  # type: ignore[return-value]
+
+    def changed(self) -> bool:
+        return file_stamp(self.files()) != self._stamp
+
+    def _swap(self, value: T, stamp: Stamp) -> None:
+        self._value, self._stamp = value, stamp
+        self._loaded = True
+        self.loaded_at = time.time()
+
+    def load(self) -> None:
+        """Build and swap in a snapshot on the calling thread."""
+        # Stamp first: an edit made while loading is picked up by the next check.
+        stamp = file_stamp(self.files())
+        self._swap(self.loader(), stamp)
+
+    async def rebuild(self) -> bool:
+        """Build a snapshot in a worker thread and swap it in; False if the loader failed."""
+        started = time.perf_counter()
+        stamp = file_stamp(self.files())
+        try:
+            value = await asyncio.to_thread(self.loader)
+        except Exception:
+            logger.exception("Reloading dataset %s failed; keeping the previous snapshot", self.name)
+            metrics.incr("datasets.reload_failed")
+            # Do not retry the same broken files on every check; the next edit triggers a retry.
+            self._stamp = stamp
+            return False
+
+        self._swap(value, stamp)
+        metrics.incr("datasets.reloaded")
+        logger.info("Reloaded dataset %s in %.1f ms", self.name, (time.perf_counter() - started) * 1000)
+        return True
+
+
+class DatasetRegistry:
+    """Registered datasets, loaded at startup and reloaded when their files change."""
+
+    def __init__(self) -> None:
+        self._datasets: Dict[str, Dataset] = {}
+        self._reloading: Optional[asyncio.Task] = None
+
+    def register(self, name: str, files: Callable[[], Iterable[str]], loader: Callable[[], T]) -> Dataset[T]:
+        dataset: Dataset[T] = Dataset(name, files, loader)
+        self._datasets[name] = dataset
+        return dataset
+
+    def names(self) -> List[str]:
+        return list(self._datasets)
+
+    def load_all(self) -> None:
+        """Load every dataset that is not loaded yet (startup)."""
+        for dataset in self._datasets.values():
+            if not dataset._loaded:
+                dataset.load()
+
+    async def reload(self, force: bool = False) -> List[str]:
+        """Rebuild changed datasets (all of them if `force`); returns the reloaded names.
+
+        Single-flight: while a reload runs, further calls wait for it instead of starting another.
+        """
+        if self._reloading is not None and not self._reloading.done():
+            return await asyncio.shield(self._reloading)
+
+        self._reloading = asyncio.ensure_future(self._reload(force))
+        return await asyncio.shield(self._reloading)
+
+    async def _reload(self, force: bool) -> List[str]:
+        reloaded = []
+        for dataset in list(self._datasets.values()):
+            if (force or dataset.changed()) and await dataset.rebuild():
+                reloaded.append(dataset.name)
+        return reloaded
+
+
+# ==================================================
+# Process-local registry
+# ==================================================
+_DATASETS = DatasetRegistry()
+
+
+def get_datasets() -> DatasetRegistry:
+    """Return the process-wide dataset registry."""
+    return _DATASETS
+
+
+def register_dataset(name: str, files: Callable[[], Iterable[str]], loader: Callable[[], T]) -> Dataset[T]:
+    """Register a file-backed dataset in the process-wide registry."""
+    return _DATASETS.register(name, files, loader)
+
+
+# ==================================================
+# Watch job
+# ==================================================
+async def watch_datasets(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback: rebuild datasets whose files changed."""
+    await _DATASETS.reload()
+
+
+def setup_dataset_watch(application: Application) -> None:
+    """Register the repeating dataset watch job."""
+    application.job_queue.run_repeating(
+        watch_datasets,
+        interval=WATCH_INTERVAL,
+        first=WATCH_INTERVAL,
+        name="dataset_watch",
+    )
@@ -0,0 +1,121 @@
+# ==================================================
+# core/dates.py — Fast Date Parsing for Fixed Formats
+# ==================================================
+#
+# Exception-free parsers for the handful of date formats the bot reads, shared by
+# commands (services/parser.py) and data loaders (holidays, birthdays).
+#
+# Layer: Core
+#
+# Why this exists:
+# - `datetime.strptime` is slow (locale-aware format interpretation on every call),
+#   and trying several formats means raising and catching ValueError per miss.
+# - Holiday/birthday files hold hundreds of "MM-DD" strings parsed on every load.
+#
+# Formats:
+#   YYYY-MM-DD        parse_date
+#   DD.MM.YYYY        parse_date (also DD-MM-YYYY, 1-digit day/month allowed)
+#   HH:MM[:SS]        parse_time
+#   MM-DD             parse_mmdd          -> (month, day)
+#   MM-DD:MM-DD       parse_mmdd_range    -> ((month, day), (month, day))
+#
+# Conventions:
+# - User-input parsers (`parse_date`, `parse_time`) raise ValueError, like strptime.
+# - Data parsers (`parse_mmdd*`) return None for malformed values so loaders can skip
+#   them without try/except.
+# - Digits are ASCII only. "02-29" is a valid MM-DD; see `next_occurrence`.
+#
+# Boundaries:
+# - Pure functions, no I/O.
+#
+# ==================================================
+from __future__ import annotations
+
+import calendar
+import re
+from datetime import date, datetime, tzinfo
+from typing import Optional, Tuple
+
+MonthDay = Tuple[int, int]
+
+# Longest day of each month (February counts its leap day).
+_MAX_DAY = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})([.-])(\d{1,2})\5(\d{4})", re.ASCII)
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?", re.ASCII)
+
+
+def _digits(text: str) -> bool:
+    return text.isascii() and text.isdigit()
+
+
+# ==================================================
+# Full dates / times (user input)
+# ==================================================
+def parse_date(text: str) -> date:
+    """Parse "YYYY-MM-DD", "DD.MM.YYYY" or "DD-MM-YYYY" into a date."""
+    m = _DATE_RE.fullmatch(text)
+    if m is None:
+        raise ValueError(f"Bad date: {text!r}")
+    if m.group(1):
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    return date(int(m.group(7)), int(m.group(6)), int(m.group(4)))
+
+
+def parse_time(text: str) -> Tuple[int, int, int]:
+    """Parse "HH:MM" or "HH:MM:SS" into (hour, minute, second)."""
+    m = _TIME_RE.fullmatch(text)
+    if m is None:
+        raise ValueError(f"Bad time: {text!r}")
+    hour, minute, second = int(m.group(1)), int(m.group(2)), int(m.group(3) or 0)
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError(f"Bad time: {text!r}")
+    return hour, minute, second
+
+
+def parse_datetime(date_text: str, time_text: str, tz: Optional[tzinfo] = None) -> datetime:
+    """Combine `parse_date` and `parse_time` into a datetime (aware if `tz` is given)."""
+    d = parse_date(date_text)
+    hour, minute, second = parse_time(time_text)
+    return datetime(d.year, d.month, d.day, hour, minute, second, tzinfo=tz)
+
+
+# ==================================================
+# Month-day values (data files)
+# ==================================================
+def parse_mmdd(text: str) -> Optional[MonthDay]:
+    """Parse "MM-DD" into (month, day); None if malformed or impossible."""
+    s = text.strip()
+    if len(s) != 5 or s[2] != "-":
+        return None
+    mm, dd = s[:2], s[3:]
+    if not (_digits(mm) and _digits(dd)):
+        return None
+    month, day = int(mm), int(dd)
+    if not (1 <= month <= 12 and 1 <= day <= _MAX_DAY[month]):
+        return None
+    return month, day
+
+
+def parse_mmdd_range(text: str) -> Optional[Tuple[MonthDay, MonthDay]]:
+    """Parse "MM-DD:MM-DD" into ((month, day), (month, day)); None if malformed."""
+    start, sep, end = text.partition(":")
+    if not sep:
+        return None
+    first = parse_mmdd(start)
+    last = parse_mmdd(end)
+    if first is None or last is None:
+        return None
+    return first, last
+
+
+def next_occurrence(month: int, day: int, today: date) -> date:
+    """First date on or after `today` falling on month/day ("02-29" waits for a leap year)."""
+    year = today.year
+    if month == 2 and day == 29:
+        while not calendar.isleap(year) or date(year, 2, 29) < today:
+            year += 1
+        return date(year, 2, 29)
+
+    occurrence = date(year, month, day)
+    return occurrence if occurrence >= today else date(year + 1, month, day)
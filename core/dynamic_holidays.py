@@ -6,6 +6,19 @@
 #
 # Layer: Core
 #
+# Design:
+# - Holidays are declared as rules (RULES below), one per holiday:
+#     Easter          Western or Orthodox Easter ± offset days ("Good Friday" = -2)
+#     NthWeekday      n-th weekday of a month ("Thanksgiving" = 4th Thursday of November)
+#     LastWeekday     last weekday of a month ("Memorial Day" = last Monday of May)
+#     FixedDate       a month/day moved by a per-weekday shift (on-or-after / on-or-before
+#                     a weekday, or weekend "observed" days)
+# - `holidays_in_year(year)` materializes every rule for one year into a date-sorted
+#   table, memoized for a rolling window of YEARS_CACHED years; lookups for this year
+#   and the next cost one cache hit.
+# - Everything is computed from the dates passed in (never the clock), so past and
+#   future years can be queried deterministically.
+#
 # Responsibilities:
 # - Provide reusable, testable logic and infrastructure helpers
 # - Avoid direct Telegram API usage (except JobQueue callback signatures where required)
@@ -16,7 +29,19 @@
 # - Core should not import commands (top layer) to avoid circular dependencies.
 #
 # ==================================================
-from datetime import datetime, timedelta, date
+from __future__ import annotations
+
+import calendar
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Years kept in the per-year table cache (this year, next year, and a few queried ones).
+YEARS_CACHED = 8
+
+MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = range(7)
 
 # ==================================================
 # Western (Catholic) Easter calculation
@@ -55,83 +80,180 @@ def _easter_western(year: int) -> date:
     return date(year, month, day)
 
 # ==================================================
-# Orthodox Easter calculation (approximation)
+# Orthodox Easter calculation
 # ==================================================
 #
-# Orthodox Easter is traditionally calculated
-# using the Julian calendar.
-#
-# For bot-level accuracy, we approximate Orthodox
-# Easter by adding a 13-day offset to Western Easter.
+# Orthodox Easter is calculated with the Julian computus
+# and converted to the Gregorian calendar.
 #
-# This approximation is sufficient for:
-# - holiday notifications
-# - calendar-style usage
+# The Julian calendar lags by 13 days in 1900–2099
+# (the lag grows by one day in every century year
+# that is not a Gregorian leap year).
 #
 def _easter_orthodox(year: int) -> date:
     """
-    Approximate Orthodox Easter by applying
-    the Julian-to-Gregorian calendar offset.
+    Calculate the date of Orthodox Easter
+    using the Julian computus.
 
     Returns:
-        datetime.date: Approximate Orthodox Easter date
+        datetime.date: Orthodox Easter Sunday (Gregorian calendar)
     """
-    western = _easter_western(year)
-    return western + timedelta(days=13)
+    a = year % 4
+    b = year % 7
+    c = year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+
+    month = (d + e + 114) // 31
+    day = ((d + e + 114) % 31) + 1
+
+    julian_lag = year // 100 - year // 400 - 2
+    return date(year, month, day) + timedelta(days=julian_lag)
 
 # ==================================================
-# Public API: Dynamic holidays
+# Rules
 # ==================================================
 #
-# Returns dynamically calculated holidays in a
-# normalized dictionary format.
-#
-# Current dynamic holidays:
-# - Catholic Easter
-# - Orthodox Easter
+# Each rule knows how to find its date in a given year
+# (None if it has no date that year).
 #
-# If the calculated dates for the current year
-# are already in the past, the function automatically
-# shifts calculations to the next year.
+# Weekday shifts are 7-tuples of day offsets indexed by
+# the weekday of the base date (Monday = 0).
 #
-def get_dynamic_holidays() -> list[dict]:
-    """
-    Return upcoming dynamic holidays.
-
-    Each holiday dictionary contains:
-    - full_date: YYYY-MM-DD
-    - date: MM-DD
-    - name: Human-readable holiday name
-    - countries: Region / religion identifiers
-    - categories: Holiday categories
-    """
+Shift = Tuple[int, int, int, int, int, int, int]
+
+NO_SHIFT: Shift = (0, 0, 0, 0, 0, 0, 0)
+
+# Weekend dates observed on the nearest weekday (Saturday -> Friday, Sunday -> Monday).
+OBSERVED: Shift = (0, 0, 0, 0, 0, -1, 1)
+
+
+def on_or_after(weekday: int) -> Shift:
+    """Shift to the first `weekday` on or after the base date."""
+    return tuple((weekday - wd) % 7 for wd in range(7))  # type: ignore[return-value]
+
+
+def on_or_before(weekday: int) -> Shift:
+    """Shift to the last `weekday` on or before the base date."""
+    return tuple(-((wd - weekday) % 7) for wd in range(7))  # type: ignore[return-value]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Rule(ABC):
+    name: str
+    countries: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def occurrence(self, year: int) -> Optional[date]:
+        """Date of the holiday in `year` (None if it has none that year)."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class Easter(Rule):
+    offset: int = 0
+    orthodox: bool = False
+
+    def occurrence(self, year: int) -> Optional[date]:
+        easter = _easter_orthodox(year) if self.orthodox else _easter_western(year)
+        return easter + timedelta(days=self.offset)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NthWeekday(Rule):
+    month: int
+    weekday: int
+    n: int
+
+    def occurrence(self, year: int) -> Optional[date]:
+        first = date(year, self.month, 1).weekday()
+        day = 1 + (self.weekday - first) % 7 + 7 * (self.n - 1)
+        if day > calendar.monthrange(year, self.month)[1]:
+            return None
+        return date(year, self.month, day)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LastWeekday(Rule):
+    month: int
+    weekday: int
+
+    def occurrence(self, year: int) -> Optional[date]:
+        last = date(year, self.month, calendar.monthrange(year, self.month)[1])
+        return last - timedelta(days=(last.weekday() - self.weekday) % 7)
+
+
+@dataclass(frozen=True, kw_only=True)
+class FixedDate(Rule):
+    month: int
+    day: int
+    shift: Shift = NO_SHIFT
+
+    def occurrence(self, year: int) -> Optional[date]:
+        if self.month == 2 and self.day == 29 and not calendar.isleap(year):
+            return None
+        base = date(year, self.month, self.day)
+        return base + timedelta(days=self.shift[base.weekday()])
+
+
+_RELIGIOUS = ("Religious",)
+_FEDERAL = ("Federal",)
+
+RULES: Tuple[Rule, ...] = (
+    # Easter cycle (Western)
+    Easter(name="Shrove Tuesday", offset=-47, countries=("christian",), categories=_RELIGIOUS),
+    Easter(name="Ash Wednesday", offset=-46, countries=("catholic",), categories=_RELIGIOUS),
+    Easter(name="Palm Sunday", offset=-7, countries=("christian",), categories=_RELIGIOUS),
+    Easter(name="Good Friday", offset=-2, countries=("christian",), categories=_RELIGIOUS),
+    Easter(name="Catholic Easter", countries=("catholic",), categories=_RELIGIOUS),
+    Easter(name="Ascension Day", offset=39, countries=("christian",), categories=_RELIGIOUS),
+    Easter(name="Pentecost", offset=49, countries=("christian",), categories=_RELIGIOUS),
+    # Easter cycle (Orthodox)
+    Easter(name="Orthodox Easter", orthodox=True, countries=("orthodox",), categories=_RELIGIOUS),
+    # n-th weekday of a month
+    NthWeekday(name="Martin Luther King Jr. Day", month=1, weekday=MONDAY, n=3, countries=("usa",), categories=_FEDERAL),
+    NthWeekday(name="Presidents' Day", month=2, weekday=MONDAY, n=3, countries=("usa",), categories=_FEDERAL),
+    NthWeekday(name="Mother's Day", month=5, weekday=SUNDAY, n=2, countries=("usa",), categories=("Appreciation",)),
+    NthWeekday(name="Father's Day", month=6, weekday=SUNDAY, n=3, countries=("usa",), categories=("Appreciation",)),
+    NthWeekday(name="Labor Day", month=9, weekday=MONDAY, n=1, countries=("usa",), categories=_FEDERAL),
+    NthWeekday(name="Columbus Day", month=10, weekday=MONDAY, n=2, countries=("usa",), categories=_FEDERAL),
+    NthWeekday(name="Thanksgiving", month=11, weekday=THURSDAY, n=4, countries=("usa",), categories=_FEDERAL),
+    # last weekday of a month
+    LastWeekday(name="Memorial Day", month=5, weekday=MONDAY, countries=("usa",), categories=_FEDERAL),
+    LastWeekday(name="Spring Bank Holiday", month=5, weekday=MONDAY, countries=("uk",), categories=_FEDERAL),
+    LastWeekday(name="Summer Bank Holiday", month=8, weekday=MONDAY, countries=("uk",), categories=_FEDERAL),
+    # fixed dates moved to a weekday
+    FixedDate(name="Victoria Day", month=5, day=24, shift=on_or_before(MONDAY), countries=("canada",), categories=_FEDERAL),
+    FixedDate(name="Midsummer Eve", month=6, day=19, shift=on_or_after(FRIDAY), countries=("sweden",), categories=("Cultural",)),
+    FixedDate(name="Election Day", month=11, day=2, shift=on_or_after(TUESDAY), countries=("usa",), categories=("Special Interest",)),
+)
+
+# ==================================================
+# Per-year table
+# ==================================================
+@dataclass(frozen=True)
+class DynamicHoliday:
+    day: date
+    name: str
+    countries: Tuple[str, ...]
+    categories: Tuple[str, ...]
+
+
+@lru_cache(maxsize=YEARS_CACHED)
+def holidays_in_year(year: int) -> Tuple[DynamicHoliday, ...]:
+    """Every rule's occurrence in `year`, sorted by date (rule order within a day)."""
+    occurrences = []
+    for rule in RULES:
+        day = rule.occurrence(year)
+        if day is not None and day.year == year:
+            occurrences.append(DynamicHoliday(day, rule.name, rule.countries, rule.categories))
+    occurrences.sort(key=lambda h: h.day)
+    return tuple(occurrences)
+
 
-    today = datetime.now().date()
-    year = today.year
-
-    catholic = _easter_western(year)
-    orthodox = _easter_orthodox(year)
-
-    # If both holidays already passed this year,
-    # calculate them for the next year
-    if max(catholic, orthodox) < today:
-        year += 1
-        catholic = _easter_western(year)
-        orthodox = _easter_orthodox(year)
-
-    return [
-        {
-            "full_date": catholic.strftime("%Y-%m-%d"),
-            "date": catholic.strftime("%m-%d"),
-            "name": "Catholic Easter",
-            "countries": ["catholic"],
-            "categories": ["Religious"],
-        },
-        {
-            "full_date": orthodox.strftime("%Y-%m-%d"),
-            "date": orthodox.strftime("%m-%d"),
-            "name": "Orthodox Easter",
-            "countries": ["orthodox"],
-            "categories": ["Religious"],
-        },
-    ]
\ No newline at end of file
+def holidays_from(today: date) -> List[DynamicHoliday]:
+    """Occurrences in the 12 months starting at `today` (today included), in date order."""
+    key = (today.month, today.day)
+    return [h for h in holidays_in_year(today.year) if h.day >= today] + [
+        h for h in holidays_in_year(today.year + 1) if (h.day.month, h.day.day) < key
+    ]
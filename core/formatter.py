@@ -41,28 +41,81 @@ def format_remaining_time(seconds: int) -> str:
     return " ".join(parts)
 
 
+# Countdown text switches from minutes to seconds below this many seconds.
+SECONDS_PRECISION_BELOW = 60
+
+# Remaining time is truncated to whole seconds, so the text changes just *after* a boundary.
+_AFTER = 1e-3
+
+
+def format_countdown(seconds: int) -> str:
+    """Countdown text whose precision matches how often it is refreshed.
+
+    Full seconds in the last minute ('42s'), rounded-up minutes before that
+    ('~2h 15m', '~1d 0h 05m', '~3m').
+    """
+    s = max(0, int(seconds))
+    if s < SECONDS_PRECISION_BELOW:
+        return format_remaining_time(s)
+
+    minutes = -(-s // 60)
+    days, minutes = divmod(minutes, 1440)
+    hours, minutes = divmod(minutes, 60)
+
+    if days:
+        return f"~{days}d {hours}h {minutes:02d}m"
+    if hours:
+        return f"~{hours}h {minutes:02d}m"
+    return f"~{minutes}m"
+
+
+def next_display_change(target_ts: float, now: float) -> float:
+    """Epoch time at which `format_countdown(int(target_ts - t))` first differs from its value at `now`."""
+    remaining = int(target_ts - now)
+    if remaining <= 0:
+        return now
+    if remaining < SECONDS_PRECISION_BELOW:
+        return target_ts - remaining + _AFTER
+
+    minutes = -(-remaining // 60)
+    # Either the rounded-up minute count drops, or the text switches to seconds.
+    return min(target_ts - 60 * (minutes - 1) - 1, target_ts - SECONDS_PRECISION_BELOW) + _AFTER
+
+
+def next_countdown_update(target_ts: float, now: float, min_interval: float) -> float:
+    """First moment, at least `min_interval` after `now`, at which the countdown text changes.
+
+    Wakeups in between would render identical text, so they are skipped entirely.
+    A slow interval never skips the switch to seconds: the last minute starts on time.
+    """
+    earliest = now + min_interval
+    if int(target_ts - now) >= SECONDS_PRECISION_BELOW:
+        earliest = min(earliest, target_ts - SECONDS_PRECISION_BELOW + _AFTER)
+    if earliest >= target_ts:
+        return target_ts
+
+    change = next_display_change(target_ts, now)
+    if change >= earliest:
+        return change
+
+    # The text changes before `earliest`: refresh at `earliest` if it differs there too.
+    if format_countdown(int(target_ts - earliest)) != format_countdown(int(target_ts - now)):
+        return earliest
+    return next_display_change(target_ts, earliest)
+
+
 def choose_update_interval(remaining_seconds: int) -> int:
     """
     How often we update the countdown message.
+
+    Matches the precision of `format_countdown`: every second in the last minute,
+    once a minute before that (the text only shows minutes there).
     """
     r = int(remaining_seconds)
 
-    if r <= 0:
-        return 1
-
-    # < 1 minute -> every 1 second
-    if r < 60:
+    if r < SECONDS_PRECISION_BELOW:
         return 1
 
-    # 1..10 minutes -> every 5 seconds
-    if r < 10 * 60:
-        return 5
-
-    # 10..60 minutes -> every 30 seconds
-    if r < 60 * 60:
-        return 30
-
-    # >= 1 hour -> every 60 seconds
     return 60
 
 
@@ -0,0 +1,79 @@
+# ==================================================
+# core/metrics.py — In-Process Counters
+# ==================================================
+#
+# Tiny process-local metrics: named counters and timings plus a periodic log line.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Rate limiting, flood waits and deferred edits are invisible in normal logs.
+# - A few counters dumped every few minutes are enough to see how often they happen.
+#
+# Boundaries:
+# - No external metrics backend; values reset on restart.
+# - Counter names are dotted strings, e.g. "outbound.retry_after".
+# - Timings keep count / average / max only (no histograms).
+#
+# ==================================================
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import DefaultDict, Dict, List
+
+from telegram.ext import Application, ContextTypes
+
+logger = logging.getLogger(__name__)
+
+# How often the counters are written to the log (seconds).
+LOG_INTERVAL = 600
+
+_COUNTERS: DefaultDict[str, int] = defaultdict(int)
+# name -> [count, total seconds, max seconds]
+_TIMINGS: Dict[str, List[float]] = {}
+
+
+def incr(name: str, value: int = 1) -> None:
+    """Increase a named counter."""
+    _COUNTERS[name] += value
+
+
+def observe(name: str, seconds: float) -> None:
+    """Record one duration."""
+    timing = _TIMINGS.get(name)
+    if timing is None:
+        _TIMINGS[name] = [1, seconds, seconds]
+        return
+    timing[0] += 1
+    timing[1] += seconds
+    if seconds > timing[2]:
+        timing[2] = seconds
+
+
+def snapshot() -> Dict[str, float]:
+    """Return a copy of all counters, plus `<timing>.count/.avg_ms/.max_ms` values."""
+    values: Dict[str, float] = dict(_COUNTERS)
+    for name, (count, total, worst) in _TIMINGS.items():
+        values[f"{name}.count"] = count
+        values[f"{name}.avg_ms"] = round(total / count * 1000, 1)
+        values[f"{name}.max_ms"] = round(worst * 1000, 1)
+    return values
+
+
+async def log_metrics(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback: write all non-zero counters as one log line."""
+    values = snapshot()
+    if values:
+        logger.info("metrics: %s", " ".join(f"{k}={v}" for k, v in sorted(values.items())))
+
+
+def setup_metrics_log(application: Application) -> None:
+    """Register the periodic metrics log job."""
+    application.job_queue.run_repeating(
+        log_metrics,
+        interval=LOG_INTERVAL,
+        first=LOG_INTERVAL,
+        name="metrics_log",
+    )
@@ -16,29 +16,113 @@
 # - Core should not import commands (top layer) to avoid circular dependencies.
 #
 # ==================================================
-from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from enum import IntEnum
 import uuid
 
 
-@dataclass
+class TimerState(IntEnum):
+    """Lifecycle of a timer.
+
+    ACTIVE ──> CANCELLING ──> CANCELLED
+       └─────> FINISHING  ──> FINISHED
+
+    Leaving ACTIVE is a claim: only the first cancel/finish path wins and runs the
+    side effects (unpin, final edit); every later request sees a non-ACTIVE state.
+    """
+
+    ACTIVE = 0
+    CANCELLING = 1
+    FINISHING = 2
+    CANCELLED = 3
+    FINISHED = 4
+
+
 class TimerEntry:
-    chat_id: int
-    message_id: int | None
-    target_time: datetime
-    message: str | None = None
-    pin_message_id: int | None = None
-    last_text: str | None = None
-    _uid: str = ""
-
-    def __post_init__(self) -> None:
-        """Core utility:   post init  ."""
-        if not self._uid:
-            self._uid = uuid.uuid4().hex[:8]
+    """One active countdown timer.
+
+    Memory layout (see benchmarks/bench_timer_memory.py):
+    - `__slots__`: no per-instance __dict__
+    - target stored as epoch seconds (int) instead of a datetime object
+    - the last rendered text is kept only as its hash (enough to skip identical edits)
+    - the job name is built on first use, cached, and dropped when message_id changes
+    """
+
+    __slots__ = (
+        "chat_id",
+        "_message_id",
+        "target_ts",
+        "message",
+        "pin_message_id",
+        "board",
+        "state",
+        "last_hash",
+        "_uid",
+        "_job_name",
+        "_handle",
+    )
+
+    def __init__(
+        self,
+        chat_id: int,
+        message_id: int | None,
+        target_time: datetime | None = None,
+        message: str | None = None,
+        pin_message_id: int | None = None,
+        *,
+        target_ts: int | None = None,
+        board: bool = False,
+        _uid: str = "",
+    ) -> None:
+        if target_ts is None:
+            if target_time is None:
+                raise TypeError("TimerEntry needs target_time or target_ts")
+            if target_time.tzinfo is None:
+                target_time = target_time.replace(tzinfo=timezone.utc)
+            target_ts = int(target_time.timestamp())
+
+        self.chat_id = chat_id
+        self.target_ts = target_ts
+        self.message = message
+        self.pin_message_id = pin_message_id
+        # Shown on the chat's dashboard message (core/board.py) instead of its own message.
+        self.board = board
+        self.state = TimerState.ACTIVE
+        # hash() of the last text sent to Telegram (0 = nothing rendered yet).
+        self.last_hash = 0
+        # 48 random bits: collision-free in practice even at 100k live timers.
+        self._uid = _uid or uuid.uuid4().hex[:12]
+        # Pending slot in the tick engine (see core/timer_engine.py); None when not queued.
+        self._handle: list | None = None
+        self._message_id = message_id
+        self._job_name: str | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"TimerEntry(chat_id={self.chat_id}, message_id={self._message_id}, "
+            f"target_ts={self.target_ts}, uid={self._uid!r})"
+        )
+
+    @property
+    def message_id(self) -> int | None:
+        """Telegram message edited by the countdown engine (the dashboard for board timers)."""
+        return self._message_id
+
+    @message_id.setter
+    def message_id(self, value: int | None) -> None:
+        self._message_id = value
+        self._job_name = None
 
     @property
     def job_name(self) -> str:
-        # name visible in APScheduler logs, e.g. "timer:chat:msg:uid"
+        # name visible in logs, e.g. "timer:chat:msg:uid"
         """Core utility: job name."""
-        mid = self.message_id if self.message_id is not None else 0
-        return f"timer:{self.chat_id}:{mid}:{self._uid}"
\ No newline at end of file
+        if self._job_name is None:
+            mid = self._message_id if self._message_id is not None else 0
+            self._job_name = f"timer:{self.chat_id}:{mid}:{self._uid}"
+        return self._job_name
+
+    @property
+    def target_time(self) -> datetime:
+        """Target as an aware UTC datetime (built on demand)."""
+        return datetime.fromtimestamp(self.target_ts, timezone.utc)
@@ -0,0 +1,359 @@
+# ==================================================
+# core/outbound.py — Outbound Bot API Scheduler
+# ==================================================
+#
+# Rate limiter for every outgoing Bot API call, plugged into PTB via
+# `ApplicationBuilder().rate_limiter(...)`, so commands, daily jobs and the
+# countdown engine all go through the same gate without extra wiring.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Countdown edits, command replies, daily posts and pin/unpin calls all race for
+#   Telegram's limits (~30 msg/s per bot, ~20 msg/min per group).
+# - Without coordination, bursts (many timers ending at midnight) trigger flood waits
+#   that stall *everything*, including interactive replies.
+#
+# Design:
+# - Token buckets: one global bucket + one bucket per chat (groups are much stricter).
+# - Priority classes (lower value = served first), passed per call via
+#   `rate_limit_args={"priority": Priority.X}`; calls without it are INTERACTIVE.
+# - COUNTDOWN edits are droppable: they never use a chat's last token (kept for
+#   replies) and are dropped with RequestDropped if not admitted quickly.
+#   The countdown engine simply renders fresh text on the next tick.
+# - A request may carry an admission check (`rate_limit_args={"admit_if": fn}`):
+#   it is re-evaluated when the request would be granted, and the request is
+#   dropped (RequestDropped) if it returns False. The countdown engine uses it so
+#   an edit queued before a cancel/finish never lands after the final edit.
+# - Reads (get*) and requests without a chat_id (e.g. answerCallbackQuery) are not throttled.
+#
+# Flood waits (RetryAfter):
+# - The affected chat (or the whole bot, for chat-less calls) goes into a penalty box
+#   for `retry_after` seconds; nothing is admitted for it until the window passes.
+# - Non-droppable requests are retried after the window (up to MAX_FLOOD_RETRIES);
+#   droppable ones are re-raised so the countdown engine can defer and coalesce
+#   that chat's edits (see core/countdown.py).
+# - Counters: outbound.retry_after, outbound.dropped, ... (core/metrics.py).
+#
+# Boundaries:
+# - Only RetryAfter is retried; other errors from Telegram propagate to the caller unchanged.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from bisect import insort
+from enum import IntEnum
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Outbound request classes (lower value = served first)."""
+
+    INTERACTIVE = 0  # command replies, callback side effects
+    FINAL = 1        # "Time is up" finalizations, cancel edits
+    DAILY = 2        # scheduled channel posts
+    COUNTDOWN = 3    # intermediate countdown edits (droppable)
+
+
+class RequestDropped(Exception):
+    """A droppable request was not admitted by the outbound scheduler."""
+
+
+# ==================================================
+# Limits
+# ==================================================
+#
+# Telegram FAQ: ~30 messages/second overall, ~20 messages/minute per group,
+# ~1 message/second per private chat.
+#
+GLOBAL_RATE, GLOBAL_BURST = 30.0, 30.0
+GROUP_RATE, GROUP_BURST = 20.0 / 60.0, 3.0
+PRIVATE_RATE, PRIVATE_BURST = 1.0, 3.0
+
+# How long a droppable request may wait in the queue before it is dropped (seconds).
+DROPPABLE_MAX_WAIT = 2.0
+
+# Chat buckets kept in memory before idle (full) ones are evicted.
+MAX_CHAT_BUCKETS = 10_000
+
+# How many times a non-droppable request is retried after a flood wait.
+MAX_FLOOD_RETRIES = 2
+
+
+# ==================================================
+# Penalty box (flood waits)
+# ==================================================
+class PenaltyBox:
+    """Chats currently under a Telegram flood wait (wall-clock deadlines)."""
+
+    # Key used for bot-wide flood waits (requests without a chat_id).
+    BOT_WIDE = None
+
+    def __init__(self) -> None:
+        self._until: Dict[Any, float] = {}
+
+    def punish(self, chat_id: Any, seconds: float) -> None:
+        """Block a chat (or the whole bot) for `seconds`."""
+        until = time.time() + max(0.0, float(seconds))
+        if until > self._until.get(chat_id, 0.0):
+            self._until[chat_id] = until
+        metrics.incr("outbound.penalty_box" if chat_id is not None else "outbound.penalty_box.bot_wide")
+
+    def blocked_until(self, chat_id: Any) -> Optional[float]:
+        """Epoch timestamp until which `chat_id` is blocked (None if not blocked)."""
+        now = time.time()
+        until = max(self._until.get(chat_id, 0.0), self._until.get(self.BOT_WIDE, 0.0))
+        if until <= now:
+            # Expired entries are cleaned lazily.
+            self._until.pop(chat_id, None)
+            return None
+        return until
+
+    def remaining(self, chat_id: Any) -> float:
+        """Seconds left in the chat's penalty window (0 if not blocked)."""
+        until = self.blocked_until(chat_id)
+        return until - time.time() if until is not None else 0.0
+
+
+_PENALTIES = PenaltyBox()
+
+
+def get_penalty_box() -> PenaltyBox:
+    """Return the process-wide penalty box."""
+    return _PENALTIES
+
+
+class _Bucket:
+    """Classic token bucket."""
+
+    __slots__ = ("rate", "capacity", "tokens", "stamp")
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = now
+
+    def refill(self, now: float) -> None:
+        if now > self.stamp:
+            self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+
+    def take(self, now: float, reserve: float = 0.0) -> bool:
+        """Consume one token if more than `reserve` tokens would remain available."""
+        self.refill(now)
+        if self.tokens >= 1.0 + reserve:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self, now: float, reserve: float = 0.0) -> float:
+        """Seconds until `take(reserve)` can succeed."""
+        self.refill(now)
+        missing = 1.0 + reserve - self.tokens
+        return max(0.0, missing / self.rate)
+
+
+def _is_throttled(endpoint: str, chat_id: Any) -> bool:
+    """Only chat-bound, non-read requests count against Telegram's message limits."""
+    return chat_id is not None and not endpoint.startswith("get")
+
+
+class OutboundScheduler(BaseRateLimiter[Dict[str, Any]]):
+    """Priority-aware global + per-chat token bucket limiter for the Bot API."""
+
+    def __init__(self) -> None:
+        now = time.monotonic()
+        self._global = _Bucket(GLOBAL_RATE, GLOBAL_BURST, now)
+        self._chats: Dict[Any, _Bucket] = {}
+        # Sorted waiters: (priority, seq, chat_id, future, deadline | None, admit_if | None)
+        self._pending: List[tuple] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._penalties = get_penalty_box()
+
+    # ---- PTB lifecycle ----
+
+    async def initialize(self) -> None:
+        self._dispatcher = asyncio.create_task(self._dispatch_loop(), name="outbound_scheduler")
+
+    async def shutdown(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+
+        for _priority, _seq, _chat_id, fut, _deadline, _admit_if in self._pending:
+            if not fut.done():
+                fut.cancel()
+        self._pending.clear()
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Any]],
+        args: Any,
+        kwargs: Dict[str, Any],
+        endpoint: str,
+        data: Dict[str, Any],
+        rate_limit_args: Optional[Dict[str, Any]],
+    ) -> Any:
+        chat_id = data.get("chat_id")
+        if not _is_throttled(endpoint, chat_id):
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as e:
+                self._on_retry_after(PenaltyBox.BOT_WIDE, e)
+                raise
+
+        rate_limit_args = rate_limit_args or {}
+        priority = Priority(rate_limit_args.get("priority", Priority.INTERACTIVE))
+        admit_if = rate_limit_args.get("admit_if")
+        attempt = 0
+        while True:
+            await self._acquire(chat_id, priority, admit_if)
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as e:
+                self._on_retry_after(chat_id, e)
+                if priority >= Priority.COUNTDOWN or attempt >= MAX_FLOOD_RETRIES:
+                    raise
+                attempt += 1
+                # Loop: _acquire waits until the penalty window has passed.
+
+    def _on_retry_after(self, chat_id: Any, error: RetryAfter) -> None:
+        metrics.incr("outbound.retry_after")
+        logger.warning("Flood wait for chat %s: retry after %ss", chat_id, error.retry_after)
+        self._penalties.punish(chat_id, error.retry_after)
+        self._wakeup.set()
+
+    # ---- admission ----
+
+    def _chat_bucket(self, chat_id: Any, now: float) -> _Bucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= MAX_CHAT_BUCKETS:
+                self._evict_idle(now)
+            is_group = isinstance(chat_id, str) or chat_id < 0
+            rate, burst = (GROUP_RATE, GROUP_BURST) if is_group else (PRIVATE_RATE, PRIVATE_BURST)
+            bucket = self._chats[chat_id] = _Bucket(rate, burst, now)
+        return bucket
+
+    def _evict_idle(self, now: float) -> None:
+        for chat_id, bucket in list(self._chats.items()):
+            bucket.refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del self._chats[chat_id]
+
+    def _try_take(self, chat_id: Any, priority: Priority, now: float) -> bool:
+        # Droppable edits never spend a chat's last token: it is kept for replies.
+        reserve = 1.0 if priority >= Priority.COUNTDOWN else 0.0
+        if self._penalties.blocked_until(chat_id) is not None:
+            return False
+        self._global.refill(now)
+        if self._global.tokens < 1.0:
+            return False
+        if not self._chat_bucket(chat_id, now).take(now, reserve):
+            return False
+        self._global.tokens -= 1.0
+        return True
+
+    async def _acquire(self, chat_id: Any, priority: Priority, admit_if: Optional[Callable[[], bool]] = None) -> None:
+        now = time.monotonic()
+
+        if admit_if is not None and not admit_if():
+            metrics.incr("outbound.dropped")
+            raise RequestDropped(f"outbound request for chat {chat_id} is no longer wanted")
+
+        # Fast path: nothing queued and tokens available.
+        if not self._pending and self._try_take(chat_id, priority, now):
+            metrics.incr("outbound.immediate")
+            return
+
+        droppable = priority >= Priority.COUNTDOWN
+        if droppable and self._wait_time(chat_id, 1.0, now) > DROPPABLE_MAX_WAIT:
+            # The chat is saturated (or in the penalty box): skip this edit right away.
+            metrics.incr("outbound.dropped")
+            raise RequestDropped(f"dropped outbound request for chat {chat_id}")
+
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        deadline = now + DROPPABLE_MAX_WAIT if droppable else None
+        insort(self._pending, (int(priority), next(self._seq), chat_id, fut, deadline, admit_if))
+        metrics.incr("outbound.queued")
+        self._wakeup.set()
+
+        await fut
+
+    def _wait_time(self, chat_id: Any, reserve: float, now: float) -> float:
+        """Seconds until a request for `chat_id` could be admitted."""
+        return max(
+            self._penalties.remaining(chat_id),
+            self._global.wait_time(now),
+            self._chat_bucket(chat_id, now).wait_time(now, reserve),
+        )
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            timeout = self._dispatch_once(time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _dispatch_once(self, now: float) -> Optional[float]:
+        """Grant tokens to waiters in priority order.
+
+        Returns:
+            Seconds until the next useful wakeup (None = wait for new requests).
+        """
+        remaining: List[tuple] = []
+        wake: Optional[float] = None
+
+        for item in self._pending:
+            priority, _seq, chat_id, fut, deadline, admit_if = item
+            if fut.done():
+                # Caller went away (cancelled task).
+                continue
+
+            if admit_if is not None and not admit_if():
+                metrics.incr("outbound.dropped")
+                fut.set_exception(RequestDropped(f"outbound request for chat {chat_id} is no longer wanted"))
+                continue
+
+            if deadline is not None and now >= deadline:
+                metrics.incr("outbound.dropped")
+                fut.set_exception(RequestDropped(f"dropped outbound request for chat {chat_id}"))
+                continue
+
+            if self._try_take(chat_id, Priority(priority), now):
+                fut.set_result(None)
+                continue
+
+            remaining.append(item)
+            reserve = 1.0 if priority >= Priority.COUNTDOWN else 0.0
+            wait = self._wait_time(chat_id, reserve, now)
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            wake = wait if wake is None else min(wake, wait)
+
+        self._pending = remaining
+        if wake is not None:
+            # Avoid a hot loop on tiny fractional waits.
+            wake = max(wake, 0.01)
+        return wake
@@ -0,0 +1,109 @@
+# ==================================================
+# core/pins.py — Pinned-Message State Cache
+# ==================================================
+#
+# Per-chat set of messages known to be pinned, so unpin decisions need no `get_chat` reads.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Unpinning a timer used to call `get_chat` before the unpin and again after it
+#   (to verify), i.e. up to three API calls per timer; `cancel_all` paid that per timer.
+#
+# Sources of truth:
+# - Our own pin/unpin calls (`pin_message` / `unpin_message` below).
+# - "Message pinned" service updates (`track_pinned_message`, registered in bot.py),
+#   which also cover pins made by people.
+# - Persisted timers with a `pin_message_id` (seeded on startup, see bot.py).
+#
+# Boundaries:
+# - Telegram sends no service message for unpins done by people; a stale "pinned"
+#   entry only costs one harmless unpin call.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, Set
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from core.models import TimerEntry
+from core.outbound import Priority
+
+logger = logging.getLogger(__name__)
+
+
+class PinCache:
+    """chat_id -> ids of messages known to be pinned."""
+
+    def __init__(self) -> None:
+        self._pinned: Dict[int, Set[int]] = {}
+
+    def note_pinned(self, chat_id: int, message_id: int) -> None:
+        self._pinned.setdefault(chat_id, set()).add(message_id)
+
+    def note_unpinned(self, chat_id: int, message_id: int) -> None:
+        pinned = self._pinned.get(chat_id)
+        if pinned is not None:
+            pinned.discard(message_id)
+            if not pinned:
+                del self._pinned[chat_id]
+
+    def is_pinned(self, chat_id: int, message_id: int) -> bool:
+        return message_id in self._pinned.get(chat_id, ())
+
+    def seed(self, entries: Iterable[TimerEntry]) -> None:
+        """Mark the pins of (rehydrated) timers as known."""
+        for entry in entries:
+            if entry.pin_message_id:
+                self.note_pinned(entry.chat_id, entry.pin_message_id)
+
+
+_PINS = PinCache()
+
+
+def get_pin_cache() -> PinCache:
+    """Return the process-wide pin cache."""
+    return _PINS
+
+
+# ==================================================
+# Pin / unpin helpers (keep the cache in sync)
+# ==================================================
+async def pin_message(bot, chat_id: int, message_id: int, **kwargs) -> None:
+    """Pin a message and record it. Errors propagate to the caller."""
+    await bot.pin_chat_message(chat_id=chat_id, message_id=message_id, **kwargs)
+    _PINS.note_pinned(chat_id, message_id)
+
+
+async def unpin_message(bot, chat_id: int, message_id: int) -> bool:
+    """Unpin a message if it is known to be pinned (one API call, no reads).
+
+    Returns:
+        True if an unpin call was made and succeeded.
+    """
+    if not _PINS.is_pinned(chat_id, message_id):
+        return False
+    try:
+        await bot.unpin_chat_message(
+            chat_id=chat_id,
+            message_id=message_id,
+            rate_limit_args={"priority": Priority.FINAL},
+        )
+    except Exception as e:
+        logger.warning("Unpin failed for chat=%s msg=%s: %s", chat_id, message_id, e)
+        return False
+
+    _PINS.note_unpinned(chat_id, message_id)
+    return True
+
+
+async def track_pinned_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for "message pinned" service updates."""
+    message = update.effective_message
+    if message is None or message.pinned_message is None:
+        return
+    _PINS.note_pinned(message.chat_id, message.pinned_message.message_id)
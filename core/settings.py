@@ -35,6 +35,24 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 if not TELEGRAM_BOT_TOKEN:
     raise RuntimeError("TELEGRAM_BOT_TOKEN is not set")
 
+# ==================================================
+# Bot owners
+# ==================================================
+#
+# BOT_OWNER_IDS
+# - Comma-separated Telegram user IDs allowed to run
+#   process-wide commands (/reload)
+# - Chat admin status is not enough for those: every
+#   user is "admin" of their private chat with the bot
+# - Empty (default): nobody can run them
+#
+
+BOT_OWNER_IDS = frozenset(
+    int(part)
+    for part in (os.getenv("BOT_OWNER_IDS") or "").replace(" ", "").split(",")
+    if part.lstrip("-").isdigit()
+)
+
 # ==================================================
 # Data file paths
 # ==================================================
@@ -51,6 +69,15 @@ BANLU_QUOTES_FILE = os.getenv(
     "data/quotersbanlu.txt",
 )
 
+# SQLite file that persists active timers across restarts.
+# On Fly.io point this at a mounted volume (e.g. /data/timers.sqlite3),
+# otherwise the file is lost with the machine's root filesystem on redeploy.
+TIMERS_DB_PATH = os.getenv("TIMERS_DB_PATH", "data/timers.sqlite3")
+
+# Binary snapshot of the holiday index (services/holidays_service.py), rebuilt from
+# data/holidays/*.json whenever those files change. Safe to delete.
+HOLIDAYS_SNAPSHOT_PATH = os.getenv("HOLIDAYS_SNAPSHOT_PATH", "data/holidays.idx")
+
 # ==================================================
 # External resources
 # ==================================================
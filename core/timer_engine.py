@@ -0,0 +1,159 @@
+# ==================================================
+# core/timer_engine.py — Shared Countdown Tick Engine
+# ==================================================
+#
+# Process-wide schedule of "when should this timer be updated next".
+#
+# Layer: Core
+#
+# Why this exists:
+# - Previously every countdown tick re-armed itself with `job_queue.run_once(...)`,
+#   so each live timer created and destroyed one APScheduler job every 1–60 s.
+# - With thousands of timers the scheduler spent most of its time churning job objects.
+#
+# Design:
+# - One periodic JobQueue job (the driver, see core/countdown.py) wakes up every second.
+# - Timers waiting for their next update live in a binary heap keyed by due time
+#   (epoch seconds), so each wakeup pops *all* due timers in one batch.
+# - Each TimerEntry owns a handle to its pending heap slot (`entry._handle`).
+#   Cancelling invalidates that slot in O(1) instead of searching any scheduler;
+#   invalidated slots are skipped when popped and compacted away in bulk.
+#
+# Boundaries:
+# - Pure data structure: no Telegram / JobQueue imports here.
+# - Rendering and message editing live in core/countdown.py.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Optional
+
+from core.models import TimerEntry
+
+# How often the driver job wakes up (seconds).
+# Must not exceed the smallest interval returned by choose_update_interval.
+TICK_SECONDS = 1.0
+
+
+class TickEngine:
+    """Min-heap of timers ordered by their next update time."""
+
+    def __init__(self) -> None:
+        # Heap slots are [due_ts, seq, entry]; entry is set to None when the slot is cancelled.
+        # seq keeps ordering stable and avoids comparing entries.
+        self._heap: List[list] = []
+        self._seq = itertools.count()
+        # uid -> entry for timers owned by the engine (queued *or* currently being processed).
+        self._live: Dict[str, TimerEntry] = {}
+        # Number of cancelled slots still sitting in the heap.
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _push(self, entry: TimerEntry, due_ts: float) -> None:
+        slot = [due_ts, next(self._seq), entry]
+        entry._handle = slot
+        heapq.heappush(self._heap, slot)
+
+    def _invalidate(self, entry: TimerEntry) -> None:
+        slot = entry._handle
+        if slot is not None:
+            slot[2] = None
+            entry._handle = None
+            self._stale += 1
+
+    def schedule(self, entry: TimerEntry, due_ts: float) -> None:
+        """Queue `entry` for an update at `due_ts` (epoch seconds).
+
+        Scheduling an already queued timer moves it to the new due time.
+        """
+        self._invalidate(entry)
+        self._live[entry._uid] = entry
+        self._push(entry, due_ts)
+
+    def reschedule(self, entry: TimerEntry, due_ts: float) -> bool:
+        """Re-queue a timer after processing, unless it was discarded meanwhile.
+
+        Returns:
+            True if the timer was queued again, False if it is no longer live.
+        """
+        if entry._uid not in self._live:
+            return False
+        self._invalidate(entry)
+        self._push(entry, due_ts)
+        return True
+
+    def discard(self, entry: TimerEntry) -> bool:
+        """Stop updating a timer in O(1).
+
+        Returns:
+            True if the timer was owned by the engine, False otherwise.
+        """
+        if self._live.pop(entry._uid, None) is None:
+            return False
+
+        self._invalidate(entry)
+        self._maybe_compact()
+        return True
+
+    def discard_uid(self, uid: str) -> bool:
+        """Stop updating a timer identified only by its uid."""
+        entry = self._live.get(uid)
+        return self.discard(entry) if entry is not None else False
+
+    def entries(self) -> Iterable[TimerEntry]:
+        """View of every timer owned by the engine."""
+        return self._live.values()
+
+    def is_live(self, entry: TimerEntry) -> bool:
+        """True while the engine still owns this timer."""
+        return entry._uid in self._live
+
+    def pop_due(self, now_ts: float) -> List[TimerEntry]:
+        """Pop every timer whose update is due at `now_ts`.
+
+        Popped timers stay live: the caller must either `reschedule` them or `discard` them.
+        """
+        due: List[TimerEntry] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now_ts:
+            _, _, entry = heapq.heappop(heap)
+            if entry is None:
+                self._stale -= 1
+                continue
+            entry._handle = None
+            due.append(entry)
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Epoch timestamp of the earliest queued update (None if idle)."""
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+            self._stale -= 1
+        return heap[0][0] if heap else None
+
+    def _maybe_compact(self) -> None:
+        # Rebuild once cancelled slots dominate the heap (amortized O(1) per cancel).
+        if self._stale > 64 and self._stale * 2 > len(self._heap):
+            self._heap = [slot for slot in self._heap if slot[2] is not None]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+
+# ==================================================
+# Process-local engine instance
+# ==================================================
+#
+# Same lifetime as the in-memory timer store (core/timers_store.py).
+#
+_ENGINE = TickEngine()
+
+
+def get_engine() -> TickEngine:
+    """Return the process-wide tick engine."""
+    return _ENGINE
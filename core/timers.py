@@ -2,7 +2,7 @@
 # core/timers.py — Timer Runtime Management
 # ==================================================
 #
-# Low-level timer scheduling helpers: create, cancel, list timers via JobQueue and runtime store.
+# Low-level timer scheduling helpers: create, cancel, list timers via the tick engine and runtime store.
 #
 # Layer: Core
 #
@@ -16,122 +16,243 @@
 # - Core should not import commands (top layer) to avoid circular dependencies.
 #
 # ==================================================
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from telegram.ext import ContextTypes
 
-from core.models import TimerEntry
-from core.countdown import countdown_tick
-from core.timers_store import add_timer
+from core.board import mark_dirty
+from core.formatter import next_countdown_update
+from core.models import TimerEntry, TimerState
+from core.outbound import Priority
+from core.pins import pin_message, unpin_message
+from core.timer_engine import get_engine
+from core.timers_store import add_timer, discard_timer, find_timer, get_store, update_timer
+from core.update_policy import get_update_policy
 
 logger = logging.getLogger(__name__)
 
 
-def create_timer(
-    context: ContextTypes.DEFAULT_TYPE,
+def build_timer(
     chat_id: int,
     target_time: datetime,
     message: str | None = None,
     *,
-    message_id: int | None = None,
-    pin_message_id: int | None = None,  # kept for backwards compatibility (in case older code still uses it)
+    board: bool = False,
 ) -> TimerEntry:
-    """
-    Create a timer entry and schedule the first countdown tick.
+    """Create an (unregistered) timer entry.
 
-    Important:
-    - message_id: the timer message ID that will be edited by the countdown engine
-    - pin_message_id: optional, kept for backwards compatibility with older code paths
+    Its uid exists right away, so the first message can be sent already rendered,
+    with the Cancel button, before the entry is registered with `start_timer`.
     """
-
     if target_time.tzinfo is None:
         # Normalize to UTC to avoid timezone surprises in comparisons.
         target_time = target_time.replace(tzinfo=timezone.utc)
 
-    entry = TimerEntry(
+    return TimerEntry(
         chat_id=chat_id,
-        message_id=message_id,
+        message_id=None,
         target_time=target_time,
         message=message,
-        pin_message_id=pin_message_id,
-        last_text=None,
+        board=board,
     )
 
+
+def start_timer(
+    entry: TimerEntry,
+    *,
+    message_id: int | None,
+    pin_message_id: int | None = None,
+    rendered_text: str | None = None,
+) -> TimerEntry:
+    """Register a timer and queue its first countdown update.
+
+    Args:
+        message_id: the timer message ID that will be edited by the countdown engine
+        rendered_text: text the message was sent with; the first update then happens
+            only when that text changes instead of right away
+    """
+    entry.message_id = message_id
+    entry.pin_message_id = pin_message_id
     add_timer(entry)
 
-    # First tick: schedule almost immediately.
-    context.job_queue.run_once(
-        countdown_tick,
-        when=0.5,
-        data=entry,
-        name=entry.job_name,
-    )
+    now = time.time()
+    if rendered_text is None:
+        # First tick: picked up by the next engine wakeup (see core/countdown.py).
+        first = now + 0.5
+    else:
+        entry.last_hash = hash(rendered_text)
+        remaining = int(entry.target_ts - now)
+        first = next_countdown_update(entry.target_ts, now, get_update_policy().interval(entry, remaining))
+    get_engine().schedule(entry, first)
 
     logger.info("Timer created: %s", entry.job_name)
     return entry
 
 
+async def pin_timer(bot, entry: TimerEntry, **kwargs) -> None:
+    """Pin a started timer's message and record the pin on the entry.
+
+    The timer is registered before pinning, so its Cancel button works during the
+    pin round trip; if it was cancelled or finished meanwhile, the pin is undone.
+    Raises like `pin_message`.
+    """
+    await pin_message(bot, entry.chat_id, entry.message_id, **kwargs)
+    if entry.state is not TimerState.ACTIVE:
+        await unpin_message(bot, entry.chat_id, entry.message_id)
+        return
+    entry.pin_message_id = entry.message_id
+    update_timer(entry)
+
+
+def create_timer(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat_id: int,
+    target_time: datetime,
+    message: str | None = None,
+    *,
+    message_id: int | None = None,
+    pin_message_id: int | None = None,  # kept for backwards compatibility (in case older code still uses it)
+    board: bool = False,
+) -> TimerEntry:
+    """
+    Create a timer entry and schedule the first countdown tick.
+
+    Important:
+    - message_id: the timer message ID that will be edited by the countdown engine
+    - pin_message_id: optional, kept for backwards compatibility with older code paths
+    - board: show the timer on the chat's dashboard message (core/board.py)
+
+    Commands that send the timer message themselves should prefer
+    `build_timer` + `start_timer` (one round trip, no extra first edit).
+    """
+    entry = build_timer(chat_id, target_time, message, board=board)
+    return start_timer(entry, message_id=message_id, pin_message_id=pin_message_id)
+
+
+def cancel_timer_job(entry: TimerEntry) -> bool:
+    """Stop the countdown updates of a timer in O(1).
+
+    The entry owns a handle to its pending engine slot (see core/timer_engine.py),
+    so no scheduler or store scan is needed.
+
+    Returns:
+        True if the timer was still being updated, False otherwise.
+    """
+    return get_engine().discard(entry)
+
+
+def begin_cancel(entry: TimerEntry) -> bool:
+    """Claim a timer for cancellation (single flight).
+
+    The first caller moves it ACTIVE -> CANCELLING and removes it from the engine
+    and the store; it then owns the side effects and must call `end_cancel`.
+
+    Returns:
+        False if the timer is already being cancelled/finished (nothing to do).
+    """
+    if entry.state is not TimerState.ACTIVE:
+        return False
+    entry.state = TimerState.CANCELLING
+    get_engine().discard(entry)
+    discard_timer(entry)
+    return True
+
+
+def end_cancel(entry: TimerEntry) -> None:
+    """Mark a claimed cancellation as done (side effects sent)."""
+    entry.state = TimerState.CANCELLED
+
+
 def remove_timer_job(
     job_queue,
     chat_id: int,
     message_id: int,
 ) -> None:
-    """Remove timer jobs from JobQueue / APScheduler.
+    """Stop the countdown updates of the timer attached to a chat message.
 
-    PTB JobQueue uses APScheduler under the hood. On every tick we may re-schedule the job
-    using `run_once(..., name=entry.job_name)`. As a result, a single logical timer can have
-    0..N APScheduler jobs that share the same `name` but have different internal IDs.
+    Lookup goes through the store's (chat_id, message_id) index and cancellation through
+    the entry's engine handle, so this is O(1) — including when called for every timer
+    of a chat in `cancel_all`.
 
-    We therefore remove *all* jobs with name == entry.job_name.
+    `job_queue` is kept in the signature for backwards compatibility with callers.
     """
+    entry = find_timer(chat_id, message_id)
+    if entry is not None:
+        cancel_timer_job(entry)
+
+
+# ==================================================
+# Batch cancellation
+# ==================================================
+#
+# 1) Every timer of the chat leaves the engine and the store in one synchronous step
+#    (no await in between), so no tick can pick one of them up halfway through.
+# 2) Telegram side effects (unpin + "⛔ Timer cancelled." edit) then fan out concurrently,
+#    CANCEL_CONCURRENCY at a time, through the outbound scheduler (FINAL priority).
+#
+CANCEL_CONCURRENCY = 8
+
+CANCELLED_TEXT = "⛔ Timer cancelled."
+
+
+@dataclass
+class CancelReport:
+    """Outcome of `cancel_all_timers`."""
+
+    total: int = 0
+    edited: int = 0
+    unpinned: int = 0
+    failed: int = 0
+
+
+async def cancel_all_timers(bot, chat_id: int) -> CancelReport:
+    """Cancel every timer of a chat and update their messages."""
+    engine = get_engine()
+    entries = []
+    for entry in get_store().clear_chat(chat_id):
+        engine.discard(entry)
+        # Timers already being cancelled/finished elsewhere keep their own side effects.
+        if entry.state is TimerState.ACTIVE:
+            entry.state = TimerState.CANCELLING
+            entries.append(entry)
+
+    report = CancelReport(total=len(entries))
+    if not entries:
+        return report
+
+    # Dashboard timers share one message: the next tick renders it as empty and unpins it.
+    own = [e for e in entries if not e.board]
+    if len(own) != len(entries):
+        mark_dirty(chat_id)
+        report.edited += len(entries) - len(own)
+        for entry in entries:
+            if entry.board:
+                end_cancel(entry)
+
+    gate = asyncio.Semaphore(CANCEL_CONCURRENCY)
+
+    async def _one(entry: TimerEntry) -> None:
+        async with gate:
+            if entry.pin_message_id and await unpin_message(bot, chat_id, entry.pin_message_id):
+                report.unpinned += 1
+            try:
+                await bot.edit_message_text(
+                    chat_id=chat_id,
+                    message_id=entry.message_id,
+                    text=CANCELLED_TEXT,
+                    rate_limit_args={"priority": Priority.FINAL},
+                )
+                report.edited += 1
+            except Exception as e:
+                report.failed += 1
+                logger.warning("Edit cancelled timer message failed: %s", e)
+            finally:
+                end_cancel(entry)
 
-    try:
-        # Local import to avoid circular imports.
-        from core.timers_store import list_timers
-
-        entry = next(
-            (t for t in list_timers(chat_id) if t.message_id == message_id),
-            None,
-        )
-        if not entry:
-            return
-
-        job_name = entry.job_name
-
-        # Preferred approach: use the PTB JobQueue API.
-        jobs = []
-        try:
-            jobs = job_queue.get_jobs_by_name(job_name)
-        except Exception:
-            jobs = []
-
-        if jobs:
-            for j in jobs:
-                try:
-                    j.schedule_removal()
-                except Exception:
-                    # fallback
-                    try:
-                        j.remove()
-                    except Exception:
-                        pass
-            return
-
-        # Fallback: remove directly from the underlying APScheduler instance.
-        try:
-            scheduler = getattr(job_queue, "scheduler", None)
-            if not scheduler:
-                return
-
-            for job in scheduler.get_jobs():
-                if getattr(job, "name", None) == job_name:
-                    try:
-                        scheduler.remove_job(job.id)
-                    except Exception:
-                        pass
-        except Exception:
-            return
-
-    except Exception as e:
-        logger.warning("remove_timer_job failed: %s", e)
+    await asyncio.gather(*(_one(e) for e in own))
+    logger.info("Cancelled %d timers in chat %s: %s", report.total, chat_id, report)
+    return report
@@ -0,0 +1,156 @@
+# ==================================================
+# core/timers_db.py — Durable Timer Persistence
+# ==================================================
+#
+# SQLite backend that mirrors the in-memory timer store, so countdowns survive restarts.
+#
+# Layer: Core
+#
+# Why this exists:
+# - Fly.io `strategy = 'immediate'` deploys and machine restarts kill the process.
+# - Without persistence every running countdown silently stops and its message stays
+#   stuck at the last "Time left".
+#
+# Design:
+# - One table, one row per active TimerEntry (keyed by uid).
+# - The store (core/timers_store.py) calls `save` on create/update and `delete` on removal.
+# - WAL journal + synchronous=NORMAL: commits do not fsync, writes never block readers.
+# - Render state (`last_hash`) is not persisted; the first tick after a restart re-renders it.
+#
+# Rehydration:
+# - `rehydrate_timers` bulk-loads all rows and queues every timer in the tick engine in one pass.
+# - Timers that expired while the bot was down are queued as due immediately: the engine's
+#   regular finish path edits their message to "Time is up", unpins it and deletes the row.
+#
+# Boundaries:
+# - Pure stdlib (sqlite3): no Telegram imports here.
+#
+# ==================================================
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterable, List, Tuple
+
+from core.models import TimerEntry
+from core.timer_engine import TickEngine
+from core.timers_store import TimerStore
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS timers (
+    uid            TEXT PRIMARY KEY,
+    chat_id        INTEGER NOT NULL,
+    message_id     INTEGER,
+    target_ts      INTEGER NOT NULL,
+    message        TEXT,
+    pin_message_id INTEGER,
+    board          INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO timers "
+    "(uid, chat_id, message_id, target_ts, message, pin_message_id, board) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _row(entry: TimerEntry) -> Tuple:
+    """TimerEntry -> table row."""
+    return (
+        entry._uid,
+        entry.chat_id,
+        entry.message_id,
+        entry.target_ts,
+        entry.message,
+        entry.pin_message_id,
+        int(entry.board),
+    )
+
+
+class TimerDB:
+    """Thin SQLite wrapper used as the timer store backend."""
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Autocommit mode: every statement is its own (cheap, WAL) transaction.
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._migrate()
+        self.path = path
+
+    def _migrate(self) -> None:
+        """Add columns introduced after the table was first created."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(timers)")}
+        if "board" not in columns:
+            self._conn.execute("ALTER TABLE timers ADD COLUMN board INTEGER NOT NULL DEFAULT 0")
+
+    def save(self, entry: TimerEntry) -> None:
+        """Insert or update a timer row."""
+        self._conn.execute(_UPSERT, _row(entry))
+
+    def save_many(self, entries: Iterable[TimerEntry]) -> None:
+        """Insert or update many timer rows in one transaction."""
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(_UPSERT, (_row(e) for e in entries))
+
+    def delete(self, uid: str) -> None:
+        """Delete a timer row."""
+        self._conn.execute("DELETE FROM timers WHERE uid = ?", (uid,))
+
+    def load_all(self) -> List[TimerEntry]:
+        """Bulk-load every stored timer."""
+        rows = self._conn.execute(
+            "SELECT uid, chat_id, message_id, target_ts, message, pin_message_id, board FROM timers"
+        ).fetchall()
+
+        return [
+            TimerEntry(
+                chat_id=chat_id,
+                message_id=message_id,
+                target_ts=int(target_ts),
+                message=message,
+                pin_message_id=pin_message_id,
+                board=bool(board),
+                _uid=uid,
+            )
+            for uid, chat_id, message_id, target_ts, message, pin_message_id, board in rows
+        ]
+
+    def close(self) -> None:
+        """Close the connection (checkpoints the WAL)."""
+        self._conn.close()
+
+
+def rehydrate_timers(db: TimerDB, store: TimerStore, engine: TickEngine) -> Tuple[int, int]:
+    """Load persisted timers into the store and queue them in the engine.
+
+    Returns:
+        (active, expired) counts. Expired timers are queued as due now so the
+        countdown finish path finalizes their messages and deletes their rows.
+    """
+    now = time.time()
+    active = expired = 0
+
+    for entry in db.load_all():
+        store.add(entry, persist=False)
+        if entry.target_ts <= now:
+            expired += 1
+            engine.schedule(entry, now)
+        else:
+            active += 1
+            # Spread the first edits over the first seconds instead of one burst.
+            engine.schedule(entry, now + 1 + (active % 10))
+
+    return active, expired
@@ -12,12 +12,27 @@
 #   "which timers exist in this chat" in a simple, fast structure.
 #
 # Data model:
-# - This module stores TimerEntry objects in an in-memory dict:
+# - A single TimerStore instance keeps TimerEntry objects plus secondary indexes:
 #
-#       chat_id -> [TimerEntry, TimerEntry, ...]
+#       uid                   -> TimerEntry
+#       chat_id               -> {uid: TimerEntry, ...}   (insertion ordered)
+#       (chat_id, message_id) -> TimerEntry                (own-message timers only)
+#       chat_id               -> [(target_ts, uid), ...]  (sorted by target time)
+#
+# - Job names ("timer:chat:msg:uid") end with the uid, so lookups by job name
+#   go through the uid index instead of a dedicated dict.
+#
+# - Add/remove/lookup are O(1) (O(log n) + list shift for the target-time index),
+#   so chats with hundreds of timers do not pay O(n) per button press.
+#
+# - Every mutation stamps the chat with a new version (from one store-wide counter),
+#   so derived views (e.g. the /cancel menu pages) can be cached per version.
+#
+# Persistence:
+# - An optional backend (core/timers_db.py) mirrors every add/update/remove,
+#   so timers can be rehydrated after a restart / redeploy.
 #
 # Important limitations:
-# - In-memory only: data is lost on restart / redeploy.
 # - Single-process only: if you ever run multiple instances, timers must be stored
 #   in an external database/shared storage to stay consistent.
 #
@@ -25,17 +40,222 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import logging
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, KeysView, List, Optional, Protocol, Tuple, ValuesView
 
 from core.models import TimerEntry
 
+logger = logging.getLogger(__name__)
+
+# Shared empty view returned for chats without timers.
+_EMPTY: Dict[str, TimerEntry] = {}
+
+
+def _target_key(entry: TimerEntry) -> Tuple[int, str]:
+    """Sort key of the per-chat target-time index."""
+    return entry.target_ts, entry._uid
+
+
+class TimerBackend(Protocol):
+    """Persistence hooks called by the store (see core/timers_db.TimerDB)."""
+
+    def save(self, entry: TimerEntry) -> None: ...
+
+    def delete(self, uid: str) -> None: ...
+
+
+# ==================================================
+# Indexed store
+# ==================================================
+class TimerStore:
+    """Process-local registry of active timers with secondary indexes."""
+
+    def __init__(self) -> None:
+        self._backend: Optional[TimerBackend] = None
+        self._by_uid: Dict[str, TimerEntry] = {}
+        self._by_chat: Dict[int, Dict[str, TimerEntry]] = {}
+        self._by_message: Dict[Tuple[int, int], TimerEntry] = {}
+        # uid -> its current _by_message key (message ids can change after registration)
+        self._message_keys: Dict[str, Tuple[int, int]] = {}
+        self._by_target: Dict[int, List[Tuple[int, str]]] = {}
+        # chat_id -> version of its timer set (0 = no timers)
+        self._versions: Dict[int, int] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._by_uid)
+
+    def __contains__(self, entry: TimerEntry) -> bool:
+        return self._by_uid.get(entry._uid) is entry
+
+    def attach_backend(self, backend: Optional[TimerBackend]) -> None:
+        """Mirror future mutations into a persistence backend (None detaches)."""
+        self._backend = backend
+
+    def _unindex_message(self, entry: TimerEntry) -> None:
+        key = self._message_keys.pop(entry._uid, None)
+        if key is not None and self._by_message.get(key) is entry:
+            del self._by_message[key]
+
+    def _index_message(self, entry: TimerEntry) -> None:
+        """(Re-)index an entry by its current message id."""
+        self._unindex_message(entry)
+        # Board timers share the dashboard message, so they are not indexed by message.
+        if entry.message_id is not None and not entry.board:
+            key = (entry.chat_id, entry.message_id)
+            self._by_message[key] = entry
+            self._message_keys[entry._uid] = key
+
+    def _touch(self, chat_id: int) -> None:
+        self._seq += 1
+        self._versions[chat_id] = self._seq
+
+    # Persistence is best-effort: a failing disk must not break live timers.
+    def _persist(self, entry: TimerEntry) -> None:
+        if self._backend is None:
+            return
+        try:
+            self._backend.save(entry)
+        except Exception as e:
+            logger.warning("Persist timer %s failed: %s", entry.job_name, e)
+
+    def _unpersist(self, entry: TimerEntry) -> None:
+        if self._backend is None:
+            return
+        try:
+            self._backend.delete(entry._uid)
+        except Exception as e:
+            logger.warning("Delete persisted timer %s failed: %s", entry.job_name, e)
+
+    # ---- mutations ----
+
+    def add(self, entry: TimerEntry, *, persist: bool = True) -> None:
+        """Register a timer entry (re-adding the same entry is a no-op).
+
+        Args:
+            persist:
+                False when the entry comes *from* the backend (rehydration).
+        """
+        if entry._uid in self._by_uid:
+            return
+
+        self._by_uid[entry._uid] = entry
+        self._by_chat.setdefault(entry.chat_id, {})[entry._uid] = entry
+        self._index_message(entry)
+        insort(self._by_target.setdefault(entry.chat_id, []), _target_key(entry))
+        self._touch(entry.chat_id)
+
+        if persist:
+            self._persist(entry)
+
+    def update(self, entry: TimerEntry) -> None:
+        """Persist changes to a registered entry (message ids, pin state) and re-index it."""
+        if self._by_uid.get(entry._uid) is entry:
+            self._index_message(entry)
+            self._touch(entry.chat_id)
+            self._persist(entry)
+
+    def remove(self, entry: TimerEntry) -> bool:
+        """Unregister a timer entry.
+
+        Returns:
+            True if the entry was registered, False otherwise.
+        """
+        if self._by_uid.get(entry._uid) is not entry:
+            return False
+
+        del self._by_uid[entry._uid]
+
+        chat = self._by_chat[entry.chat_id]
+        del chat[entry._uid]
+        if not chat:
+            # Keep the store tidy: drop empty chats entirely.
+            del self._by_chat[entry.chat_id]
+
+        self._unindex_message(entry)
+
+        order = self._by_target[entry.chat_id]
+        key = _target_key(entry)
+        idx = bisect_left(order, key)
+        if idx < len(order) and order[idx] == key:
+            del order[idx]
+        if not order:
+            del self._by_target[entry.chat_id]
+            self._versions.pop(entry.chat_id, None)
+        else:
+            self._touch(entry.chat_id)
+
+        self._unpersist(entry)
+        return True
+
+    def clear_chat(self, chat_id: int) -> List[TimerEntry]:
+        """Remove every timer of a chat and return the removed entries."""
+        entries = list(self._by_chat.get(chat_id, _EMPTY).values())
+        for entry in entries:
+            self.remove(entry)
+        return entries
+
+    # ---- lookups ----
+
+    def get(self, uid: str) -> Optional[TimerEntry]:
+        """Lookup by timer uid."""
+        return self._by_uid.get(uid)
+
+    def find(self, chat_id: int, message_id: int) -> Optional[TimerEntry]:
+        """Lookup by the timer message (what users see in the chat)."""
+        return self._by_message.get((chat_id, message_id))
+
+    def by_job_name(self, job_name: str) -> Optional[TimerEntry]:
+        """Lookup by job name (as shown in logs)."""
+        entry = self._by_uid.get(job_name.rpartition(":")[2])
+        if entry is None or entry.job_name != job_name:
+            return None
+        return entry
+
+    def chat_timers(self, chat_id: int) -> ValuesView[TimerEntry]:
+        """Live view of a chat's timers in creation order."""
+        return self._by_chat.get(chat_id, _EMPTY).values()
+
+    def chat_ids(self) -> KeysView[int]:
+        """Live view of chats that currently have timers."""
+        return self._by_chat.keys()
+
+    def sorted_timers(self, chat_id: int) -> Iterator[TimerEntry]:
+        """Iterate a chat's timers by nearest completion time."""
+        by_uid = self._by_uid
+        return (by_uid[uid] for _, uid in self._by_target.get(chat_id, ()))
+
+    def timer_count(self, chat_id: int) -> int:
+        """Number of timers in a chat."""
+        return len(self._by_target.get(chat_id, ()))
+
+    def page_timers(self, chat_id: int, start: int, stop: int) -> List[TimerEntry]:
+        """Slice of a chat's timers by nearest completion time."""
+        by_uid = self._by_uid
+        return [by_uid[uid] for _, uid in self._by_target.get(chat_id, ())[start:stop]]
+
+    def version(self, chat_id: int) -> int:
+        """Version of a chat's timer set; changes whenever a timer is added, updated or removed."""
+        return self._versions.get(chat_id, 0)
+
+    def last(self, chat_id: int) -> Optional[TimerEntry]:
+        """Most recently added timer of a chat."""
+        chat = self._by_chat.get(chat_id)
+        if not chat:
+            return None
+        return next(reversed(chat.values()))
+
+
 # ==================================================
 # Internal state (process-local)
 # ==================================================
-#
-# Keying by chat_id makes per-chat operations O(1) and keeps cancellation logic simple.
-#
-_TIMERS: Dict[int, List[TimerEntry]] = {}
+_STORE = TimerStore()
+
+
+def get_store() -> TimerStore:
+    """Return the process-wide timer store."""
+    return _STORE
 
 
 # ==================================================
@@ -43,23 +263,42 @@ _TIMERS: Dict[int, List[TimerEntry]] = {}
 # ==================================================
 #
 # NOTE:
-# - These helpers return copies where appropriate to prevent accidental mutation
-#   of internal state by callers.
+# - Listing helpers return *live views* (no copies). Callers that remove timers
+#   while iterating must materialize the view first (e.g. `list(...)`).
 #
 def add_timer(entry: TimerEntry) -> None:
     """Register a timer entry.
 
     Args:
         entry:
-            TimerEntry describing an active timer job.
+            TimerEntry describing an active timer.
     """
-    _TIMERS.setdefault(entry.chat_id, []).append(entry)
+    _STORE.add(entry)
+
+
+def update_timer(entry: TimerEntry) -> None:
+    """Persist changes made to a registered timer entry."""
+    _STORE.update(entry)
+
+
+def get_timers(chat_id: int) -> ValuesView[TimerEntry]:
+    """Return a live view of active timers for a given chat."""
+    return _STORE.chat_timers(chat_id)
+
 
+def find_timer(chat_id: int, message_id: int) -> Optional[TimerEntry]:
+    """Return the timer attached to a chat message, if any."""
+    return _STORE.find(chat_id, message_id)
 
-def get_timers(chat_id: int) -> List[TimerEntry]:
-    """Return a snapshot of active timers for a given chat."""
-    # Return a copy to protect internal state.
-    return list(_TIMERS.get(chat_id, []))
+
+def get_timer(uid: str) -> Optional[TimerEntry]:
+    """Return the timer with the given uid, if any."""
+    return _STORE.get(uid)
+
+
+def sorted_timers(chat_id: int) -> Iterator[TimerEntry]:
+    """Iterate a chat's timers by nearest completion time."""
+    return _STORE.sorted_timers(chat_id)
 
 
 def pop_last_timer(chat_id: int) -> Optional[TimerEntry]:
@@ -70,16 +309,11 @@ def pop_last_timer(chat_id: int) -> Optional[TimerEntry]:
     Returns:
         The removed TimerEntry if present; otherwise None.
     """
-    timers = _TIMERS.get(chat_id)
-    if not timers:
+    entry = _STORE.last(chat_id)
+    if entry is None:
         return None
 
-    entry = timers.pop()
-
-    # If no timers remain, remove the key entirely to keep the store tidy.
-    if not timers:
-        _TIMERS.pop(chat_id, None)
-
+    _STORE.remove(entry)
     return entry
 
 
@@ -91,25 +325,22 @@ def remove_timer(chat_id: int, message_id: int) -> bool:
     - Cancelling timers by message_id matches how users "see" timers in chat.
 
     Returns:
-        True if at least one timer was removed, False otherwise.
+        True if a timer was removed, False otherwise.
     """
-    timers = _TIMERS.get(chat_id)
-    if not timers:
+    entry = _STORE.find(chat_id, message_id)
+    if entry is None:
         return False
 
-    # Filter out any entries matching the message id.
-    new_list = [t for t in timers if t.message_id != message_id]
-    removed = len(new_list) != len(timers)
+    return _STORE.remove(entry)
 
-    if not removed:
-        return False
 
-    if new_list:
-        _TIMERS[chat_id] = new_list
-    else:
-        _TIMERS.pop(chat_id, None)
+def discard_timer(entry: TimerEntry) -> bool:
+    """Remove a specific timer entry.
 
-    return True
+    Returns:
+        True if the entry was registered, False otherwise.
+    """
+    return _STORE.remove(entry)
 
 
 def clear_timers(chat_id: int) -> int:
@@ -118,11 +349,10 @@ def clear_timers(chat_id: int) -> int:
     Returns:
         Number of timers removed.
     """
-    lst = _TIMERS.pop(chat_id, [])
-    return len(lst)
+    return len(_STORE.clear_chat(chat_id))
 
 
-def list_timers(chat_id: int) -> List[TimerEntry]:
+def list_timers(chat_id: int) -> ValuesView[TimerEntry]:
     """Compatibility alias: list timers.
 
     Historically, different modules used `get_timers` vs `list_timers`.
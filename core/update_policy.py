@@ -0,0 +1,198 @@
+# ==================================================
+# core/update_policy.py — Budget-Driven Countdown Update Intervals
+# ==================================================
+#
+# Assigns every live timer an update interval so that all countdown edits together
+# fit inside an edit budget (process-wide and per chat).
+#
+# Layer: Core
+#
+# Why this exists:
+# - `choose_update_interval` (core/formatter.py) looks at one timer at a time.
+#   A few timers in their last minute (1 edit/s), or two dozen refreshed once a minute,
+#   already exceed Telegram's ~20 msg/min per group, and the outbound scheduler ends up
+#   dropping most of those edits.
+# - With many timers the same happens globally (~30 msg/s per bot).
+#
+# Design:
+# - The step function stays the *fastest* allowed interval (its rate is each timer's demand).
+# - Every timer gets a weight: higher when it is about to finish, boosted while it is new
+#   (people watch a countdown they have just started).
+# - Budgets are shared by weighted water-filling: each timer gets
+#   min(demand, level * weight), with `level` chosen so the sum equals the budget.
+#   Timers that need little keep all they asked for; the rest share what is left.
+# - Two passes: per chat (group/private budget), then globally (capped by the chat result).
+# - A chat's dashboard timers (core/board.py) share one message, so together they count
+#   as a single consumer with the demand and weight of the most urgent of them.
+# - The allocation is recomputed every RECOMPUTE_SECONDS from the tick driver;
+#   timers not covered yet simply use the step function.
+#
+# Boundaries:
+# - Pure computation: no Telegram calls. Budgets are derived from core/outbound.py limits,
+#   leaving headroom for replies, final edits and daily posts.
+#
+# ==================================================
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from core.formatter import choose_update_interval
+from core.models import TimerEntry
+from core.outbound import GLOBAL_RATE, GROUP_RATE, PRIVATE_RATE
+
+# Countdown edit budgets (edits per second).
+GLOBAL_BUDGET = GLOBAL_RATE * 2 / 3
+GROUP_BUDGET = GROUP_RATE * 0.6
+PRIVATE_BUDGET = PRIVATE_RATE * 0.5
+
+# How often the allocation is recomputed (seconds).
+RECOMPUTE_SECONDS = 10.0
+
+# Slowest update interval a timer can be pushed to (seconds).
+MAX_INTERVAL = 3600.0
+
+# Timers younger than this get RECENT_BOOST times their weight.
+RECENT_SECONDS = 120.0
+RECENT_BOOST = 4.0
+
+
+def _is_group(chat_id) -> bool:
+    return isinstance(chat_id, str) or chat_id < 0
+
+
+def _weight(remaining: float, age: float) -> float:
+    """Relative priority of a timer: ~1 for far-off timers, up to 60 in the last minute."""
+    weight = min(60.0, max(1.0, 3600.0 / max(remaining, 60.0)))
+    if age < RECENT_SECONDS:
+        weight *= RECENT_BOOST
+    return weight
+
+
+def water_fill(items: List[Tuple[float, float]], budget: float) -> List[float]:
+    """Weighted max-min fair share.
+
+    Args:
+        items: (demand, weight) pairs; a rate never exceeds its demand.
+        budget: total rate to distribute.
+
+    Returns:
+        Allocated rate per item (same order). If total demand fits, every item gets its demand.
+    """
+    if sum(d for d, _ in items) <= budget:
+        return [d for d, _ in items]
+
+    # Items saturate in order of demand/weight as the water level rises.
+    order = sorted(range(len(items)), key=lambda i: items[i][0] / items[i][1])
+    rates = [0.0] * len(items)
+    left = budget
+    weight_left = sum(w for _, w in items)
+
+    for pos, i in enumerate(order):
+        demand, weight = items[i]
+        level = left / weight_left
+        if demand <= level * weight:
+            rates[i] = demand
+            left -= demand
+            weight_left -= weight
+            continue
+        # Everyone from here on is limited by the level, not by demand.
+        for j in order[pos:]:
+            rates[j] = level * items[j][1]
+        break
+
+    return rates
+
+
+class UpdatePolicy:
+    """Per-timer update intervals derived from global and per-chat edit budgets."""
+
+    def __init__(
+        self,
+        global_budget: float = GLOBAL_BUDGET,
+        group_budget: float = GROUP_BUDGET,
+        private_budget: float = PRIVATE_BUDGET,
+    ) -> None:
+        self.global_budget = global_budget
+        self.group_budget = group_budget
+        self.private_budget = private_budget
+        # uid -> allocated interval (seconds)
+        self._intervals: Dict[str, float] = {}
+        # uid -> first time the policy saw the timer (epoch seconds)
+        self._first_seen: Dict[str, float] = {}
+        self._computed_at = float("-inf")
+
+    def interval(self, entry: TimerEntry, remaining: int) -> float:
+        """Update interval for `entry` (never faster than the step function)."""
+        base = choose_update_interval(remaining)
+        allocated = self._intervals.get(entry._uid)
+        return base if allocated is None else max(base, allocated)
+
+    def maybe_recompute(self, entries: Iterable[TimerEntry], now: float) -> bool:
+        """Recompute if the last allocation is older than RECOMPUTE_SECONDS."""
+        if now - self._computed_at < RECOMPUTE_SECONDS:
+            return False
+        self.recompute(entries, now)
+        return True
+
+    def recompute(self, entries: Iterable[TimerEntry], now: float) -> None:
+        """Share the budgets across `entries` (all live timers)."""
+        first_seen = self._first_seen
+        by_chat: Dict[object, List[Tuple[str, float, float]]] = defaultdict(list)
+        boards: Dict[object, List[Tuple[str, float, float]]] = defaultdict(list)
+
+        seen: Dict[str, float] = {}
+        for entry in entries:
+            uid = entry._uid
+            seen[uid] = first_seen.get(uid, now)
+            remaining = max(0.0, entry.target_ts - now)
+            demand = 1.0 / choose_update_interval(int(remaining))
+            item = (uid, demand, _weight(remaining, now - seen[uid]))
+            (boards if entry.board else by_chat)[entry.chat_id].append(item)
+        self._first_seen = seen
+
+        # One consumer per dashboard.
+        for chat_id, timers in boards.items():
+            by_chat[chat_id].append(
+                (f"board:{chat_id}", max(d for _, d, _ in timers), max(w for _, _, w in timers))
+            )
+
+        # Pass 1: per chat.
+        uids: List[str] = []
+        items: List[Tuple[float, float]] = []
+        for chat_id, timers in by_chat.items():
+            budget = self.group_budget if _is_group(chat_id) else self.private_budget
+            rates = water_fill([(d, w) for _, d, w in timers], budget)
+            for (uid, _, weight), rate in zip(timers, rates):
+                uids.append(uid)
+                items.append((rate, weight))
+
+        # Pass 2: globally, capped by the per-chat share.
+        rates = water_fill(items, self.global_budget)
+        intervals = {
+            uid: min(MAX_INTERVAL, 1.0 / rate) if rate > 0 else MAX_INTERVAL
+            for uid, rate in zip(uids, rates)
+        }
+        for chat_id, timers in boards.items():
+            shared = intervals.pop(f"board:{chat_id}")
+            for uid, _, _ in timers:
+                intervals[uid] = shared
+
+        self._intervals = intervals
+        self._computed_at = now
+
+    def planned_rate(self) -> float:
+        """Total countdown edits per second implied by the current allocation."""
+        return sum(1.0 / i for i in self._intervals.values())
+
+
+# ==================================================
+# Process-local policy instance
+# ==================================================
+_POLICY = UpdatePolicy()
+
+
+def get_update_policy() -> UpdatePolicy:
+    """Return the process-wide update policy."""
+    return _POLICY
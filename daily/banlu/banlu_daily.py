@@ -24,10 +24,12 @@ from telegram.ext import Application, ContextTypes
 from telegram.error import NetworkError, TimedOut
 
 from services.banlu_service import (
+    get_banlu_quotes,
     get_random_banlu_quote,
     format_banlu_message,
 )
 from services.channel_ids import parse_chat_ids
+from core.outbound import Priority
 
 # ==================================================
 # CONFIG
@@ -68,7 +70,11 @@ async def _send_with_retry(context: ContextTypes.DEFAULT_TYPE, chat_id: int, tex
     delays = (0.8, 2.0, 5.0)
     for attempt in range(len(delays) + 1):
         try:
-            await context.bot.send_message(chat_id=chat_id, text=text)
+            await context.bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                rate_limit_args={"priority": Priority.DAILY},
+            )
             return True
         except (NetworkError, TimedOut) as e:
             logger.warning("Ban'Lu send failed (attempt %s/%s) for chat_id=%s: %s", attempt + 1, len(delays) + 1, chat_id, e)
@@ -88,7 +94,7 @@ async def send_banlu_daily(context: ContextTypes.DEFAULT_TYPE):
     if _already_sent_today(context):
         return
 
-    quotes = context.bot_data.get("banlu_quotes", [])
+    quotes = get_banlu_quotes()
     quote = get_random_banlu_quote(quotes)
 
     if not quote or not BANLU_CHANNEL_IDS:
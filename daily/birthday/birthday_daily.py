@@ -7,8 +7,9 @@ from typing import Dict, List
 from telegram.ext import Application
 
 from services.birthday_format import format_birthday_message
-from services.birthday_service import get_today_birthday_payload, load_birthday_events
+from services.birthday_service import get_birthday_events, get_today_birthday_payload
 from services.channel_ids import parse_chat_ids
+from core.outbound import Priority
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ async def send_birthday_daily(app: Application) -> None:
     today = now_local.date()
     today_key = now_local.strftime("%Y-%m-%d")
 
-    events = load_birthday_events()
+    events = get_birthday_events()
 
     # ✅ FIX: если сегодня нет событий — всё равно шлём модуль с заглушками
     payload = get_today_birthday_payload(events=events, today=today) or {
@@ -47,7 +48,12 @@ async def send_birthday_daily(app: Application) -> None:
         if last_sent.get(chat_id) == today_key:
             continue
         try:
-            await app.bot.send_message(chat_id=chat_id, text=text, parse_mode="HTML")
+            await app.bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                parse_mode="HTML",
+                rate_limit_args={"priority": Priority.DAILY},
+            )
             last_sent[chat_id] = today_key
         except Exception as e:
             logger.exception("Birthday daily send failed for chat_id=%s: %s", chat_id, e)
@@ -23,6 +23,7 @@ from telegram.ext import Application, ContextTypes
 from services.holidays_service import get_today_holidays
 from services.holidays_format import format_holidays_message
 from services.channel_ids import parse_chat_ids
+from core.outbound import Priority
 
 # ==================================================
 # Configuration
@@ -81,6 +82,7 @@ async def send_holidays_daily(context: ContextTypes.DEFAULT_TYPE):
             chat_id=chat_id,
             text=message,
             disable_web_page_preview=True,
+            rate_limit_args={"priority": Priority.DAILY},
         )
 
     # Store the date of the last successful send
@@ -18,7 +18,8 @@
 # ==================================================
 import random
 
-from core.settings import BANLU_WOWHEAD_URL
+from core.datasets import register_dataset
+from core.settings import BANLU_QUOTES_FILE, BANLU_WOWHEAD_URL
 
 # ==================================================
 # Data loading
@@ -36,6 +37,23 @@ def load_banlu_quotes(path: str) -> list[str]:
         # Fail gracefully if the quotes file is missing
         return []
 
+# ==================================================
+# Dataset
+# ==================================================
+#
+# Hot-reloadable snapshot of BANLU_QUOTES_FILE (see core/datasets.py).
+#
+BANLU_QUOTES = register_dataset(
+    "banlu_quotes",
+    lambda: [BANLU_QUOTES_FILE],
+    lambda: load_banlu_quotes(BANLU_QUOTES_FILE),
+)
+
+
+def get_banlu_quotes() -> list[str]:
+    """Current Ban'Lu quotes snapshot (no I/O)."""
+    return BANLU_QUOTES.get()
+
 # ==================================================
 # Quote selection
 # ==================================================
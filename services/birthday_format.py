@@ -18,37 +18,12 @@
 # ==================================================
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from services.birthday_service import _norm_token  # reuse normalization (avoid duplicates)
-# IMPORTANT:
-# - Do NOT modify services/holidays_flags.py (user-managed mapping).
-# - That module may or may not expose UI_EMOJIS depending on the deployed version.
-#   To avoid startup crashes, we only import the stable maps and keep local UI defaults here.
-from services.holidays_flags import CATEGORY_EMOJIS, COUNTRY_FLAGS
-
-# Normalized lookup maps (without touching services/holidays_flags.py)
-_COUNTRY_FLAGS_NORM = {
-    _norm_token(k): v for k, v in COUNTRY_FLAGS.items() if _norm_token(k)
-}
-_CATEGORY_EMOJIS_NORM = {
-    _norm_token(k): v for k, v in CATEGORY_EMOJIS.items() if _norm_token(k)
-}
-
-# Normalized lookup dicts (built from holidays_flags.py at import time)
-def _norm_key(value: Any) -> str:
-    """Service function:  norm key."""
-    s = _norm_token(value)
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-_COUNTRY_FLAGS_NORM = {_norm_key(k): v for k, v in COUNTRY_FLAGS.items()}
-_CATEGORY_EMOJIS_NORM = {_norm_key(k): v for k, v in CATEGORY_EMOJIS.items()}
+# Flags/emojis are resolved when events load (services/emoji_lookup.py): every event
+# carries "country_flags"/"category_emojis" lists parallel to its tokens.
 
 
 # Minimal UI emojis used only for section headers/formatting.
@@ -182,89 +157,12 @@ def _range_progress(date_str: str, today: date) -> Optional[RangeProgress]:
 
 
 # ------------------------------
-# Emoji resolvers
+# Emoji helpers
 # ------------------------------
 
 
-def _first_token(values: List[str]) -> str:
-    """Service function:  first token."""
-    return values[0] if values else ""
-
-
-def _emoji_for_category(categories: List[str]) -> str:
-    """Service function:  emoji for category."""
-    if not categories:
-        return ""
-    out = []
-    for cat in categories:
-        emoji = _CATEGORY_EMOJIS_NORM.get(_norm_key(cat))
-        if emoji:
-            out.append(emoji)
-    return "".join(out)
-
-
-def _emoji_for_country(countries: List[str]) -> str:
-    """Service function:  emoji for country."""
-    if not countries:
-        return ""
-    out = []
-    for c in countries:
-        emoji = _COUNTRY_FLAGS_NORM.get(_norm_key(c))
-        if emoji:
-            out.append(emoji)
-    return "".join(out)
-
-
-def _as_list(value: Any) -> List[str]:
-    """Normalize a value that can be list/str/None into a list of strings.
-
-    Birthday JSON may use either singular or plural keys and can store either:
-      - "country": "US" or "countries": ["US", "CA"]
-      - "category": "Fun" or "categories": ["Fun", "Religious"]
-
-    We keep order and do NOT deduplicate (user may intentionally map the same emoji for
-    multiple tokens and want to see them all).
-    """
-
-    if value is None:
-        return []
-    if isinstance(value, list):
-        out: List[str] = []
-        for v in value:
-            s = str(v).strip()
-            if s:
-                out.append(s)
-        return out
-    if isinstance(value, str):
-        s = value.strip()
-        if not s:
-            return []
-        # Allow light separators if user stores "US,CA" etc.
-        parts = re.split(r"[,;/]", s)
-        return [p.strip() for p in parts if p.strip()]
-    s = str(value).strip()
-    return [s] if s else []
-
-
-def _emoji_for_categories_all(categories: List[str]) -> str:
-    """Service function:  emoji for categories all."""
-    emojis: List[str] = []
-    for token in categories:
-        key = _norm_key(token)
-        emoji = _CATEGORY_EMOJIS_NORM.get(key)
-        if emoji:
-            emojis.append(emoji)
-    return "".join(emojis)
-
-
-def _emoji_for_countries_all(countries: List[str]) -> str:
-    """Service function:  emoji for countries all."""
-    emojis: List[str] = []
-    for token in countries:
-        key = _norm_key(token)
-        emoji = _COUNTRY_FLAGS_NORM.get(key)
-        if emoji:
-            emojis.append(emoji)
+def _joined(emojis: List[str]) -> str:
+    """Concatenate the resolved emojis of an event's tokens (unknown tokens are "")."""
     return "".join(emojis)
 
 
@@ -333,12 +231,9 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
     else:
         for ev in challenges:
             name = str(ev.get("name", "")).strip()
-            categories = ev.get("category", []) or []
-            countries = ev.get("countries", []) or []
-
             owner, task = _split_owner_task(name)
-            owner_emoji = _emoji_for_country(countries)
-            task_emoji = _emoji_for_category(categories)
+            owner_emoji = _joined(ev["country_flags"])
+            task_emoji = _joined(ev["category_emojis"])
 
             if owner:
                 lines.append(f"{owner_emoji} {owner}".strip())
@@ -367,12 +262,9 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
     else:
         for ev in heroes:
             name = str(ev.get("name", "")).strip()
-            categories = ev.get("category", []) or []
-            countries = ev.get("countries", []) or []
-
             hero, _desc = _split_owner_desc(name)
-            hero_emoji = _emoji_for_country(countries)
-            status_emoji = _emoji_for_category(categories)
+            hero_emoji = _joined(ev["country_flags"])
+            status_emoji = _joined(ev["category_emojis"])
 
             if hero:
                 lines.append(f"{hero_emoji} {hero}".strip())
@@ -406,13 +298,11 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
             if not name:
                 continue
 
-            # Birthday JSON can contain either singular or plural fields
-            categories = _as_list(ev.get("categories", ev.get("category", [])))
-            countries = _as_list(ev.get("countries", ev.get("country", [])))
+            countries = ev["country_tokens"]
 
             # Use *all* provided categories/countries (no de-dup)
-            cat_emojis = _emoji_for_categories_all(categories) or "🥳"
-            country_emojis = _emoji_for_countries_all(countries)
+            cat_emojis = _joined(ev["category_emojis"]) or "🥳"
+            country_emojis = _joined(ev["country_flags"])
 
             # Optional birthday phrase/message (preferred)
             message = (
@@ -433,16 +323,8 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
                 lines.append(f"{country_emojis} {message}".strip())
             else:
                 # If all tokens were resolved to emojis (e.g. 'murloc'), don't print raw keys like 'murloc'.
-                unresolved: List[str] = []
-                is_murloc = any(_norm_key(c) == "murloc" for c in countries)
-
-                for c in countries:
-                    raw = str(c).strip()
-                    k = _norm_token(c)
-                    if not raw:
-                        continue
-                    if k and k not in _COUNTRY_FLAGS_NORM:
-                        unresolved.append(raw)
+                unresolved = [c for c, flag in zip(countries, ev["country_flags"]) if not flag]
+                is_murloc = "murloc" in ev["country_keys"]
 
                 if unresolved:
                     # Keep unresolved raw keys visible
@@ -455,7 +337,7 @@ def format_birthday_message(payload: Dict[str, Any], today: date) -> str:
                         else:
                             lines.append(country_emojis)
                     else:
-                        lines.append(" ".join([str(c).strip() for c in countries if str(c).strip()]))
+                        lines.append(" ".join(countries))
 
     # Trim trailing blanks
     while lines and lines[-1] == "":
@@ -20,44 +20,22 @@ import json
 import os
 import re
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
+
+from core.dates import parse_mmdd, parse_mmdd_range
+from core.datasets import register_dataset
+from services.emoji_lookup import CYRILLIC_LOOKALIKES, as_tokens, category_emoji, country_flag, country_key
 
 # -----------------------------------------------------------------------------
 # Normalization helpers
 # -----------------------------------------------------------------------------
 
-# Common Cyrillic lookalikes that can sneak into tags like "Сhallenge".
-_CYR_TO_LAT = str.maketrans({
-    "С": "C",
-    "с": "c",
-    "О": "O",
-    "о": "o",
-    "А": "A",
-    "а": "a",
-    "Е": "E",
-    "е": "e",
-    "Р": "P",
-    "р": "p",
-    "Н": "H",
-    "н": "h",
-    "К": "K",
-    "к": "k",
-    "Т": "T",
-    "т": "t",
-    "М": "M",
-    "м": "m",
-    "В": "B",
-    "в": "b",
-    "Х": "X",
-    "х": "x",
-})
-
 
 def _norm_token(value: Any) -> str:
     """Service function:  norm token."""
     if value is None:
         return ""
-    s = str(value).strip().translate(_CYR_TO_LAT)
+    s = str(value).strip().translate(CYRILLIC_LOOKALIKES)
     s = " ".join(s.split())
     return s.lower()
 
@@ -127,7 +105,33 @@ def load_birthday_events(path: Optional[str] = None) -> List[Dict[str, Any]]:
     if not isinstance(data, list):
         return []
 
-    return [e for e in data if isinstance(e, dict)]
+    return [_with_emojis(e) for e in data if isinstance(e, dict)]
+
+
+def _with_emojis(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an event with its tokens and their flags/emojis resolved (see services/emoji_lookup.py).
+
+    Events may use singular or plural keys ("country"/"countries", "category"/"categories").
+    """
+    countries = as_tokens(event.get("countries", event.get("country")))
+    categories = as_tokens(event.get("categories", event.get("category")))
+    return dict(
+        event,
+        country_tokens=countries,
+        country_keys=[country_key(c) for c in countries],
+        country_flags=[country_flag(c) for c in countries],
+        category_tokens=categories,
+        category_emojis=[category_emoji(c) for c in categories],
+    )
+
+
+# Hot-reloadable snapshot of data/birthday.json (see core/datasets.py).
+BIRTHDAY_EVENTS = register_dataset("birthday", lambda: [_birthday_file_path()], load_birthday_events)
+
+
+def get_birthday_events() -> List[Dict[str, Any]]:
+    """Current birthday/guild events snapshot (no I/O)."""
+    return BIRTHDAY_EVENTS.get()
 
 
 # -----------------------------------------------------------------------------
@@ -135,14 +139,6 @@ def load_birthday_events(path: Optional[str] = None) -> List[Dict[str, Any]]:
 # -----------------------------------------------------------------------------
 
 
-def _parse_mmdd(mmdd: str) -> Optional[Tuple[int, int]]:
-    """Service function:  parse mmdd."""
-    m = re.fullmatch(r"\s*(\d{2})-(\d{2})\s*", mmdd)
-    if not m:
-        return None
-    return int(m.group(1)), int(m.group(2))
-
-
 def event_active_on(date_str: str, today: date) -> bool:
     """True if an event is active on the given 'today' date."""
     ds = (date_str or "").strip()
@@ -151,21 +147,18 @@ def event_active_on(date_str: str, today: date) -> bool:
 
     # single day
     if ":" not in ds:
-        parsed = _parse_mmdd(ds)
+        parsed = parse_mmdd(ds)
         if not parsed:
             return False
         month, day = parsed
         return today.month == month and today.day == day
 
     # range
-    start_s, end_s = ds.split(":", 1)
-    start = _parse_mmdd(start_s)
-    end = _parse_mmdd(end_s)
-    if not start or not end:
+    parsed_range = parse_mmdd_range(ds)
+    if not parsed_range:
         return False
 
-    sm, sd = start
-    em, ed = end
+    (sm, sd), (em, ed) = parsed_range
     wraps_year = (em, ed) < (sm, sd)
 
     try:
@@ -223,7 +216,7 @@ def get_today_birthday_payload(
     Returns None when there is nothing to send.
     """
     today = today or date.today()
-    events = events if events is not None else load_birthday_events()
+    events = events if events is not None else get_birthday_events()
 
     challenges: List[Dict[str, Any]] = []
     heroes: List[Dict[str, Any]] = []
@@ -0,0 +1,124 @@
+# ==================================================
+# services/emoji_lookup.py — Precomputed Flag & Emoji Lookup
+# ==================================================
+#
+# One normalization of country/category tokens and one lookup into the
+# user-maintained maps in services/holidays_flags.py, shared by every dataset.
+#
+# Layer: Services
+#
+# Why this exists:
+# - holidays_format and birthday_format each normalized every token with several
+#   regex substitutions on every render, with slightly different rules, and
+#   holidays_cmd looked tokens up raw (so "USA" and "usa" rendered differently).
+#
+# Design:
+# - `normalize_key` is the single token -> map key rule (Cyrillic lookalikes
+#   folded, lowercase, punctuation collapsed to "_").
+# - The maps are normalized once at import; each distinct raw token is resolved
+#   once and memoized, so loaders pay the regex cost once per token, not per record.
+# - Loaders (holidays_service, birthday_service) store the results on the records
+#   as lists parallel to the tokens: "country_flags" and "category_emojis" ("" when
+#   a token has no mapping). Formatters only join/pick from those lists.
+#
+# Boundaries:
+# - Do NOT modify services/holidays_flags.py (user-managed mapping); its keys are
+#   normalized here instead.
+#
+# ==================================================
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Tuple
+
+from services.holidays_flags import CATEGORY_EMOJIS, COUNTRY_FLAGS
+
+# Common Cyrillic lookalikes that can sneak into tags like "Сhallenge".
+CYRILLIC_LOOKALIKES = str.maketrans({
+    "С": "C",
+    "с": "c",
+    "О": "O",
+    "о": "o",
+    "А": "A",
+    "а": "a",
+    "Е": "E",
+    "е": "e",
+    "Р": "P",
+    "р": "p",
+    "Н": "H",
+    "н": "h",
+    "К": "K",
+    "к": "k",
+    "Т": "T",
+    "т": "t",
+    "М": "M",
+    "м": "m",
+    "В": "B",
+    "в": "b",
+    "Х": "X",
+    "х": "x",
+})
+
+_APOSTROPHES_RE = re.compile(r"[’'`]")
+_SEPARATORS_RE = re.compile(r"[^a-z0-9]+")
+_LIST_SEPARATORS_RE = re.compile(r"[,;/]")
+
+
+def normalize_key(value: Any) -> str:
+    """Token -> snake_case map key ("Food & Beverage" -> "food_beverage")."""
+    if value is None:
+        return ""
+    s = str(value).strip().translate(CYRILLIC_LOOKALIKES).lower()
+    s = _APOSTROPHES_RE.sub("", s)
+    return _SEPARATORS_RE.sub("_", s).strip("_")
+
+
+def as_tokens(value: Any) -> List[str]:
+    """Normalize a list/str/None field into a list of stripped, non-empty strings.
+
+    A string may hold several tokens ("US,CA"). Order is kept and nothing is
+    deduplicated (the same emoji may be wanted several times).
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [s for s in (str(v).strip() for v in value) if s]
+    if isinstance(value, str):
+        return [p.strip() for p in _LIST_SEPARATORS_RE.split(value) if p.strip()]
+    s = str(value).strip()
+    return [s] if s else []
+
+
+# ==================================================
+# Lookup tables
+# ==================================================
+_COUNTRY_FLAGS_BY_KEY = {normalize_key(k): v for k, v in COUNTRY_FLAGS.items() if normalize_key(k)}
+_CATEGORY_EMOJIS_BY_KEY = {normalize_key(k): v for k, v in CATEGORY_EMOJIS.items() if normalize_key(k)}
+
+# raw token -> (key, flag/emoji); filled as loaders meet new tokens.
+_COUNTRIES: Dict[str, Tuple[str, str]] = {}
+_CATEGORIES: Dict[str, Tuple[str, str]] = {}
+
+
+def _resolve(token: Any, cache: Dict[str, Tuple[str, str]], table: Dict[str, str]) -> Tuple[str, str]:
+    raw = str(token)
+    hit = cache.get(raw)
+    if hit is None:
+        key = normalize_key(raw)
+        hit = cache[raw] = (key, table.get(key, ""))
+    return hit
+
+
+def country_key(token: Any) -> str:
+    """Normalized key of a country token (memoized)."""
+    return _resolve(token, _COUNTRIES, _COUNTRY_FLAGS_BY_KEY)[0]
+
+
+def country_flag(token: Any) -> str:
+    """Flag of a country token; "" if it has none."""
+    return _resolve(token, _COUNTRIES, _COUNTRY_FLAGS_BY_KEY)[1]
+
+
+def category_emoji(token: Any) -> str:
+    """Emoji of a category token; "" if it has none."""
+    return _resolve(token, _CATEGORIES, _CATEGORY_EMOJIS_BY_KEY)[1]
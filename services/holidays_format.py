@@ -16,33 +16,8 @@
 # - Services should not perform Telegram network calls directly (commands/daily own messaging).
 #
 # ==================================================
-import re
 from typing import List, Dict
 
-from services.holidays_flags import COUNTRY_FLAGS, CATEGORY_EMOJIS
-
-def _normalize_key(value: str) -> str:
-    """Normalize tokens to match keys in services/holidays_flags.py.
-
-    We do NOT change holidays_flags.py; instead we normalize both the input token
-    and the mapping keys into a comparable snake_case form.
-    """
-    if value is None:
-        return ""
-    s = str(value).strip()
-    # Fix common Cyrillic lookalikes (e.g. 'Сhallenge' -> 'challenge')
-    s = s.replace("С", "C").replace("с", "c")
-    s = s.lower()
-    s = re.sub(r"[’'`]", "", s)
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-
-# Normalized lookup dicts (built from holidays_flags.py at import time)
-_COUNTRY_FLAGS_NORM = {_normalize_key(k): v for k, v in COUNTRY_FLAGS.items()}
-_CATEGORY_EMOJIS_NORM = {_normalize_key(k): v for k, v in CATEGORY_EMOJIS.items()}
-
 
 # ==================================================
 # Type aliases
@@ -54,6 +29,8 @@ _CATEGORY_EMOJIS_NORM = {_normalize_key(k): v for k, v in CATEGORY_EMOJIS.items(
 # - name: str
 # - categories: list[str]
 # - countries: list[str]
+# - country_flags / category_emojis: list[str], parallel to countries /
+#   categories ("" when unmapped), resolved at load by services/emoji_lookup.py
 #
 Holiday = Dict[str, object]
 
@@ -67,7 +44,7 @@ Holiday = Dict[str, object]
 # Formatting rules:
 # - The message starts with a fixed header
 # - Each holiday is separated by an empty line
-# - Only the FIRST country and category are displayed
+# - All mapped country flags and all categories are displayed
 # - Fallback emojis are used when data is missing
 #
 def format_holidays_message(holidays: List[Holiday]) -> str:
@@ -79,26 +56,17 @@ def format_holidays_message(holidays: List[Holiday]) -> str:
     for holiday in holidays:
         name = holiday.get("name", "—")
         categories = holiday.get("categories", [])
-        countries = holiday.get("countries", [])
+        category_emojis = holiday.get("category_emojis", [])
 
         # --------------------------------------------------
         # Country / Flag resolution
         # --------------------------------------------------
         #
-        # Only the first country is displayed.
-        # If no country is provided or the key is unknown,
+        # Every mapped country flag is displayed.
+        # If no country is provided or none is mapped,
         # a generic global emoji is used.
         #
-        if countries:
-            flags = []
-            for c in countries:
-                key = _normalize_key(c)
-                emoji = _COUNTRY_FLAGS_NORM.get(key)
-                if emoji:
-                    flags.append(emoji)
-            flag = "".join(flags) if flags else "🌍"
-        else:
-            flag = "🌍"
+        flag = "".join(holiday.get("country_flags", [])) or "🌍"
 
         # Holiday name
         lines.append(f"{flag} {name}")
@@ -107,15 +75,12 @@ def format_holidays_message(holidays: List[Holiday]) -> str:
         # Category resolution
         # --------------------------------------------------
         #
-        # Only the first category is displayed.
-        # Unknown categories fall back to a generic label.
+        # Every category is displayed (in order) with its emoji.
+        # Unmapped categories fall back to a generic label emoji.
         #
         if categories:
-            # show all categories (in order), each with its mapped emoji
-            for category in categories:
-                key = _normalize_key(category)
-                emoji = _CATEGORY_EMOJIS_NORM.get(key, "🔖")
-                lines.append(f"{emoji} {str(category).strip()}")
+            for category, emoji in zip(categories, category_emojis):
+                lines.append(f"{emoji or '🔖'} {str(category).strip()}")
 
         # Empty line between holidays
         lines.append("")
@@ -16,16 +16,30 @@
 # - Services should not perform Telegram network calls directly (commands/daily own messaging).
 #
 # ==================================================
+import calendar
+import heapq
 import json
 import logging
-from datetime import date, datetime
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from functools import lru_cache
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from core.dynamic_holidays import get_dynamic_holidays
+from core.dates import next_occurrence, parse_mmdd
+from core.datasets import Stamp, file_stamp, register_dataset
+from core.dynamic_holidays import RULES, YEARS_CACHED, DynamicHoliday, holidays_from, holidays_in_year
+from core.settings import HOLIDAYS_SNAPSHOT_PATH
+from services.emoji_lookup import category_emoji, country_flag
 
 logger = logging.getLogger(__name__)
 
+
 # ==================================================
 # Types & constants
 # ==================================================
@@ -35,11 +49,15 @@ Holiday = Dict[str, object]
 # Root directory containing static holiday JSON files
 HOLIDAYS_PATH = Path("data/holidays")
 
+# Memory-mapped columnar snapshot of HOLIDAYS_PATH (see "Columnar storage")
+HOLIDAYS_SNAPSHOT = Path(HOLIDAYS_SNAPSHOT_PATH)
+
+
 # ==================================================
 # Static holidays loader
 # ==================================================
 #
-# Loads holidays defined in static JSON files.
+# Reads holidays defined in static JSON files.
 #
 # Each JSON entry is expected to contain:
 # - name: str
@@ -47,18 +65,17 @@ HOLIDAYS_PATH = Path("data/holidays")
 # - countries: list[str] (optional)
 # - categories / category: list[str] or str (optional)
 #
-# Dates are normalized into a full date (parsed_date)
-# relative to the provided 'today' value.
+# Malformed dates are skipped (with a warning).
 #
-def load_static_holidays(today: date) -> List[Holiday]:
-    """Service function: load static holidays."""
-    holidays: List[Holiday] = []
+def read_static_holidays(path: Path = HOLIDAYS_PATH) -> List[Tuple[int, int, Holiday]]:
+    """Read every holiday file once: (month, day, record) in file order."""
+    entries: List[Tuple[int, int, Holiday]] = []
 
-    if not HOLIDAYS_PATH.exists():
-        logger.warning("Holidays folder not found: %s", HOLIDAYS_PATH)
-        return holidays
+    if not path.exists():
+        logger.warning("Holidays folder not found: %s", path)
+        return entries
 
-    for file in sorted(HOLIDAYS_PATH.glob("*.json")):
+    for file in sorted(path.glob("*.json")):
         try:
             data = json.loads(file.read_text(encoding="utf-8"))
         except Exception:
@@ -70,40 +87,436 @@ def load_static_holidays(today: date) -> List[Holiday]:
             if not mmdd:
                 continue
 
-            # Build a full date for the current year
-            parsed = datetime.strptime(
-                f"{today.year}-{mmdd}", "%Y-%m-%d"
-            ).date()
-
-            # If the holiday already passed this year,
-            # shift it to the next year
-            if parsed < today:
-                parsed = parsed.replace(year=today.year + 1)
-
-            holidays.append(
-                {
-                    "name": entry["name"],
-                    "date": mmdd,
-                    "parsed_date": parsed,
-                    "countries": entry.get("countries", []),
-                    "categories": (
-                        entry.get("category")
-                        or entry.get("categories")
-                        or []
-                    ),
-                    "source": file.name,
-                }
+            month_day = parse_mmdd(mmdd)
+            if month_day is None:
+                logger.warning("Bad holiday date %r in %s", mmdd, file.name)
+                continue
+
+            entries.append(
+                (
+                    *month_day,
+                    {
+                        "name": entry["name"],
+                        "date": mmdd,
+                        "countries": entry.get("countries", []),
+                        "categories": (
+                            entry.get("category")
+                            or entry.get("categories")
+                            or []
+                        ),
+                        "source": file.name,
+                    },
+                )
             )
 
-    return holidays
+    return entries
+
+
+# ==================================================
+# Columnar storage
+# ==================================================
+#
+# One dict per holiday repeats the same few tokens ("world", "usa", "Federal", ...)
+# and costs ~1 KB each. The table keeps the static holidays as parallel columns
+# instead, in day-slot order (see the index below):
+#
+#   months, days       month/day of every row ("B" arrays)
+#   starts             367 row offsets: rows of slot s are starts[s]:starts[s + 1]
+#   names              every name in one UTF-8 blob; row i is names[name_ends[i - 1]:name_ends[i]]
+#   countries          interned string ids; row i is country_ids[country_ends[i - 1]:country_ends[i]]
+#   categories         same layout as countries
+#   sources            one string id per row
+#   strings            the interned strings (countries, categories and file names)
+#
+# Snapshot:
+# - The table is written to HOLIDAYS_SNAPSHOT_PATH and memory-mapped on the next
+#   start: header + JSON meta (string table, file stamp, section offsets), then the
+#   raw columns. Opening it parses no JSON holiday files and copies no column, so
+#   startup time and RSS stay flat as data grows (pages are read on demand and
+#   shared with the page cache).
+# - The snapshot records the stamp (path, mtime, size) of the files it was built
+#   from; a mismatch (or another format version / byte order) rebuilds it from JSON.
+# - It is replaced atomically (os.replace), so a table still mapping the old file
+#   keeps working until it is dropped.
+#
+# Rows are turned back into Holiday dicts only when a query returns them. Flags and
+# category emojis are resolved once per interned string when the table is created
+# (services/emoji_lookup.py), so records come with "country_flags" and
+# "category_emojis" lists parallel to their countries/categories.
+#
+SNAPSHOT_MAGIC = b"HOLIDX\x00\x00"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")  # magic, version, meta length
+_ALIGN = 8
+
+# Column name -> attribute, in file order.
+_COLUMNS = (
+    "months",
+    "days",
+    "starts",
+    "name_ends",
+    "country_ends",
+    "country_ids",
+    "category_ends",
+    "category_ids",
+    "source_ids",
+    "names",
+)
+
+
+def _tokens(value: object) -> List[str]:
+    """Countries/categories as a list of strings (a bare string counts as one)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [str(token) for token in value]
+
+
+class HolidayTable:
+    """Immutable columnar table of static holidays, in day-slot order."""
+
+    __slots__ = (*_COLUMNS, "strings", "flags", "emojis", "_buffer")
+
+    def __init__(self, columns: Dict[str, Sequence[int]], strings: Sequence[str], buffer=None) -> None:
+        for name in _COLUMNS:
+            setattr(self, name, columns[name])
+        self.strings: Tuple[str, ...] = tuple(strings)
+        # Flag / category emoji of every interned string, resolved once per load.
+        self.flags = tuple(country_flag(t) for t in self.strings)
+        self.emojis = tuple(category_emoji(t) for t in self.strings)
+        # Keeps the mapping of a snapshot-backed table alive.
+        self._buffer = buffer
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[int, int, Holiday]]) -> "HolidayTable":
+        """Build from (month, day, record) entries (`read_static_holidays`)."""
+        rows = sorted(entries, key=lambda e: day_slot(e[0], e[1]))  # stable: file order within a day
+
+        interned: Dict[str, int] = {}
+
+        def intern(text: str) -> int:
+            return interned.setdefault(text, len(interned))
+
+        months, days = array("B"), array("B")
+        name_ends, country_ends, category_ends = array("I"), array("I"), array("I")
+        country_ids, category_ids, source_ids = [], [], []
+        names = bytearray()
+        counts = [0] * (DAYS_IN_INDEX + 1)
+
+        for month, day, record in rows:
+            months.append(month)
+            days.append(day)
+            counts[day_slot(month, day) + 1] += 1
+
+            names += str(record["name"]).encode("utf-8")
+            name_ends.append(len(names))
+            country_ids.extend(intern(t) for t in _tokens(record.get("countries")))
+            country_ends.append(len(country_ids))
+            category_ids.extend(intern(t) for t in _tokens(record.get("categories")))
+            category_ends.append(len(category_ids))
+            source_ids.append(intern(str(record["source"])))
+
+        ids = "H" if len(interned) <= 0xFFFF else "I"
+        columns = {
+            "months": months,
+            "days": days,
+            "starts": array("I", accumulate(counts)),
+            "name_ends": name_ends,
+            "country_ends": country_ends,
+            "country_ids": array(ids, country_ids),
+            "category_ends": category_ends,
+            "category_ids": array(ids, category_ids),
+            "source_ids": array(ids, source_ids),
+            "names": bytes(names),
+        }
+        return cls(columns, list(interned))
+
+    # --------------------------------------------------
+    # Snapshot
+    # --------------------------------------------------
+    def save(self, path: Path, stamp: Stamp) -> None:
+        """Write the table to `path` atomically."""
+        sections = {}
+        offset = 0
+        for name in _COLUMNS:
+            column = memoryview(getattr(self, name))
+            sections[name] = (offset, column.nbytes, column.format)
+            offset += -(-column.nbytes // _ALIGN) * _ALIGN
+
+        meta = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "stamp": stamp,
+                "strings": self.strings,
+                "sections": sections,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        body_start = -(-(_HEADER.size + len(meta)) // _ALIGN) * _ALIGN
+
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(meta)))
+            f.write(meta)
+            for name in _COLUMNS:
+                section_offset, _, _ = sections[name]
+                f.seek(body_start + section_offset)
+                f.write(memoryview(getattr(self, name)).cast("B"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def open(cls, path: Path, stamp: Stamp) -> Optional["HolidayTable"]:
+        """Memory-map a snapshot; None if it is missing, stale or unreadable."""
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        view = memoryview(mapped)
+        try:
+            magic, version, meta_len = _HEADER.unpack_from(view)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return None
+            meta = json.loads(bytes(view[_HEADER.size:_HEADER.size + meta_len]))
+            if meta["byteorder"] != sys.byteorder or [tuple(s) for s in meta["stamp"]] != list(stamp):
+                return None
+
+            body_start = -(-(_HEADER.size + meta_len) // _ALIGN) * _ALIGN
+            columns = {}
+            for name in _COLUMNS:
+                offset, length, typecode = meta["sections"][name]
+                start = body_start + offset
+                if start + length > len(view):
+                    return None
+                columns[name] = view[start:start + length].cast(typecode)
+        except (struct.error, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable holiday snapshot %s", path)
+            return None
+
+        return cls(columns, meta["strings"], buffer=mapped)
+
+    # --------------------------------------------------
+    # Rows
+    # --------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def name(self, i: int) -> str:
+        start = self.name_ends[i - 1] if i else 0
+        return str(self.names[start:self.name_ends[i]], "utf-8")
+
+    def record(self, i: int) -> Holiday:
+        """Row `i` as a Holiday dict (without `parsed_date`)."""
+        strings = self.strings
+        countries = self.country_ids[(self.country_ends[i - 1] if i else 0):self.country_ends[i]]
+        categories = self.category_ids[(self.category_ends[i - 1] if i else 0):self.category_ends[i]]
+        return {
+            "name": self.name(i),
+            "date": f"{self.months[i]:02d}-{self.days[i]:02d}",
+            "countries": [strings[t] for t in countries],
+            "categories": [strings[t] for t in categories],
+            "country_flags": [self.flags[t] for t in countries],
+            "category_emojis": [self.emojis[t] for t in categories],
+            "source": strings[self.source_ids[i]],
+        }
+
+
+# ==================================================
+# Day-of-year index (static holidays)
+# ==================================================
+#
+# Static holidays recur on the same month/day every year, so they are indexed
+# once instead of being re-read, re-parsed and re-sorted on every call. The
+# table rows are sorted by day slot (366 slots of a leap year, "02-29" = slot 59):
+#
+# - "Today" is one bucket read (`starts[s]:starts[s + 1]`): O(k) for the k
+#   holidays of that day.
+# - "Next N" starts at the first row of today's slot and walks on, wrapping
+#   into next year.
+# - "02-29" holidays only occur in leap years (the slot is skipped otherwise).
+#
+# Records carry no `parsed_date` (it depends on "today"); the query helpers
+# below return copies with `parsed_date` filled in.
+#
+DAYS_IN_INDEX = 366
+
+# First slot of each month in a leap year (index 0 unused).
+_MONTH_START = (0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+_LEAP_DAY = 59
+
+
+def day_slot(month: int, day: int) -> int:
+    """Day slot of a month/day (leap-year numbering, 0-based)."""
+    return _MONTH_START[month] + day - 1
+
+
+class HolidayIndex:
+    """Immutable day-of-year index of static holidays (over a HolidayTable)."""
+
+    __slots__ = ("table", "sources")
+
+    def __init__(self, table: HolidayTable) -> None:
+        self.table = table
+        strings = table.strings
+        self.sources: FrozenSet[str] = frozenset(strings[i] for i in set(table.source_ids))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def on(self, day: date) -> Tuple[Holiday, ...]:
+        """Holidays falling on `day` (in file order)."""
+        table = self.table
+        slot = day_slot(day.month, day.day)
+        return tuple(table.record(i) for i in range(table.starts[slot], table.starts[slot + 1]))
+
+    def items(self) -> Iterator[Tuple[int, int, Holiday]]:
+        """(month, day, record) for every row, in day-slot order."""
+        table = self.table
+        for i in range(len(table)):
+            yield table.months[i], table.days[i], table.record(i)
+
+    def iter_from(self, today: date) -> Iterator[Tuple[date, Holiday]]:
+        """(date, record) pairs for the 12 months starting at `today`, in date order."""
+        table = self.table
+        months, days = table.months, table.days
+        n = len(table)
+        start = table.starts[day_slot(today.month, today.day)]
+        year = today.year
+        for i in range(n):
+            pos = start + i
+            if pos == n:
+                year += 1
+            if pos >= n:
+                pos -= n
+            month, day = months[pos], days[pos]
+            if month == 2 and day == 29 and not calendar.isleap(year):
+                continue
+            yield date(year, month, day), table.record(pos)
+
+
+def _holiday_files(path: Path = HOLIDAYS_PATH) -> List[str]:
+    return [str(p) for p in path.glob("*.json")]
+
+
+def load_holiday_index(
+    path: Path = HOLIDAYS_PATH,
+    snapshot: Path = HOLIDAYS_SNAPSHOT,
+) -> HolidayIndex:
+    """Map the snapshot if it matches the JSON files, otherwise rebuild (and rewrite) it."""
+    stamp = file_stamp(_holiday_files(path))
+    table = HolidayTable.open(snapshot, stamp)
+    if table is not None:
+        return HolidayIndex(table)
+
+    table = HolidayTable.build(read_static_holidays(path))
+    try:
+        table.save(snapshot, stamp)
+    except OSError:
+        logger.warning("Could not write holiday snapshot %s", snapshot, exc_info=True)
+    return HolidayIndex(table)
+
+
+# Hot-reloadable index of data/holidays (see core/datasets.py); adding a file counts as a change.
+HOLIDAYS = register_dataset("holidays", _holiday_files, load_holiday_index)
+
+
+def get_holiday_index() -> HolidayIndex:
+    """Return the current static holiday index (no I/O)."""
+    return HOLIDAYS.get()
+
+
+def _dated(holiday: Holiday, day: date) -> Holiday:
+    return dict(holiday, parsed_date=day)
+
+
+# ==================================================
+# Dynamic holidays (per-year tables)
+# ==================================================
+#
+# core/dynamic_holidays.py materializes the rules per year; the normalized
+# record of each occurrence (with flags/emojis resolved) is cached here too,
+# so a dynamic lookup is a cache hit plus a copy, like a static one. The cached
+# record keeps tuples; callers get fresh lists.
+#
+_LIST_FIELDS = ("countries", "categories", "country_flags", "category_emojis")
+
+
+@lru_cache(maxsize=YEARS_CACHED * len(RULES))
+def _dynamic_record(dynamic: DynamicHoliday) -> Holiday:
+    """Normalized record of one dynamic holiday occurrence (shared; do not mutate)."""
+    return {
+        "name": dynamic.name,
+        "date": f"{dynamic.day.month:02d}-{dynamic.day.day:02d}",
+        "parsed_date": dynamic.day,
+        "countries": tuple(dynamic.countries),
+        "categories": tuple(dynamic.categories),
+        "country_flags": tuple(country_flag(c) for c in dynamic.countries),
+        "category_emojis": tuple(category_emoji(c) for c in dynamic.categories),
+        "source": "dynamic",
+    }
+
+
+def _dynamic_holiday(dynamic: DynamicHoliday) -> Holiday:
+    """Caller-owned copy of a cached dynamic record (lists, like a static record)."""
+    record = _dynamic_record(dynamic)
+    return dict(record, **{field: list(record[field]) for field in _LIST_FIELDS})
+
+
+def _dynamic_from(today: date) -> List[Holiday]:
+    """Dynamic holidays of the 12 months starting at `today` (the window of `HolidayIndex.iter_from`)."""
+    return [_dynamic_holiday(h) for h in holidays_from(today)]
+
+
+def _dynamic_on(day: date) -> List[Holiday]:
+    return [_dynamic_holiday(h) for h in holidays_in_year(day.year) if h.day == day]
+
+
+# ==================================================
+# Public API
+# ==================================================
+def load_static_holidays(today: date) -> List[Holiday]:
+    """Static holidays dated at their next occurrence on or after `today` (index order)."""
+    index = get_holiday_index()
+    return [
+        _dated(record, next_occurrence(month, day, today))
+        for month, day, record in index.items()
+    ]
+
+
+def iter_upcoming_holidays(today: date | None = None) -> Iterator[Holiday]:
+    """Upcoming holidays (static + dynamic) in date order, starting with `today`.
+
+    Lazy: callers that only need the first few holidays stop early.
+    """
+    if today is None:
+        today = date.today()
+
+    static = (_dated(record, day) for day, record in get_holiday_index().iter_from(today))
+    return heapq.merge(static, _dynamic_from(today), key=lambda h: h["parsed_date"])
+
+
+def upcoming_holidays(today: date | None = None, limit: int = 10) -> List[Holiday]:
+    """The next `limit` holidays (static + dynamic), starting with `today`."""
+    return list(islice(iter_upcoming_holidays(today), limit))
+
+
+def holiday_sources() -> FrozenSet[str]:
+    """Every holiday source: one per static file, plus "dynamic"."""
+    return get_holiday_index().sources | {"dynamic"}
+
 
 # ==================================================
 # Combined holidays loader
 # ==================================================
 #
-# Loads and merges:
-# - static holidays (from JSON files)
-# - dynamic holidays (calculated at runtime)
+# Merges:
+# - static holidays (from the index)
+# - dynamic holidays (rules materialized for the 12 months starting at `today`)
 #
 # The result is a single, sorted list of holidays.
 #
@@ -113,28 +526,15 @@ def load_all_holidays(today: date | None = None) -> List[Holiday]:
         today = date.today()
 
     holidays = load_static_holidays(today)
-
-    # Append dynamically calculated holidays
-    for dynamic in get_dynamic_holidays():
-        holidays.append(
-            {
-                "name": dynamic["name"],
-                "date": dynamic["date"],
-                "parsed_date": datetime.strptime(
-                    dynamic["full_date"], "%Y-%m-%d"
-                ).date(),
-                "countries": dynamic.get("countries", []),
-                "categories": dynamic.get("categories", []),
-                "source": "dynamic",
-            }
-        )
+    holidays.extend(_dynamic_from(today))
 
     # Sort holidays chronologically
     holidays.sort(key=lambda h: h["parsed_date"])
     return holidays
 
+
 # ==================================================
-# Public API
+# Today's holidays
 # ==================================================
 #
 # Returns only holidays that occur on the given day.
@@ -144,7 +544,6 @@ def get_today_holidays(today: date | None = None) -> List[Holiday]:
     if today is None:
         today = date.today()
 
-    today_mmdd = today.strftime("%m-%d")
-    holidays = load_all_holidays(today)
-
-    return [h for h in holidays if h["date"] == today_mmdd]
\ No newline at end of file
+    holidays = [_dated(record, today) for record in get_holiday_index().on(today)]
+    holidays.extend(_dynamic_on(today))
+    return holidays
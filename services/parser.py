@@ -2,7 +2,7 @@
 # services/parser.py — Command Parsing Helpers
 # ==================================================
 #
-# Command-level parsing utilities shared by commands (e.g., /timerdate argument parsing).
+# Command-level parsing shared by commands (/timer and /timerdate argument parsing).
 #
 # Layer: Services
 #
@@ -11,6 +11,25 @@
 # - Keep formatting rules consistent across commands and daily jobs
 # - Provide stable functions consumed by commands/daily scripts
 #
+# Design:
+# - One compiled tokenizer (`_TOKEN_RE`) classifies every whitespace-separated token in
+#   a single `finditer` pass: flags, durations, numbers, unit words, dates, times,
+#   time-zone offsets/aliases, and plain words (the message tail).
+# - The grammar functions below walk the token list once; nothing is tried by raising
+#   and catching (dates/times are converted by core/dates.py, which rejects e.g. 31.02).
+# - Digits are ASCII only; every other failure is a ValueError, so commands can treat any
+#   ValueError as "show the usage hint".
+# - Flags (`--pin`, `--board`) are recognized anywhere in the command.
+#
+# Grammar:
+#   /timer     <duration...> [message...]
+#   /timerdate <date> <time> [tz] [message...]     (or <date>T<time>)
+#
+#   duration:  10m | 1h30m | 1h 30m | 10 min | 2 days | 10   (bare number = minutes)
+#   date:      YYYY-MM-DD | DD.MM.YYYY | DD-MM-YYYY
+#   time:      HH:MM | HH:MM:SS
+#   tz:        +3 | +03 | +03:00 | -5 | UTC | GMT | MSK | EET | CET | GET | TBI
+#
 # Boundaries:
 # - Services may use core utilities, but should avoid importing command modules.
 # - Services should not perform Telegram network calls directly (commands/daily own messaging).
@@ -20,20 +39,176 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta
-from typing import Tuple, Optional
-
-_DURATION_TOKEN_RE = re.compile(
-    r"(?P<num>\d+)\s*(?P<unit>d|day|days|h|hr|hrs|hour|hours|m|min|mins|minute|minutes|s|sec|secs|second|seconds)\b",
-    re.IGNORECASE,
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from core.dates import parse_datetime
+
+_UNITS = r"days?|d|hours?|hrs?|hr|h|minutes?|mins?|m|seconds?|secs?|s"
+
+_TOKEN_RE = re.compile(
+    rf"""
+    (?:
+        (?P<flag>--pin|--board)
+      | (?P<duration>(?:\d+(?:{_UNITS}))+)
+      | (?P<number>\d+)
+      | (?P<unit>{_UNITS})
+      | (?P<datetime>
+            (?:\d{{4}}-\d{{1,2}}-\d{{1,2}}|\d{{1,2}}[.-]\d{{1,2}}[.-]\d{{4}})
+            T\d{{1,2}}:\d{{2}}(?::\d{{2}})?
+        )
+      | (?P<date>\d{{4}}-\d{{1,2}}-\d{{1,2}}|\d{{1,2}}[.-]\d{{1,2}}[.-]\d{{4}})
+      | (?P<time>\d{{1,2}}:\d{{2}}(?::\d{{2}})?)
+      | (?P<offset>[+-]\d{{1,2}}(?::?\d{{2}})?)
+      | (?-i:(?P<tzname>UTC|GMT|MSK|EET|CET|GET|TBI))
+    )(?!\S)
+    | (?P<word>\S+)
+    """,
+    re.ASCII | re.IGNORECASE | re.VERBOSE,
 )
 
+_DURATION_PART_RE = re.compile(rf"(\d+)({_UNITS})", re.ASCII | re.IGNORECASE)
+
+# Longest accepted duration (10 years); keeps `timedelta` arithmetic in range.
+MAX_DURATION_SECONDS = 10 * 366 * 86400
+
+# Seconds per unit, keyed by the unit's first letter.
+_UNIT_SECONDS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+
+# Time-zone aliases (hours from UTC).
+_TZ_OFFSETS = {
+    "UTC": 0,
+    "GMT": 0,
+    "MSK": 3,
+    "EET": 2,
+    "CET": 1,
+    "GET": 4,  # Georgia (Tbilisi) Time
+    "TBI": 4,
+}
+
+
 @dataclass(frozen=True)
 class ParsedTimer:
     seconds: int
     message: str
+    pin: bool = False
+    board: bool = False
+
+
+@dataclass(frozen=True)
+class ParsedDateTimer:
+    target: datetime  # aware, UTC
+    message: str
+    pin: bool = False
+    board: bool = False
 
 
+# ==================================================
+# Tokenizer
+# ==================================================
+class _Tokens:
+    """Tokens of one command, with flags pulled out."""
+
+    __slots__ = ("text", "items", "flags", "last_flag_at")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.items: List[re.Match] = []
+        self.flags = set()
+        self.last_flag_at = -1
+        for m in _TOKEN_RE.finditer(text):
+            if m.lastgroup == "flag":
+                self.flags.add(m.group().lower())
+                self.last_flag_at = m.start()
+            else:
+                self.items.append(m)
+
+    def tail(self, i: int) -> str:
+        """Message text from token `i` on (original spacing kept unless a flag sits inside)."""
+        if i >= len(self.items):
+            return ""
+        start = self.items[i].start()
+        if self.last_flag_at < start:
+            return self.text[start:].strip()
+        return " ".join(m.group() for m in self.items[i:])
+
+
+def _duration_head(tokens: List[re.Match], i: int) -> Tuple[int, int]:
+    """Sum the duration tokens starting at `i`.
+
+    Returns:
+        (seconds, index of the first token after the duration)
+    """
+    total = 0
+    n = len(tokens)
+    while i < n:
+        m = tokens[i]
+        kind = m.lastgroup
+        if kind == "duration":
+            for num, unit in _DURATION_PART_RE.findall(m.group()):
+                total += int(num) * _UNIT_SECONDS[unit[0].lower()]
+            i += 1
+        elif kind == "number" and i + 1 < n and tokens[i + 1].lastgroup == "unit":
+            total += int(m.group()) * _UNIT_SECONDS[tokens[i + 1].group()[0].lower()]
+            i += 2
+        elif kind == "number" and total == 0:
+            # A bare number means minutes ("/timer 10 tea").
+            return int(m.group()) * 60, i + 1
+        else:
+            break
+    return total, i
+
+
+def _tz_of(m: re.Match) -> Optional[timezone]:
+    """Time zone of an offset/alias token (None for any other token)."""
+    kind = m.lastgroup
+    if kind == "tzname":
+        return timezone(timedelta(hours=_TZ_OFFSETS[m.group()]))
+    if kind != "offset":
+        return None
+
+    text = m.group()
+    digits = text[1:].replace(":", "")
+    if len(digits) <= 2:
+        hours, minutes = int(digits), 0
+    else:
+        hours, minutes = int(digits[:-2]), int(digits[-2:])
+    sign = -1 if text[0] == "-" else 1
+    return timezone(sign * timedelta(hours=hours, minutes=minutes))
+
+
+def _datetime_head(tokens: List[re.Match], i: int, assume_tz) -> Tuple[datetime, int]:
+    """Parse <date> <time> [tz] (or <date>T<time> [tz]) starting at `i`.
+
+    Returns:
+        (aware UTC datetime, index of the first token after it)
+    """
+    n = len(tokens)
+    if i < n and tokens[i].lastgroup == "datetime":
+        date_text, _, time_text = tokens[i].group().upper().partition("T")
+        i += 1
+    elif i + 1 < n and tokens[i].lastgroup == "date" and tokens[i + 1].lastgroup == "time":
+        date_text, time_text = tokens[i].group(), tokens[i + 1].group()
+        i += 2
+    else:
+        raise ValueError("Date/time is missing")
+
+    tz = _tz_of(tokens[i]) if i < n else None
+    if tz is not None:
+        i += 1
+    else:
+        tz = assume_tz
+
+    try:
+        return parse_datetime(date_text, time_text, tz).astimezone(timezone.utc), i
+    except OverflowError:
+        # Year 1 / 9999 pushed out of range by the offset.
+        raise ValueError("Date is out of range") from None
+
+
+# ==================================================
+# Public API
+# ==================================================
 def parse_duration(text: str) -> int:
     """
     Parses duration strings like:
@@ -41,52 +216,49 @@ def parse_duration(text: str) -> int:
       - "1h 30m"
       - "45s"
       - "2d 3h"
-      - "1h30m" (works because regex finds both tokens)
+      - "1h30m"
+      - "10 min"
 
     Returns: total seconds (int)
 
-    Raises: ValueError if nothing could be parsed or result <= 0
+    Raises: ValueError if nothing could be parsed, trailing text remains or result <= 0
     """
     if not text:
         raise ValueError("Empty duration")
 
-    s = text.strip().lower()
-
-    total = 0
-    for m in _DURATION_TOKEN_RE.finditer(s):
-        n = int(m.group("num"))
-        unit = m.group("unit").lower()
-
-        if unit in ("d", "day", "days"):
-            total += n * 24 * 60 * 60
-        elif unit in ("h", "hr", "hrs", "hour", "hours"):
-            total += n * 60 * 60
-        elif unit in ("m", "min", "mins", "minute", "minutes"):
-            total += n * 60
-        elif unit in ("s", "sec", "secs", "second", "seconds"):
-            total += n
-
-    if total <= 0:
+    tokens = _Tokens(text).items
+    total, end = _duration_head(tokens, 0)
+    if total <= 0 or end != len(tokens):
         raise ValueError("Invalid duration format")
-
+    if total > MAX_DURATION_SECONDS:
+        raise ValueError("Duration is too long")
     return total
 
 
 def parse_timer_args(full_text: str) -> ParsedTimer:
     """
-    full_text example: "/timer 10m take cookies out"
-    Returns ParsedTimer(seconds, message)
+    full_text example: "/timer 1h 30m take cookies out --pin"
+    Returns ParsedTimer(seconds, message, pin, board)
     """
     if not full_text:
         raise ValueError("Empty command text")
 
-    parts = full_text.split(maxsplit=2)
-    if len(parts) < 2:
+    tokens = _Tokens(full_text)
+    if len(tokens.items) < 2:
         raise ValueError("Duration is missing")
 
-    seconds = parse_duration(parts[1])
-    message = parts[2].strip() if len(parts) >= 3 else ""
-    return ParsedTimer(seconds=seconds, message=message)
+    seconds, end = _duration_head(tokens.items, 1)
+    if seconds <= 0:
+        raise ValueError("Invalid duration format")
+    if seconds > MAX_DURATION_SECONDS:
+        raise ValueError("Duration is too long")
+
+    return ParsedTimer(
+        seconds=seconds,
+        message=tokens.tail(end),
+        pin="--pin" in tokens.flags,
+        board="--board" in tokens.flags,
+    )
 
 
 def parse_datetime_utc(text: str, *, assume_tz=timezone.utc) -> datetime:
@@ -94,83 +266,43 @@ def parse_datetime_utc(text: str, *, assume_tz=timezone.utc) -> datetime:
     Parses a date/time string into an aware UTC datetime.
 
     Supported formats:
-      - "YYYY-MM-DD HH:MM"
-      - "YYYY-MM-DDTHH:MM"
-      - "YYYY-MM-DD HH:MM:SS"
-      - "YYYY-MM-DDTHH:MM:SS"
-
-    If the input is naive, we assume `assume_tz` then convert to UTC.
+      - "YYYY-MM-DD HH:MM[:SS]"
+      - "YYYY-MM-DDTHH:MM[:SS]"
+      - "DD.MM.YYYY HH:MM[:SS]"
+    optionally followed by a time-zone token; otherwise `assume_tz` is used.
     """
     if not text:
         raise ValueError("Empty datetime")
 
-    s = text.strip().replace("T", " ")
-
-    fmts = (
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d %H:%M:%S",
-        "%d.%m.%Y %H:%M",
-        "%d.%m.%Y %H:%M:%S",
-    )
-    dt: Optional[datetime] = None
-    for fmt in fmts:
-        try:
-            dt = datetime.strptime(s, fmt)
-            break
-        except ValueError:
-            continue
-
-    if dt is None:
+    tokens = _Tokens(text).items
+    dt, end = _datetime_head(tokens, 0, assume_tz)
+    if end != len(tokens):
         raise ValueError("Invalid datetime format")
+    return dt
 
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=assume_tz)
 
-    return dt.astimezone(timezone.utc)
-
-
-def parse_timerdate_args(full_text: str, *, assume_tz=timezone.utc) -> Tuple[datetime, str]:
+def parse_timerdate(full_text: str, *, assume_tz=timezone.utc) -> ParsedDateTimer:
     """
     full_text example:
-      "/timerdate 2025-12-31 23:59 New Year!"
-    Returns (target_time_utc, message)
+      "/timerdate 31.12.2025 23:59 +3 Happy New Year --pin"
+    Returns ParsedDateTimer(target_utc, message, pin, board)
 
     NOTE: We require both date and time.
     """
     if not full_text:
         raise ValueError("Empty command text")
 
-    # /timerdate <date> <time> [<tz>] [message...]
-    # date formats supported:
-    #   - YYYY-MM-DD
-    #   - DD.MM.YYYY
-    # tz formats supported:
-    #   - +3
-    #   - +03
-    #   - +03:00
-    #   - -5
-    parts = full_text.split()
-    if len(parts) < 3:
-        raise ValueError("Date/time is missing")
-
-    date_part = parts[1]
-    time_part = parts[2]
-
-    tz = assume_tz
-    msg_start = 3
-
-    # optional timezone offset token
-    if len(parts) >= 4:
-        m = re.fullmatch(r"([+-])(\d{1,2})(?::?(\d{2}))?", parts[3])
-        if m:
-            sign = -1 if m.group(1) == "-" else 1
-            hours = int(m.group(2))
-            minutes = int(m.group(3) or "0")
-            tz = timezone(sign * timedelta(hours=hours, minutes=minutes))
-            msg_start = 4
+    tokens = _Tokens(full_text)
+    target, end = _datetime_head(tokens.items, 1, assume_tz)
+    return ParsedDateTimer(
+        target=target,
+        message=tokens.tail(end),
+        pin="--pin" in tokens.flags,
+        board="--board" in tokens.flags,
+    )
 
-    dt_str = f"{date_part} {time_part}"
-    target = parse_datetime_utc(dt_str, assume_tz=tz)
 
-    message = " ".join(parts[msg_start:]).strip() if len(parts) > msg_start else ""
-    return target, message
\ No newline at end of file
+def parse_timerdate_args(full_text: str, *, assume_tz=timezone.utc) -> Tuple[datetime, str]:
+    """Compatibility wrapper: (target_time_utc, message) of a /timerdate command."""
+    parsed = parse_timerdate(full_text, assume_tz=assume_tz)
+    return parsed.target, parsed.message
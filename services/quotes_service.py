@@ -19,6 +19,9 @@
 import random
 import logging
 
+from core.datasets import register_dataset
+from core.settings import QUOTES_FILE
+
 logger = logging.getLogger(__name__)
 
 # ==================================================
@@ -44,6 +47,19 @@ def load_quotes(path: str) -> list[str]:
         logger.warning("%s not found, quotes feature disabled", path)
         return []
 
+# ==================================================
+# Dataset
+# ==================================================
+#
+# Hot-reloadable snapshot of QUOTES_FILE (see core/datasets.py).
+#
+QUOTES = register_dataset("quotes", lambda: [QUOTES_FILE], lambda: load_quotes(QUOTES_FILE))
+
+
+def get_quotes() -> list[str]:
+    """Current quotes snapshot (no I/O)."""
+    return QUOTES.get()
+
 # ==================================================
 # Quote selection
 # ==================================================